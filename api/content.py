@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from storage.adapter import StorageAdapter
+
+
+STREAM_CHUNK_BYTES = 256 * 1024
+
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_CONTROL_REVALIDATE = "public, max-age=0, must-revalidate"
+
+
+def _iter_file(fh: BinaryIO, remaining: Optional[int] = None) -> Iterator[bytes]:
+    try:
+        while remaining is None or remaining > 0:
+            size = STREAM_CHUNK_BYTES if remaining is None else min(STREAM_CHUNK_BYTES, remaining)
+            chunk = fh.read(size)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        fh.close()
+
+
+def strong_etag(content_sha256: Optional[str]) -> Optional[str]:
+    if not isinstance(content_sha256, str) or not content_sha256.strip():
+        return None
+    return f'"{content_sha256}"'
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if header is None:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _single_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    units, _, spec = header.partition("=")
+    if units.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else max(size - 1, start)
+        else:
+            start = max(size - int(end_str), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start < 0 or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def storage_content_response(
+    request: Request,
+    storage: StorageAdapter,
+    key: str,
+    media_type: str,
+    content_sha256: Optional[str] = None,
+    byte_size: Optional[int] = None,
+    immutable: bool = True,
+) -> Response:
+    headers: Dict[str, str] = {
+        "accept-ranges": "bytes",
+        "cache-control": CACHE_CONTROL_IMMUTABLE if immutable else CACHE_CONTROL_REVALIDATE,
+    }
+    etag = strong_etag(content_sha256)
+    if etag is not None:
+        headers["etag"] = etag
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            if not storage.exists(key):
+                raise FileNotFoundError(key)
+            return Response(status_code=304, headers=headers)
+
+    path = storage.local_path(key)
+    if path is not None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    use_range = range_header is not None and byte_size is not None and (if_range is None or if_range == etag)
+    if use_range and byte_size > 0:
+        span = _single_range(range_header, byte_size)
+        if span is not None and span[0] >= byte_size:
+            return Response(status_code=416, headers={"content-range": f"bytes */{byte_size}"})
+        if span is not None:
+            start, end = span
+            fh = storage.open_read(key)
+            fh.seek(start)
+            headers["content-range"] = f"bytes {start}-{end}/{byte_size}"
+            headers["content-length"] = str(end - start + 1)
+            return StreamingResponse(
+                _iter_file(fh, end - start + 1),
+                status_code=206,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    if byte_size is not None:
+        headers["content-length"] = str(byte_size)
+    return StreamingResponse(_iter_file(storage.open_read(key)), media_type=media_type, headers=headers)
\ No newline at end of file
@@ -1,24 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 
+from api.routes.admin import router as admin_router
 from api.routes.artifacts import router as artifacts_router
 from api.routes.documents import router as documents_router
 from api.routes.jobs import router as jobs_router
-from core.capability_registry import build_registry
+from core.capability_registry import CachedCapabilityRegistry, shared_registry
 from core.execution_policy import ExecutionPolicy
 from core.errors import ErrorCode
 from core.ids import HybridDocumentIdStrategy
 from core.ordering import sort_dict
+from core.resolver_cache import shared_resolver_cache
 from services.artifact_service import ArtifactService
 from services.document_service import DocumentService
+from services.job_queue import JobQueue
+from services.process_backend import ProcessPoolBackend
+from services.job_result_cache import JobResultCache
 from services.job_service import JobService
+from services.single_flight import FileLockSingleFlight, SingleFlight
+from storage.cas import BlobStore
+from storage.catalog import Catalog, InMemoryCatalog
 from storage.local_fs import LocalFSStorage
+from storage.sqlite_catalog import CATALOG_DIR, CATALOG_FILENAME, SQLiteCatalog
 
+from execution.page_pool import shared_page_pool
+from execution.provider_signature import make_provider_signature
+from execution.pdf.canonicalize import make_deferred_canonicalizer
+from execution.pdf.canonicalize_cache import CanonicalizeCache
+from execution.pdf.document_cache import shared_document_cache
 from execution.pdf.preview import make_pdf_preview_execution
+from execution.pdf.preview_batch import make_pdf_preview_batch_execution
+from execution.pdf.render_cache import RenderCache
 from execution.pdf.merge import make_pdf_merge_execution
 from execution.pdf.reorder import make_pdf_reorder_execution
 from execution.pdf.remove import make_pdf_remove_execution
@@ -29,6 +46,22 @@ from execution.tables.export_jsonl import make_tables_export_jsonl_execution
 from execution.tables.export_zip import make_tables_export_zip_execution
 
 
+def shutdown_app(app: FastAPI) -> None:
+    app.state.job_queue.shutdown(wait=True)
+    job_shutdown = getattr(app.state.job_service, "shutdown", None)
+    if job_shutdown is not None:
+        job_shutdown(wait=True)
+    if app.state.process_backend is not None:
+        app.state.process_backend.shutdown(wait=True)
+    shared_page_pool().shutdown(wait=True)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    shutdown_app(app)
+
+
 def _canonical_error_response(code: str, message: str, details: Optional[Dict[str, Any]], status: int):
     payload = {
         "code": code,
@@ -45,58 +78,114 @@ def create_app(
     document_service: Optional[DocumentService] = None,
     artifact_service: Optional[ArtifactService] = None,
     job_service: Optional[JobService] = None,
+    capability_ttl_seconds: Optional[float] = None,
+    job_workers: int = 4,
+    job_queue_depth: int = 64,
+    process_workers: Optional[int] = None,
+    catalog: Optional[Catalog] = None,
 ) -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=_lifespan)
 
     st = storage if storage is not None else LocalFSStorage("workspace")
-    reg = registry if registry is not None else build_registry()
+    if registry is not None:
+        reg = registry
+    elif capability_ttl_seconds is not None:
+        reg = CachedCapabilityRegistry(ttl_seconds=capability_ttl_seconds)
+    else:
+        reg = shared_registry()
     pol = policy if policy is not None else ExecutionPolicy(reg)
 
+    if catalog is not None:
+        cat = catalog
+    elif isinstance(st, LocalFSStorage):
+        cat = SQLiteCatalog(st.root_dir / CATALOG_DIR / CATALOG_FILENAME)
+    else:
+        cat = InMemoryCatalog()
+    blobs = BlobStore(st, cat)
+
     docs = document_service if document_service is not None else DocumentService(
         storage=st,
         id_strategy=HybridDocumentIdStrategy(),
         policy=pol,
         session_namespace="default_session",
+        catalog=cat,
+        blob_store=blobs,
     )
 
     arts = artifact_service if artifact_service is not None else ArtifactService(
         storage=st,
         policy=pol,
+        catalog=cat,
+        blob_store=blobs,
     )
 
+    renders = RenderCache(st)
+    canonical = CanonicalizeCache(st)
+
     def _noop_exec(payload: Dict[str, Any]):
         return b"", {"kind": "bin", "media_type": "application/octet-stream", "manifest": {}}
 
     execution_map: Dict[str, Any] = {
         "noop": _noop_exec,
-        "pdf.preview": make_pdf_preview_execution(docs),
-        "pdf.merge": make_pdf_merge_execution(docs),
-        "pdf.reorder": make_pdf_reorder_execution(docs),
-        "pdf.remove": make_pdf_remove_execution(docs),
-        "pdf.extract": make_pdf_extract_execution(docs),
-        "tables.detect": make_tables_detect_execution(docs),
+        "pdf.preview": make_pdf_preview_execution(docs, registry=reg, render_cache=renders),
+        "pdf.preview.batch": make_pdf_preview_batch_execution(docs, registry=reg, render_cache=renders),
+        "pdf.merge": make_pdf_merge_execution(docs, registry=reg, canonicalize_cache=canonical),
+        "pdf.reorder": make_pdf_reorder_execution(docs, registry=reg, canonicalize_cache=canonical),
+        "pdf.remove": make_pdf_remove_execution(docs, registry=reg, canonicalize_cache=canonical),
+        "pdf.extract": make_pdf_extract_execution(docs, registry=reg, canonicalize_cache=canonical),
+        "tables.detect": make_tables_detect_execution(docs, registry=reg),
         "tables.export.csv": make_tables_export_csv_execution(),
         "tables.export.jsonl": make_tables_export_jsonl_execution(),
         "tables.export.zip": make_tables_export_zip_execution(),
     }
 
+    single_flight: SingleFlight
+    if isinstance(st, LocalFSStorage):
+        try:
+            single_flight = FileLockSingleFlight(st.root_dir)
+        except RuntimeError:
+            single_flight = SingleFlight()
+    else:
+        single_flight = SingleFlight()
+
+    backend = None
+    if process_workers is not None and isinstance(st, LocalFSStorage):
+        backend = ProcessPoolBackend(docs, max_workers=process_workers, registry=reg)
+        backend.warm()
+
     jobs = job_service if job_service is not None else JobService(
         policy=pol,
         documents=docs,
         artifacts=arts,
         execution_map=execution_map,
+        result_cache=JobResultCache(st, catalog=cat),
+        provider_signature=make_provider_signature(reg),
+        single_flight=single_flight,
+        backend=backend,
+        deferred_canonicalizer=make_deferred_canonicalizer(registry=reg, cache=canonical),
     )
 
+    job_queue = JobQueue(jobs, workers=job_workers, max_depth=job_queue_depth)
+
     app.state.storage = st
     app.state.registry = reg
+    app.state.catalog = cat
+    app.state.blob_store = blobs
+    app.state.render_cache = renders
+    app.state.canonicalize_cache = canonical
+    app.state.resolver_cache = shared_resolver_cache()
+    app.state.document_cache = shared_document_cache()
     app.state.policy = pol
     app.state.document_service = docs
     app.state.artifact_service = arts
     app.state.job_service = jobs
+    app.state.job_queue = job_queue
+    app.state.process_backend = backend
 
     app.include_router(documents_router)
     app.include_router(jobs_router)
     app.include_router(artifacts_router)
+    app.include_router(admin_router)
 
     @app.get("/health")
     def health():
@@ -105,6 +194,10 @@ def create_app(
             "ok": True,
             "schema_version": "v1",
             "capabilities": report.get("capabilities"),
+            "canonicalize_cache": app.state.canonicalize_cache.stats(),
+            "document_cache": app.state.document_cache.stats(),
+            "job_queue": app.state.job_queue.stats(),
+            "resolver_cache": app.state.resolver_cache.stats(),
         }
         return sort_dict(payload)
 
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Request
+
+from core.errors import ErrorCode
+from core.ordering import sort_dict
+
+
+router = APIRouter(tags=["admin"])
+
+
+@router.post("/admin/capabilities/refresh")
+def refresh_capabilities(request: Request):
+    registry = request.app.state.registry
+
+    if not hasattr(registry, "refresh"):
+        raise HTTPException(
+            status_code=409,
+            detail=sort_dict(
+                {
+                    "code": ErrorCode.INVALID_STATE.value,
+                    "message": "capability registry is static",
+                    "details": None,
+                }
+            ),
+        )
+
+    registry.refresh()
+
+    payload = {
+        "capabilities": registry.report().to_dict().get("capabilities"),
+        "generation": registry.generation,
+        "ok": True,
+    }
+    return sort_dict(payload)
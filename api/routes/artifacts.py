@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import Response
 
+from api.content import storage_content_response
 from core.errors import ErrorCode
 from core.ordering import sort_dict
 
@@ -40,8 +40,18 @@ def get_artifact(request: Request, artifact_id: str):
             ),
         )
 
+    media_type = record.media_type if record.media_type else "application/octet-stream"
+
     try:
-        data = storage.get_bytes(record.storage_key)
+        return storage_content_response(
+            request,
+            storage,
+            record.storage_key,
+            media_type,
+            content_sha256=record.content_sha256,
+            byte_size=record.byte_size,
+            immutable=False,
+        )
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -52,8 +62,4 @@ def get_artifact(request: Request, artifact_id: str):
                     "details": {"artifact_id": artifact_id},
                 }
             ),
-        )
-
-    media_type = record.media_type if record.media_type else "application/octet-stream"
-
-    return Response(content=data, media_type=media_type)
\ No newline at end of file
+        )
\ No newline at end of file
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, File, HTTPException, Request, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
+from api.content import storage_content_response
+from api.uploads import UPLOAD_OPENAPI, MultipartUpload
 from api.schemas.document_schemas import DocumentResponse
 from core.errors import ErrorCode, failure
 from services.document_service import DocumentService
@@ -12,53 +14,94 @@ from services.document_service import DocumentService
 
 router = APIRouter(tags=["documents"])
 
-MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+MAX_UPLOAD_BYTES = 512 * 1024 * 1024
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+MAX_PAGE_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 def _svc(request: Request) -> DocumentService:
     return request.app.state.document_service
 
 
+def _parse_cursor(after: str) -> Tuple[int, str]:
+    index_str, sep, document_id = after.partition(":")
+    if not sep or not index_str.isdigit() or not document_id:
+        raise ValueError("after must have the form '<ingest_index>:<document_id>'")
+    return (int(index_str), document_id)
+
+
+def _format_cursor(ingest_index: int, document_id: str) -> str:
+    return f"{ingest_index}:{document_id}"
+
+
 def _raise(code: ErrorCode, message: str, details: Optional[Dict[str, Any]], status: int):
     f = failure(code, message, details)
     raise HTTPException(status_code=status, detail=f.to_dict())
 
 
-@router.post("/documents/upload", response_model=DocumentResponse)
-@router.post("/workspaces/{workspace_id}/documents/upload", response_model=DocumentResponse)
-async def upload_document(request: Request, file: UploadFile = File(...), workspace_id: str = "default"):
-    raw = await file.read()
-    if len(raw) > MAX_UPLOAD_BYTES:
-        _raise(
-            ErrorCode.VALIDATION_ERROR,
-            "upload size limit exceeded",
-            {"max_upload_bytes": MAX_UPLOAD_BYTES, "workspace_id": workspace_id},
-            400,
-        )
+@router.post("/documents/upload", response_model=DocumentResponse, openapi_extra=UPLOAD_OPENAPI)
+@router.post(
+    "/workspaces/{workspace_id}/documents/upload",
+    response_model=DocumentResponse,
+    openapi_extra=UPLOAD_OPENAPI,
+)
+async def upload_document(request: Request, workspace_id: str = "default"):
+    details = {"max_upload_bytes": MAX_UPLOAD_BYTES, "workspace_id": workspace_id}
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES:
+        _raise(ErrorCode.VALIDATION_ERROR, "upload size limit exceeded", details, 400)
 
-    filename = file.filename or ""
-    media_type = file.content_type or "application/octet-stream"
+    svc = _svc(request)
+    # The file part is parsed off the request body straight into a storage
+    # spool, so the upload touches disk once instead of going through
+    # Starlette's temporary UploadFile first.
+    spool = svc.storage.open_spool()
+    try:
+        upload = MultipartUpload(request.headers.get("content-type", ""), spool, max_bytes=MAX_UPLOAD_BYTES)
+        async for chunk in request.stream():
+            await run_in_threadpool(upload.feed, chunk)
+        upload.finish()
+    except ValueError as e:
+        spool.discard()
+        _raise(ErrorCode.VALIDATION_ERROR, str(e), details, 400)
+    except BaseException:
+        spool.discard()
+        raise
 
     try:
-        doc = _svc(request).ingest(
-            data=raw,
+        doc = await run_in_threadpool(
+            svc.ingest_spool,
+            spool=spool,
             ingest_index=0,
-            filename=filename,
-            media_type=media_type,
+            filename=upload.filename,
+            media_type=upload.media_type,
             metadata={"workspace_id": workspace_id},
         )
     except ValueError as e:
-        _raise(ErrorCode.VALIDATION_ERROR, str(e), {"workspace_id": workspace_id}, 400)
+        _raise(ErrorCode.VALIDATION_ERROR, str(e), details, 400)
 
     return DocumentResponse.from_domain(doc)
 
 
 @router.get("/documents", response_model=List[DocumentResponse])
 @router.get("/workspaces/{workspace_id}/documents", response_model=List[DocumentResponse])
-def list_documents(request: Request, workspace_id: str = "default"):
-    docs = _svc(request).list_documents()
-    filtered = [d for d in docs if d.metadata.get("workspace_id") == workspace_id]
-    return [DocumentResponse.from_domain(d) for d in filtered]
+def list_documents(
+    request: Request,
+    response: Response,
+    workspace_id: str = "default",
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    after: Optional[str] = None,
+):
+    try:
+        cursor = _parse_cursor(after) if after is not None else None
+        docs = _svc(request).list_workspace_documents(workspace_id, after=cursor, limit=limit)
+    except ValueError as e:
+        _raise(ErrorCode.VALIDATION_ERROR, str(e), {"workspace_id": workspace_id}, 400)
+
+    if limit is not None and len(docs) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = _format_cursor(docs[-1].ingest_index, docs[-1].document_id)
+    return [DocumentResponse.from_domain(d) for d in docs]
 
 
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
@@ -91,11 +134,15 @@ def get_document_content(request: Request, document_id: str, workspace_id: str =
     if doc.metadata.get("workspace_id") != workspace_id:
         _raise(ErrorCode.NOT_FOUND, "document not found", {"document_id": document_id}, 404)
 
-    storage = svc.storage
+    media_type = doc.media_type or "application/octet-stream"
     try:
-        data = storage.get_bytes(doc.storage_key)
+        return storage_content_response(
+            request,
+            svc.storage,
+            doc.storage_key,
+            media_type,
+            content_sha256=doc.content_sha256,
+            byte_size=doc.byte_size,
+        )
     except FileNotFoundError:
-        _raise(ErrorCode.NOT_FOUND, "document storage missing", {"document_id": document_id}, 404)
-
-    media_type = doc.media_type or "application/octet-stream"
-    return Response(content=data, media_type=media_type)
\ No newline at end of file
+        _raise(ErrorCode.NOT_FOUND, "document storage missing", {"document_id": document_id}, 404)
\ No newline at end of file
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
 
-from core.errors import ErrorCode
+from core.errors import ErrorCode, JobQueueFullError
 from core.ordering import sort_dict
 from domain.job import JobStatus
 from execution.validation.validators import validate_operation_params
@@ -12,11 +13,10 @@ from execution.validation.validators import validate_operation_params
 
 router = APIRouter()
 
+MAX_WAIT_SECONDS = 60.0
 
-@router.post("/jobs/execute")
-def execute_job(request: Request, payload: Dict[str, Any]):
-    job_service = request.app.state.job_service
 
+def _validate(payload: Dict[str, Any]):
     operation = payload.get("operation")
     input_ref = payload.get("input_ref", {})
     params = payload.get("params", {})
@@ -35,6 +35,28 @@ def execute_job(request: Request, payload: Dict[str, Any]):
             ),
         )
 
+    return operation, input_ref, params
+
+
+def _job_not_found(job_id: str):
+    raise HTTPException(
+        status_code=404,
+        detail=sort_dict(
+            {
+                "code": ErrorCode.NOT_FOUND.value,
+                "message": "job not found",
+                "details": {"job_id": job_id},
+            }
+        ),
+    )
+
+
+@router.post("/jobs/execute")
+def execute_job(request: Request, payload: Dict[str, Any]):
+    job_service = request.app.state.job_service
+
+    operation, input_ref, params = _validate(payload)
+
     record = job_service.execute(
         operation=operation,
         input_ref=input_ref,
@@ -49,4 +71,50 @@ def execute_job(request: Request, payload: Dict[str, Any]):
         }
         raise HTTPException(status_code=400, detail=sort_dict(failure_payload))
 
+    return sort_dict(record.to_dict())
+
+
+@router.post("/jobs/submit", status_code=202)
+def submit_job(request: Request, payload: Dict[str, Any]):
+    job_queue = request.app.state.job_queue
+
+    operation, input_ref, params = _validate(payload)
+
+    try:
+        record = job_queue.submit(
+            operation=operation,
+            input_ref=input_ref,
+            params=params,
+        )
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=e.failure.to_dict())
+
+    return JSONResponse(status_code=202, content=sort_dict(record.to_dict()))
+
+
+@router.get("/jobs/{job_id}")
+def get_job(request: Request, job_id: str):
+    job_queue = request.app.state.job_queue
+
+    try:
+        record = job_queue.get(job_id)
+    except (KeyError, ValueError):
+        _job_not_found(job_id)
+
+    return sort_dict(record.to_dict())
+
+
+@router.get("/jobs/{job_id}/wait")
+def wait_job(request: Request, job_id: str, timeout: Optional[float] = 30.0):
+    job_queue = request.app.state.job_queue
+
+    if timeout is None or timeout < 0:
+        timeout = 0.0
+    timeout = min(float(timeout), MAX_WAIT_SECONDS)
+
+    try:
+        record = job_queue.wait(job_id, timeout=timeout)
+    except (KeyError, ValueError):
+        _job_not_found(job_id)
+
     return sort_dict(record.to_dict())
\ No newline at end of file
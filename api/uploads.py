@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from storage.adapter import Spool
+
+
+UPLOAD_FIELD = "file"
+
+UPLOAD_OPENAPI: Dict[str, object] = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": [UPLOAD_FIELD],
+                    "properties": {UPLOAD_FIELD: {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+class MultipartUpload:
+    def __init__(self, content_type: str, spool: Spool, field: str = UPLOAD_FIELD, max_bytes: Optional[int] = None):
+        ctype, options = parse_options_header(content_type or "")
+        boundary = options.get(b"boundary")
+        if ctype != b"multipart/form-data" or not boundary:
+            raise ValueError("upload must be multipart/form-data with a boundary")
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 0):
+            raise ValueError("max_bytes must be a non-negative int if provided")
+        self._spool = spool
+        self._field = field
+        self._max_bytes = max_bytes
+        self._headers: List[Tuple[bytes, bytes]] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._active = False
+        self._found = False
+        self._complete = False
+        self.filename = ""
+        self.media_type = "application/octet-stream"
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    def feed(self, chunk: bytes) -> None:
+        if chunk:
+            self._parser.write(chunk)
+
+    def finish(self) -> None:
+        self._parser.finalize()
+        if not self._complete:
+            raise ValueError(f"multipart field '{self._field}' is required")
+
+    def _on_part_begin(self) -> None:
+        self._headers = []
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers.append((self._header_field.lower(), self._header_value))
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        headers = dict(self._headers)
+        _, disposition = parse_options_header(headers.get(b"content-disposition", b""))
+        if self._found or disposition.get(b"name", b"").decode("utf-8", "replace") != self._field:
+            return
+        self._active = True
+        self._found = True
+        self.filename = disposition.get(b"filename", b"").decode("utf-8", "replace")
+        media_type = headers.get(b"content-type", b"").decode("latin-1").strip()
+        if media_type:
+            self.media_type = media_type
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self._active:
+            return
+        self._spool.write(data[start:end])
+        if self._max_bytes is not None and self._spool.size > self._max_bytes:
+            raise ValueError("upload size limit exceeded")
+
+    def _on_part_end(self) -> None:
+        if self._active:
+            self._active = False
+            self._complete = True
\ No newline at end of file
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import importlib
+import importlib.util
 import shutil
-from typing import Dict
+import threading
+import time
+from typing import Dict, Optional, Union
 
 from core.capability_contract import Capability, CapabilityStatus
 from core.capability_report import CapabilityReport
@@ -12,9 +14,8 @@ def _probe_import(module_name: str) -> bool:
     if not isinstance(module_name, str) or not module_name.strip():
         raise ValueError("module_name must be a non-empty string")
     try:
-        importlib.import_module(module_name)
-        return True
-    except ImportError:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
         return False
 
 
@@ -46,6 +47,9 @@ class CapabilityRegistry:
     def to_dict(self) -> Dict[str, object]:
         return self.report().to_dict()
 
+    def snapshot(self) -> "CapabilityRegistry":
+        return self
+
 
 def build_registry() -> CapabilityRegistry:
     caps: Dict[str, Capability] = {}
@@ -115,4 +119,93 @@ def build_registry() -> CapabilityRegistry:
         providers=["pikepdf"] if pikepdf_ok else [],
     )
 
-    return CapabilityRegistry(caps)
\ No newline at end of file
+    pillow_ok = _probe_import("PIL")
+    caps["image_encoder.pillow"] = Capability(
+        name="image_encoder.pillow",
+        status=CapabilityStatus.AVAILABLE if pillow_ok else CapabilityStatus.DEGRADED,
+        providers=["pillow"] if pillow_ok else [],
+    )
+
+    return CapabilityRegistry(caps)
+
+
+DEFAULT_CAPABILITY_TTL_SECONDS = 300.0
+
+
+class CachedCapabilityRegistry:
+    def __init__(self, ttl_seconds: Optional[float] = DEFAULT_CAPABILITY_TTL_SECONDS, builder=build_registry):
+        if ttl_seconds is not None and (not isinstance(ttl_seconds, (int, float)) or ttl_seconds <= 0):
+            raise ValueError("ttl_seconds must be a positive number or None")
+        self._ttl_seconds = float(ttl_seconds) if ttl_seconds is not None else None
+        self._builder = builder
+        self._lock = threading.Lock()
+        self._registry: CapabilityRegistry = builder()
+        self._built_at = time.monotonic()
+        self._generation = 1
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _expired(self) -> bool:
+        if self._ttl_seconds is None:
+            return False
+        return (time.monotonic() - self._built_at) >= self._ttl_seconds
+
+    def snapshot(self) -> CapabilityRegistry:
+        if self._expired():
+            with self._lock:
+                if self._expired():
+                    self._swap(self._builder())
+        return self._registry
+
+    def refresh(self) -> CapabilityRegistry:
+        registry = self._builder()
+        with self._lock:
+            self._swap(registry)
+        return registry
+
+    def _swap(self, registry: CapabilityRegistry) -> None:
+        self._registry = registry
+        self._built_at = time.monotonic()
+        self._generation += 1
+
+    def get(self, name: str) -> Capability:
+        return self.snapshot().get(name)
+
+    def all(self) -> Dict[str, Capability]:
+        return self.snapshot().all()
+
+    def report(self) -> CapabilityReport:
+        return self.snapshot().report()
+
+    def to_dict(self) -> Dict[str, object]:
+        return self.snapshot().to_dict()
+
+
+RegistryLike = Union[CapabilityRegistry, CachedCapabilityRegistry]
+
+
+_shared_lock = threading.Lock()
+_shared_registry: Optional[CachedCapabilityRegistry] = None
+
+
+def shared_registry() -> CachedCapabilityRegistry:
+    global _shared_registry
+    if _shared_registry is None:
+        with _shared_lock:
+            if _shared_registry is None:
+                _shared_registry = CachedCapabilityRegistry()
+    return _shared_registry
+
+
+def is_available(registry: RegistryLike, name: str) -> bool:
+    try:
+        cap = registry.get(name)
+    except KeyError:
+        return False
+    return cap.status == CapabilityStatus.AVAILABLE
\ No newline at end of file
@@ -11,6 +11,7 @@ class ErrorCode(str, Enum):
     INVALID_STATE = "INVALID_STATE"
     UNKNOWN_OPERATION = "UNKNOWN_OPERATION"
     CAPABILITY_UNAVAILABLE = "CAPABILITY_UNAVAILABLE"
+    QUEUE_FULL = "QUEUE_FULL"
     INTERNAL_ERROR = "INTERNAL_ERROR"
 
 
@@ -64,4 +65,16 @@ class StorageError(Exception):
 
 
 class StorageCollisionError(StorageError):
+    pass
+
+
+class JobQueueError(Exception):
+    def __init__(self, failure_obj: Failure):
+        if not isinstance(failure_obj, Failure):
+            raise ValueError("failure_obj must be Failure")
+        super().__init__(failure_obj.message)
+        self.failure: Failure = failure_obj
+
+
+class JobQueueFullError(JobQueueError):
     pass
\ No newline at end of file
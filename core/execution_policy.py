@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from core.capability_contract import CapabilityStatus
-from core.capability_registry import CapabilityRegistry
+from core.capability_registry import RegistryLike
 from core.errors import ErrorCode, Failure, failure
 
 
@@ -23,7 +23,7 @@ class ProviderResolution:
 
 
 class ExecutionPolicy:
-    def __init__(self, registry: CapabilityRegistry):
+    def __init__(self, registry: RegistryLike):
         self._registry = registry
 
     def require(self, capability_name: str) -> Decision:
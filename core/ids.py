@@ -9,7 +9,7 @@ from typing import Any, Dict
 def sha256_hex(data: bytes) -> str:
     if not isinstance(data, (bytes, bytearray)):
         raise ValueError("data must be bytes")
-    return hashlib.sha256(bytes(data)).hexdigest()
+    return hashlib.sha256(data).hexdigest()
 
 
 def _canonical_json(obj: Any) -> bytes:
@@ -34,22 +34,21 @@ class HybridDocumentIdStrategy(DocumentIdStrategy):
         return "hybrid_v1"
 
 
-def document_identity_from_bytes(
-    data: bytes,
+def document_identity_from_digest(
+    content_sha256: str,
     strategy: DocumentIdStrategy,
     session_namespace: str,
     ingest_index: int,
 ) -> DocumentIdentity:
-    if not isinstance(data, (bytes, bytearray)):
-        raise ValueError("data must be bytes")
+    if not isinstance(content_sha256, str) or len(content_sha256) != 64:
+        raise ValueError("content_sha256 must be a sha256 hex digest")
     if not isinstance(session_namespace, str) or not session_namespace.strip():
         raise ValueError("session_namespace must be non-empty string")
     if not isinstance(ingest_index, int) or ingest_index < 0:
         raise ValueError("ingest_index must be non-negative int")
 
-    content_hash = sha256_hex(bytes(data))
     basis = {
-        "content_sha256": content_hash,
+        "content_sha256": content_sha256,
         "ingest_index": ingest_index,
         "session_namespace": session_namespace,
         "strategy": strategy.name(),
@@ -57,25 +56,51 @@ def document_identity_from_bytes(
     doc_id = sha256_hex(_canonical_json(basis))
     return DocumentIdentity(
         document_id=doc_id,
-        content_sha256=content_hash,
+        content_sha256=content_sha256,
         strategy=strategy.name(),
         ingest_index=ingest_index,
     )
 
 
-def make_artifact_id(kind: str, input_ref: Dict[str, Any], params: Dict[str, Any]) -> str:
+def document_identity_from_bytes(
+    data: bytes,
+    strategy: DocumentIdStrategy,
+    session_namespace: str,
+    ingest_index: int,
+) -> DocumentIdentity:
+    if not isinstance(data, (bytes, bytearray)):
+        raise ValueError("data must be bytes")
+
+    return document_identity_from_digest(
+        content_sha256=sha256_hex(data),
+        strategy=strategy,
+        session_namespace=session_namespace,
+        ingest_index=ingest_index,
+    )
+
+
+def make_artifact_id(
+    kind: str,
+    input_ref: Dict[str, Any],
+    params: Dict[str, Any],
+    operation: str = "",
+) -> str:
     if not isinstance(kind, str) or not kind.strip():
         raise ValueError("kind must be non-empty string")
     if not isinstance(input_ref, dict):
         raise ValueError("input_ref must be dict")
     if not isinstance(params, dict):
         raise ValueError("params must be dict")
+    if not isinstance(operation, str):
+        raise ValueError("operation must be a string")
 
-    basis = {
+    basis: Dict[str, Any] = {
         "kind": kind,
         "input_ref": input_ref,
         "params": params,
     }
+    if operation:
+        basis["operation"] = operation
     return sha256_hex(_canonical_json(basis))
 
 
@@ -92,4 +117,17 @@ def make_job_id(operation: str, input_ref: Dict[str, Any], params: Dict[str, Any
         "input_ref": input_ref,
         "params": params,
     }
+    return sha256_hex(_canonical_json(basis))
+
+
+def make_job_result_key(job_id: str, provider: Dict[str, Any]) -> str:
+    if not isinstance(job_id, str) or not job_id.strip():
+        raise ValueError("job_id must be non-empty string")
+    if not isinstance(provider, dict):
+        raise ValueError("provider must be dict")
+
+    basis = {
+        "job_id": job_id,
+        "provider": provider,
+    }
     return sha256_hex(_canonical_json(basis))
\ No newline at end of file
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Optional
+
+from core.capability_registry import CapabilityRegistry
+from core.ordering import sort_dict
+
+
+ResolveFn = Callable[[CapabilityRegistry], Dict[str, object]]
+
+
+class ResolverCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CapabilityRegistry] = None
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def resolve(self, key: str, snapshot: CapabilityRegistry, compute: ResolveFn) -> Dict[str, object]:
+        if not isinstance(key, str) or not key.strip():
+            raise ValueError("key must be a non-empty string")
+        if not isinstance(snapshot, CapabilityRegistry):
+            raise ValueError("snapshot must be a CapabilityRegistry")
+
+        with self._lock:
+            if snapshot is not self._snapshot:
+                if self._snapshot is not None:
+                    self._invalidations += 1
+                self._snapshot = snapshot
+                self._entries = {}
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._hits += 1
+                return dict(cached)
+            self._misses += 1
+
+        value = compute(snapshot)
+        if not isinstance(value, dict):
+            raise ValueError("resolver must return a dict")
+
+        with self._lock:
+            if snapshot is self._snapshot:
+                self._entries[key] = dict(value)
+        return dict(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._entries = {}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return sort_dict(
+                {
+                    "entries": len(self._entries),
+                    "hits": self._hits,
+                    "invalidations": self._invalidations,
+                    "misses": self._misses,
+                }
+            )
+
+
+_shared_lock = threading.Lock()
+_shared_cache: Optional[ResolverCache] = None
+
+
+def shared_resolver_cache() -> ResolverCache:
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = ResolverCache()
+    return _shared_cache
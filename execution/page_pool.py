@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+MIN_PARALLEL_PAGES = 8
+
+PRELOAD_MODULES: Tuple[str, ...] = (
+    "fitz",
+    "pdfplumber",
+)
+
+
+def preload_modules() -> None:
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+
+def chunk_pages(pages: Sequence[int], chunks: int) -> List[List[int]]:
+    if not isinstance(chunks, int) or chunks < 1:
+        raise ValueError("chunks must be an int >= 1")
+    items = list(pages)
+    n = min(chunks, len(items))
+    if n == 0:
+        return []
+    size, extra = divmod(len(items), n)
+    out: List[List[int]] = []
+    start = 0
+    for i in range(n):
+        end = start + size + (1 if i < extra else 0)
+        out.append(items[start:end])
+        start = end
+    return out
+
+
+class PagePool:
+    def __init__(self, max_workers: Optional[int] = None, start_method: str = "spawn"):
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+            raise ValueError("max_workers must be an int >= 1")
+        self._max_workers = max_workers if max_workers is not None else (multiprocessing.cpu_count() or 1)
+        self._start_method = start_method
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def plan(self, pages: Sequence[int], min_parallel_pages: int = MIN_PARALLEL_PAGES) -> List[List[int]]:
+        if not isinstance(min_parallel_pages, int) or min_parallel_pages < 1:
+            raise ValueError("min_parallel_pages must be an int >= 1")
+        workers = min(self._max_workers, len(pages) // min_parallel_pages)
+        if workers < 2:
+            return [list(pages)] if pages else []
+        return chunk_pages(pages, workers)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context(self._start_method),
+                    initializer=preload_modules,
+                )
+            return self._executor
+
+    def map(self, fn: Callable[..., Any], calls: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        pool = self._pool()
+        futures = [pool.submit(fn, *args) for args in calls]
+        return [f.result() for f in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_shared_lock = threading.Lock()
+_shared_pool: Optional[PagePool] = None
+
+
+def shared_page_pool() -> PagePool:
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_lock:
+            if _shared_pool is None:
+                _shared_pool = PagePool()
+    return _shared_pool
\ No newline at end of file
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+from execution.pdf.page_runs import insert_page_runs
+
+
+def _source_pdf(pages: int) -> Any:
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"page {i + 1}", fontname="helv")
+    return fitz.open(stream=doc.write(), filetype="pdf")
+
+
+def _per_page(out: Any, src: Any, indices: List[int]) -> None:
+    for idx in indices:
+        out.insert_pdf(src, from_page=idx, to_page=idx)
+
+
+def _by_runs(out: Any, src: Any, indices: List[int]) -> None:
+    insert_page_runs(out, src, indices)
+
+
+def _time_copy(src: Any, indices: List[int], copy: Callable[[Any, Any, List[int]], None], repeat: int) -> float:
+    import fitz
+
+    best = float("inf")
+    for _ in range(repeat):
+        out = fitz.open()
+        try:
+            started = time.perf_counter()
+            copy(out, src, indices)
+            out.write()
+            best = min(best, time.perf_counter() - started)
+        finally:
+            out.close()
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m execution.pdf.bench_page_runs",
+        description="Compare per-page insert_pdf calls against coalesced page runs for remove/extract/reorder.",
+    )
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    src = _source_pdf(args.pages)
+    n = src.page_count
+    cases = {
+        "remove one page": [i for i in range(n) if i != n // 2],
+        "remove every 10th": [i for i in range(n) if i % 10 != 9],
+        "extract second half": list(range(n // 2, n)),
+        "reverse": list(range(n - 1, -1, -1)),
+    }
+    try:
+        for name, indices in cases.items():
+            per_page = _time_copy(src, indices, _per_page, args.repeat)
+            by_runs = _time_copy(src, indices, _by_runs, args.repeat)
+            print(f"{name:<20} per-page {per_page:8.3f}s  runs {by_runs:8.3f}s  speedup {per_page / by_runs:6.1f}x")
+    finally:
+        src.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
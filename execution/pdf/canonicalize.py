@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib.metadata
+import io
 import subprocess
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
+from core.ids import sha256_hex
 from core.ordering import sort_dict
-from core.capability_registry import build_registry
+from core.capability_registry import RegistryLike, is_available, shared_registry
+from execution.pdf.canonicalize_cache import COPY_CHUNK_BYTES, CanonicalizeCache
+
+
+CANONICALIZE_SYNC = "sync"
+CANONICALIZE_DEFERRED = "deferred"
+CANONICALIZE_OFF = "off"
+CANONICALIZE_MODES: Tuple[str, ...] = (CANONICALIZE_SYNC, CANONICALIZE_DEFERRED, CANONICALIZE_OFF)
+
+DeferredCanonicalizeFn = Callable[[bytes, Dict[str, Any]], Tuple[bytes, Dict[str, Any]]]
 
 
 @dataclass(frozen=True)
@@ -16,79 +30,181 @@ class CanonicalizeResult:
     manifest: Dict[str, object]
 
 
-def _cap_available(name: str) -> bool:
-    reg = build_registry()
-    try:
-        cap = reg.get(name)
-    except KeyError:
-        return False
-    return getattr(cap, "status").name == "AVAILABLE"
-
-
 def _write_temp_pdf(dir_path: Path, name: str, data: bytes) -> Path:
     p = dir_path / name
     p.write_bytes(data)
     return p
 
 
-def _normalize_with_pikepdf(input_bytes: bytes) -> Tuple[bytes, Dict[str, object]]:
+@functools.lru_cache(maxsize=None)
+def _binary_version(binary_name: str, flag: str) -> str:
+    try:
+        proc = subprocess.run([binary_name, flag], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    lines = proc.stdout.decode("utf-8", errors="replace").strip().splitlines()
+    return lines[0].strip() if lines else ""
+
+
+def _module_version(module_name: str) -> str:
+    try:
+        return importlib.metadata.version(module_name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def _libqpdf_version() -> str:
+    try:
+        import pikepdf
+    except ImportError:
+        return ""
+    return str(getattr(pikepdf, "__libqpdf_version__", ""))
+
+
+def canonicalizer_signature(registry: Optional[RegistryLike] = None) -> str:
+    reg = (registry if registry is not None else shared_registry()).snapshot()
+    parts: List[str] = []
+    if is_available(reg, "canonicalizer.pikepdf"):
+        parts.append(f"pikepdf={_module_version('pikepdf')}")
+        parts.append(f"libqpdf={_libqpdf_version()}")
+    if is_available(reg, "canonicalizer.qpdf"):
+        parts.append(f"qpdf={_binary_version('qpdf', '--version')}")
+    elif is_available(reg, "canonicalizer.mutool"):
+        parts.append(f"mutool={_binary_version('mutool', '-v')}")
+    return ";".join(parts) if parts else "none"
+
+
+QPDF_CANONICAL_ARGS: Tuple[str, ...] = (
+    "--deterministic-id",
+    "--object-streams=generate",
+    "--normalize-content=y",
+    "--newline-before-endstream",
+)
+
+
+def _open_normalized(source: Union[bytes, Path]) -> Any:
     import pikepdf
 
-    with pikepdf.Pdf.open(input_bytes) as pdf:
-        try:
-            di = pdf.docinfo
-            for k in list(di.keys()):
-                del di[k]
-        except Exception:
-            pass
+    pdf = pikepdf.Pdf.open(source if isinstance(source, Path) else io.BytesIO(source))
+    if "/ID" in pdf.trailer:
+        del pdf.trailer["/ID"]
+
+    try:
+        di = pdf.docinfo
+        for k in list(di.keys()):
+            del di[k]
+    except Exception:
+        pass
+
+    try:
+        pdf.remove_unreferenced_resources()
+    except Exception:
+        pass
+    return pdf
 
-        try:
-            pdf.remove_unreferenced_resources()
-        except Exception:
-            pass
 
-        out = pikepdf.BytesIO()
+def _normalize_with_pikepdf(input_bytes: bytes) -> Tuple[bytes, Dict[str, object]]:
+    import pikepdf
+
+    with _open_normalized(input_bytes) as pdf:
+        out = io.BytesIO()
         try:
             pdf.save(
                 out,
+                deterministic_id=True,
                 linearize=False,
                 object_stream_mode=pikepdf.ObjectStreamMode.generate,
                 compress_streams=True,
             )
         except Exception:
+            out = io.BytesIO()
             pdf.save(out)
         return out.getvalue(), sort_dict({"stage": "pikepdf", "metadata_normalized": True})
 
 
+def write_canonical_pdf(source: Union[bytes, Path], out: Union[BinaryIO, Path]) -> None:
+    import pikepdf
+
+    with _open_normalized(source) as pdf:
+        pdf.save(
+            out,
+            deterministic_id=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+            normalize_content=True,
+            compress_streams=True,
+            fix_metadata_version=False,
+            linearize=False,
+        )
+
+
+def _canonicalize_with_pikepdf(input_bytes: bytes) -> bytes:
+    out = io.BytesIO()
+    write_canonical_pdf(input_bytes, out)
+    return out.getvalue()
+
+
+def _run_qpdf(input_pdf: Path, output_pdf: Path) -> None:
+    cmd = ["qpdf", *QPDF_CANONICAL_ARGS, str(input_pdf), str(output_pdf)]
+    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def _run_mutool(input_pdf: Path, output_pdf: Path) -> None:
+    cmd = ["mutool", "clean", "-ggg", str(input_pdf), str(output_pdf)]
+    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
 def _canonicalize_with_qpdf(tmp_dir: Path, input_pdf: Path) -> bytes:
     output_pdf = tmp_dir / "out_qpdf.pdf"
-    cmd = [
-        "qpdf",
-        "--deterministic-id",
-        "--object-streams=generate",
-        "--normalize-content=y",
-        "--newline-before-endstream",
-        str(input_pdf),
-        str(output_pdf),
-    ]
-    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _run_qpdf(input_pdf, output_pdf)
     return output_pdf.read_bytes()
 
 
 def _canonicalize_with_mutool(tmp_dir: Path, input_pdf: Path) -> bytes:
     output_pdf = tmp_dir / "out_mutool.pdf"
-    cmd = ["mutool", "clean", "-ggg", str(input_pdf), str(output_pdf)]
-    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _run_mutool(input_pdf, output_pdf)
     return output_pdf.read_bytes()
 
 
-def canonicalize_pdf(pdf_bytes: bytes) -> CanonicalizeResult:
+def canonicalize_pdf(
+    pdf_bytes: bytes,
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[CanonicalizeCache] = None,
+) -> CanonicalizeResult:
     if not isinstance(pdf_bytes, (bytes, bytearray)) or len(pdf_bytes) == 0:
         raise ValueError("pdf_bytes must be non-empty bytes")
 
-    qpdf_ok = _cap_available("canonicalizer.qpdf")
-    mutool_ok = _cap_available("canonicalizer.mutool")
-    pikepdf_ok = _cap_available("canonicalizer.pikepdf")
+    if cache is None:
+        return _canonicalize_pdf(pdf_bytes, registry)
+
+    input_sha256 = sha256_hex(pdf_bytes)
+    signature = canonicalizer_signature(registry)
+    hit = cache.get(input_sha256, signature)
+    if hit is not None:
+        return CanonicalizeResult(pdf_bytes=hit[0], manifest=hit[1])
+
+    result = _canonicalize_pdf(pdf_bytes, registry)
+    if result.manifest.get("canonicalized") is True and result.manifest.get("degraded") is False:
+        cache.put(input_sha256, signature, result.pdf_bytes, result.manifest)
+    return result
+
+
+def _native_manifest() -> Dict[str, object]:
+    manifest = {
+        "canonicalized": True,
+        "degraded": False,
+        "canonicalizer": sort_dict(
+            {"mode": "in_process", "provider": "pikepdf", "provider_version": _module_version("pikepdf")}
+        ),
+        "stage1": sort_dict({"stage": "pikepdf", "metadata_normalized": True}),
+    }
+    return sort_dict(manifest)
+
+
+def _canonicalize_pdf(pdf_bytes: bytes, registry: Optional[RegistryLike]) -> CanonicalizeResult:
+    reg = (registry if registry is not None else shared_registry()).snapshot()
+    qpdf_ok = is_available(reg, "canonicalizer.qpdf")
+    mutool_ok = is_available(reg, "canonicalizer.mutool")
+    pikepdf_ok = is_available(reg, "canonicalizer.pikepdf")
 
     if not (qpdf_ok or mutool_ok or pikepdf_ok):
         return CanonicalizeResult(
@@ -102,6 +218,14 @@ def canonicalize_pdf(pdf_bytes: bytes) -> CanonicalizeResult:
             ),
         )
 
+    if pikepdf_ok:
+        try:
+            native_bytes = _canonicalize_with_pikepdf(bytes(pdf_bytes))
+        except Exception:
+            native_bytes = None
+        if native_bytes is not None:
+            return CanonicalizeResult(pdf_bytes=native_bytes, manifest=_native_manifest())
+
     stage1_bytes = bytes(pdf_bytes)
     stage1_manifest: Dict[str, object] = sort_dict({"stage": "none", "metadata_normalized": False})
 
@@ -154,10 +278,141 @@ def canonicalize_pdf(pdf_bytes: bytes) -> CanonicalizeResult:
     manifest = {
         "canonicalized": bool(canonicalized),
         "degraded": bool(degraded),
-        "canonicalizer": sort_dict({"provider": provider, "provider_version": provider_version}),
+        "canonicalizer": sort_dict(
+            {
+                "mode": "subprocess" if provider in ("qpdf", "mutool") else "in_process",
+                "provider": provider,
+                "provider_version": provider_version,
+            }
+        ),
         "stage1": stage1_manifest,
     }
     if degraded:
         manifest["degradation"] = degradation
 
-    return CanonicalizeResult(pdf_bytes=out_bytes, manifest=sort_dict(manifest))
\ No newline at end of file
+    return CanonicalizeResult(pdf_bytes=out_bytes, manifest=sort_dict(manifest))
+
+
+def canonicalize_mode(params: Dict[str, Any]) -> str:
+    mode = params.get("canonicalize", CANONICALIZE_SYNC)
+    if mode not in CANONICALIZE_MODES:
+        raise ValueError(f"canonicalize must be one of {list(CANONICALIZE_MODES)}")
+    return mode
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_file(path: Path, out: BinaryIO) -> None:
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(COPY_CHUNK_BYTES), b""):
+            out.write(chunk)
+
+
+def _degraded_file_manifest(reason: str, provider: str = "") -> Dict[str, object]:
+    manifest: Dict[str, object] = {
+        "canonicalized": False,
+        "degraded": True,
+        "degradation": sort_dict({"canonicalization": "skipped", "reason": reason}),
+    }
+    if provider:
+        manifest["canonicalizer"] = sort_dict({"mode": "subprocess", "provider": provider, "provider_version": ""})
+    return sort_dict(manifest)
+
+
+def _canonicalize_file(source: Path, tmp_dir: Path, registry: Optional[RegistryLike]) -> Tuple[Path, Dict[str, object]]:
+    # Every branch works file-to-file; on failure the assembled source is
+    # returned as-is and marked degraded rather than read into memory.
+    reg = (registry if registry is not None else shared_registry()).snapshot()
+    pikepdf_ok = is_available(reg, "canonicalizer.pikepdf")
+    if pikepdf_ok:
+        target = tmp_dir / "out_pikepdf.pdf"
+        try:
+            write_canonical_pdf(source, target)
+            return target, _native_manifest()
+        except Exception:
+            pass
+
+    if is_available(reg, "canonicalizer.qpdf"):
+        provider, run = "qpdf", _run_qpdf
+    elif is_available(reg, "canonicalizer.mutool"):
+        provider, run = "mutool", _run_mutool
+    else:
+        reason = "pikepdf_canonicalizer_failed" if pikepdf_ok else "no_canonicalizer_capability"
+        return source, _degraded_file_manifest(reason)
+
+    target = tmp_dir / f"out_{provider}.pdf"
+    try:
+        run(source, target)
+    except Exception:
+        return source, _degraded_file_manifest("cli_canonicalizer_failed", provider)
+
+    manifest = {
+        "canonicalized": True,
+        "degraded": False,
+        "canonicalizer": sort_dict({"mode": "subprocess", "provider": provider, "provider_version": ""}),
+        "stage1": sort_dict({"stage": "none", "metadata_normalized": False}),
+    }
+    return target, sort_dict(manifest)
+
+
+def canonicalize_pdf_file(
+    source: Path,
+    out: BinaryIO,
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[CanonicalizeCache] = None,
+) -> Dict[str, object]:
+    source = Path(source)
+    if source.stat().st_size == 0:
+        raise ValueError("source must be a non-empty pdf file")
+
+    input_sha256 = ""
+    signature = ""
+    if cache is not None:
+        input_sha256 = _file_sha256(source)
+        signature = canonicalizer_signature(registry)
+        manifest = cache.copy_to(input_sha256, signature, out)
+        if manifest is not None:
+            return manifest
+
+    with tempfile.TemporaryDirectory(dir=source.parent) as td:
+        result, manifest = _canonicalize_file(source, Path(td), registry)
+        if cache is not None and manifest.get("canonicalized") is True and manifest.get("degraded") is False:
+            cache.put_file(input_sha256, signature, result, manifest)
+        _copy_file(result, out)
+    return manifest
+
+
+def uncanonicalized_manifest(mode: str) -> Dict[str, object]:
+    if mode not in CANONICALIZE_MODES:
+        raise ValueError(f"canonicalize must be one of {list(CANONICALIZE_MODES)}")
+    return sort_dict({"canonicalized": False, "degraded": False, "pending": mode == CANONICALIZE_DEFERRED})
+
+
+def canonicalize_for_mode(
+    pdf_bytes: bytes,
+    mode: str,
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[CanonicalizeCache] = None,
+) -> CanonicalizeResult:
+    if mode == CANONICALIZE_SYNC:
+        return canonicalize_pdf(pdf_bytes, registry=registry, cache=cache)
+    return CanonicalizeResult(pdf_bytes=bytes(pdf_bytes), manifest=uncanonicalized_manifest(mode))
+
+
+def make_deferred_canonicalizer(
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[CanonicalizeCache] = None,
+) -> DeferredCanonicalizeFn:
+    def _finish(pdf_bytes: bytes, manifest: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
+        canon = canonicalize_pdf(pdf_bytes, registry=registry, cache=cache)
+        out = dict(manifest)
+        out["canonicalization"] = canon.manifest
+        return canon.pdf_bytes, sort_dict(out)
+
+    return _finish
\ No newline at end of file
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from core.ids import sha256_hex
+from core.ordering import sort_dict
+from storage.adapter import StorageAdapter
+
+
+DEFAULT_CANONICALIZE_CACHE_BYTES = 1024 * 1024 * 1024
+COPY_CHUNK_BYTES = 1024 * 1024
+DEFAULT_RESCAN_SECONDS = 60.0
+
+PDF_SUFFIX = ".pdf"
+MANIFEST_SUFFIX = ".json"
+
+
+class CanonicalizeCache:
+    def __init__(
+        self,
+        storage: StorageAdapter,
+        max_bytes: int = DEFAULT_CANONICALIZE_CACHE_BYTES,
+        prefix: str = "canonical",
+        rescan_seconds: float = DEFAULT_RESCAN_SECONDS,
+    ):
+        if not isinstance(prefix, str) or not prefix.strip():
+            raise ValueError("prefix must be a non-empty string")
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative int")
+        if not isinstance(rescan_seconds, (int, float)) or rescan_seconds < 0:
+            raise ValueError("rescan_seconds must be a non-negative number")
+        self._storage = storage
+        self._max_bytes = max_bytes
+        self._prefix = prefix.strip("/")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._rescan_seconds = float(rescan_seconds)
+        self._scanned_at: Optional[float] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _entry_key(self, input_sha256: str, signature: str) -> str:
+        if not isinstance(input_sha256, str) or len(input_sha256) != 64:
+            raise ValueError("input_sha256 must be a sha256 hex digest")
+        if not isinstance(signature, str) or not signature.strip():
+            raise ValueError("signature must be a non-empty string")
+        return f"{self._prefix}/{input_sha256}/{sha256_hex(signature.encode('utf-8'))[:16]}"
+
+    def _seed_locked(self) -> None:
+        if self._scanned_at is None:
+            self._scan_locked()
+            self._evict_locked()
+
+    def _rescan_due_locked(self) -> bool:
+        return self._scanned_at is None or time.monotonic() - self._scanned_at >= self._rescan_seconds
+
+    def _scan_locked(self) -> None:
+        self._scanned_at = time.monotonic()
+        iter_keys = getattr(self._storage, "iter_keys", None)
+        if iter_keys is None:
+            return
+
+        sizes: Dict[str, int] = {}
+        mtimes: Dict[str, int] = {}
+        for key in iter_keys(self._prefix):
+            if not key.startswith(self._prefix + "/"):
+                continue
+            path = self._storage.local_path(key)
+            if path is None:
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entry = key.rsplit(".", 1)[0]
+            sizes[entry] = sizes.get(entry, 0) + st.st_size
+            mtimes[entry] = max(mtimes.get(entry, 0), st.st_mtime_ns)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        for _, entry, size in sorted((mtimes[e], e, sizes[e]) for e in sizes):
+            self._entries[entry] = size
+            self._bytes += size
+
+    def _touch(self, entry: str) -> None:
+        for suffix in (MANIFEST_SUFFIX, PDF_SUFFIX):
+            try:
+                path = self._storage.local_path(entry + suffix)
+                if path is not None:
+                    os.utime(path)
+            except (FileNotFoundError, ValueError):
+                continue
+
+    def get(self, input_sha256: str, signature: str) -> Optional[Tuple[bytes, Dict[str, object]]]:
+        entry = self._entry_key(input_sha256, signature)
+        try:
+            obj = self._read_manifest(entry, signature)
+            pdf_bytes = self._storage.get_bytes(entry + PDF_SUFFIX)
+            if obj["content_sha256"] != sha256_hex(pdf_bytes):
+                raise ValueError("stale canonicalization cache entry")
+            manifest = obj["manifest"]
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            self._record_miss()
+            return None
+
+        self._record_hit(entry)
+        return pdf_bytes, manifest
+
+    def copy_to(self, input_sha256: str, signature: str, out: BinaryIO) -> Optional[Dict[str, object]]:
+        entry = self._entry_key(input_sha256, signature)
+        try:
+            obj = self._read_manifest(entry, signature)
+            digest = hashlib.sha256()
+            with self._storage.open_read(entry + PDF_SUFFIX) as fh:
+                for chunk in iter(lambda: fh.read(COPY_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+            if obj["content_sha256"] != digest.hexdigest():
+                raise ValueError("stale canonicalization cache entry")
+            manifest = obj["manifest"]
+            with self._storage.open_read(entry + PDF_SUFFIX) as fh:
+                for chunk in iter(lambda: fh.read(COPY_CHUNK_BYTES), b""):
+                    out.write(chunk)
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            self._record_miss()
+            return None
+
+        self._record_hit(entry)
+        return manifest
+
+    def put(self, input_sha256: str, signature: str, pdf_bytes: bytes, manifest: Dict[str, object]) -> None:
+        entry = self._entry_key(input_sha256, signature)
+        data = self._manifest_bytes(signature, sha256_hex(pdf_bytes), manifest)
+        size = len(pdf_bytes) + len(data)
+        if size > self._max_bytes:
+            return
+
+        self._storage.put_bytes(entry + PDF_SUFFIX, pdf_bytes, overwrite=True)
+        self._storage.put_bytes(entry + MANIFEST_SUFFIX, data, overwrite=True)
+        self._record_put(entry, size)
+
+    def put_file(self, input_sha256: str, signature: str, path: Path, manifest: Dict[str, object]) -> None:
+        entry = self._entry_key(input_sha256, signature)
+        if Path(path).stat().st_size > self._max_bytes:
+            return
+
+        spool = self._storage.open_spool()
+        try:
+            with open(path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(COPY_CHUNK_BYTES), b""):
+                    spool.write(chunk)
+            data = self._manifest_bytes(signature, spool.sha256, manifest)
+            size = spool.size + len(data)
+            if size > self._max_bytes:
+                spool.discard()
+                return
+            spool.commit(entry + PDF_SUFFIX, overwrite=True)
+        except BaseException:
+            spool.discard()
+            raise
+        self._storage.put_bytes(entry + MANIFEST_SUFFIX, data, overwrite=True)
+        self._record_put(entry, size)
+
+    def _read_manifest(self, entry: str, signature: str) -> Dict[str, object]:
+        obj = json.loads(self._storage.get_bytes(entry + MANIFEST_SUFFIX).decode("utf-8"))
+        if obj["signature"] != signature:
+            raise ValueError("stale canonicalization cache entry")
+        return obj
+
+    @staticmethod
+    def _manifest_bytes(signature: str, content_sha256: str, manifest: Dict[str, object]) -> bytes:
+        payload = {
+            "content_sha256": content_sha256,
+            "manifest": manifest,
+            "signature": signature,
+        }
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _record_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def _record_hit(self, entry: str) -> None:
+        self._touch(entry)
+        with self._lock:
+            self._hits += 1
+            if entry in self._entries:
+                self._entries.move_to_end(entry)
+
+    def _record_put(self, entry: str, size: int) -> None:
+        # Accounting is incremental; entries written by other processes are
+        # folded in by a full rescan at most every rescan_seconds, so the
+        # shared budget can overshoot by what they write in one interval.
+        with self._lock:
+            if self._rescan_due_locked():
+                self._scan_locked()
+            self._bytes += size - self._entries.get(entry, 0)
+            self._entries[entry] = size
+            self._entries.move_to_end(entry)
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        while self._entries and self._bytes > self._max_bytes:
+            victim, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            self._storage.delete(victim + MANIFEST_SUFFIX)
+            self._storage.delete(victim + PDF_SUFFIX)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._seed_locked()
+            return sort_dict(
+                {
+                    "bytes": self._bytes,
+                    "entries": len(self._entries),
+                    "evictions": self._evictions,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                }
+            )
\ No newline at end of file
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import importlib.metadata
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from core.capability_registry import build_registry
+from core.capability_registry import CapabilityRegistry, RegistryLike, is_available, shared_registry
 from core.ordering import sort_dict
+from core.resolver_cache import ResolverCache, shared_resolver_cache
 
 
 CANONICALIZER_PRIORITY: List[str] = [
@@ -21,12 +22,10 @@ def _provider_version(name: str) -> str:
         return "unknown"
 
 
-def resolve_canonicalizer() -> Dict[str, str]:
-    registry = build_registry()
-
+def _resolve(reg: CapabilityRegistry) -> Dict[str, str]:
     for provider in CANONICALIZER_PRIORITY:
         key = f"canonicalizer.{provider}"
-        if registry.get(key) == "available":
+        if is_available(reg, key):
             return sort_dict(
                 {
                     "provider": provider,
@@ -42,4 +41,13 @@ def resolve_canonicalizer() -> Dict[str, str]:
             "degraded": True,
             "reason": "no_canonicalizer_available",
         }
-    )
\ No newline at end of file
+    )
+
+
+def resolve_canonicalizer(
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[ResolverCache] = None,
+) -> Dict[str, str]:
+    reg = (registry if registry is not None else shared_registry()).snapshot()
+    rc = cache if cache is not None else shared_resolver_cache()
+    return rc.resolve("canonicalizer", reg, _resolve)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from core.ordering import sort_dict
+
+
+DEFAULT_DOCUMENT_CACHE_BYTES = 512 * 1024 * 1024
+DEFAULT_DOCUMENT_CACHE_ENTRIES = 64
+
+OpenFn = Callable[[], Any]
+
+
+def _close(doc: Any) -> None:
+    try:
+        doc.close()
+    except Exception:
+        pass
+
+
+class _Entry:
+    def __init__(self, doc: Any, byte_size: int):
+        self.doc = doc
+        self.byte_size = byte_size
+        self.lock = threading.Lock()
+        self.refs = 0
+        self.evicted = False
+
+
+class DocumentCache:
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_DOCUMENT_CACHE_BYTES,
+        max_entries: int = DEFAULT_DOCUMENT_CACHE_ENTRIES,
+    ):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative int")
+        if not isinstance(max_entries, int) or max_entries < 0:
+            raise ValueError("max_entries must be a non-negative int")
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._private_opens = 0
+
+    @contextmanager
+    def open(self, key: str, byte_size: int, opener: OpenFn) -> Iterator[Any]:
+        if not isinstance(key, str) or not key.strip():
+            raise ValueError("key must be a non-empty string")
+        if not isinstance(byte_size, int) or byte_size < 0:
+            raise ValueError("byte_size must be a non-negative int")
+
+        entry = self._acquire(key)
+        if entry is None:
+            doc = opener()
+            entry = self._insert(key, byte_size, doc)
+        elif not entry.lock.acquire(blocking=False):
+            self._release(entry)
+            entry = None
+            doc = opener()
+        else:
+            doc = entry.doc
+
+        if entry is None:
+            with self._lock:
+                self._private_opens += 1
+            try:
+                yield doc
+            finally:
+                _close(doc)
+            return
+
+        try:
+            yield doc
+        finally:
+            entry.lock.release()
+            self._release(entry)
+
+    def _acquire(self, key: str) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            entry.refs += 1
+            return entry
+
+    def _insert(self, key: str, byte_size: int, doc: Any) -> Optional[_Entry]:
+        if byte_size > self._max_bytes or self._max_entries == 0:
+            return None
+        with self._lock:
+            if key in self._entries:
+                return None
+            entry = _Entry(doc, byte_size)
+            entry.refs = 1
+            entry.lock.acquire()
+            self._entries[key] = entry
+            self._bytes += byte_size
+            self._evict_locked()
+            return entry
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.refs -= 1
+            close_now = entry.evicted and entry.refs == 0
+        if close_now:
+            _close(entry.doc)
+
+    def _evict_locked(self) -> None:
+        while self._entries and (self._bytes > self._max_bytes or len(self._entries) > self._max_entries):
+            victim_key = next(iter(self._entries))
+            victim = self._entries.pop(victim_key)
+            self._bytes -= victim.byte_size
+            self._evictions += 1
+            victim.evicted = True
+            if victim.refs == 0:
+                _close(victim.doc)
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                entry.evicted = True
+                if entry.refs == 0:
+                    _close(entry.doc)
+            self._entries = OrderedDict()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return sort_dict(
+                {
+                    "bytes": self._bytes,
+                    "entries": len(self._entries),
+                    "evictions": self._evictions,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "private_opens": self._private_opens,
+                }
+            )
+
+
+_shared_lock = threading.Lock()
+_shared_cache: Optional[DocumentCache] = None
+
+
+def shared_document_cache() -> DocumentCache:
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = DocumentCache()
+    return _shared_cache
\ No newline at end of file
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import io
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+from domain.document import DocumentRecord
+from execution.pdf.document_cache import DocumentCache, shared_document_cache
+from services.document_service import DocumentService
+
+
+def open_fitz_document(documents: DocumentService, rec: DocumentRecord) -> Any:
+    import fitz
+
+    path = documents.local_path(rec)
+    if path is not None:
+        return fitz.open(str(path), filetype="pdf")
+    return fitz.open(stream=documents.load_view(rec), filetype="pdf")
+
+
+@contextmanager
+def cached_fitz_document(
+    documents: DocumentService,
+    rec: DocumentRecord,
+    cache: Optional[DocumentCache] = None,
+) -> Iterator[Any]:
+    c = cache if cache is not None else shared_document_cache()
+    with c.open(rec.content_sha256, rec.byte_size, lambda: open_fitz_document(documents, rec)) as doc:
+        yield doc
+
+
+def document_source(documents: DocumentService, rec: DocumentRecord) -> Union[str, BinaryIO]:
+    path = documents.local_path(rec)
+    if path is not None:
+        return str(path)
+    return io.BytesIO(documents.load_bytes(rec))
\ No newline at end of file
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from core.capability_registry import RegistryLike
 from core.ordering import sort_dict
 from services.document_service import DocumentService
+from execution.pdf.document_cache import DocumentCache
+from execution.pdf.document_source import cached_fitz_document, document_source
 from execution.pdf.provider_registry import resolve_pdf_provider
-from execution.pdf.canonicalize import canonicalize_pdf
+from execution.pdf.canonicalize import CANONICALIZE_DEFERRED, canonicalize_for_mode, canonicalize_mode
+from execution.pdf.canonicalize_cache import CanonicalizeCache
+from execution.pdf.merge_stream import stream_merge
 
 
-def make_pdf_merge_execution(documents: DocumentService):
+def make_pdf_merge_execution(
+    documents: DocumentService,
+    registry: Optional[RegistryLike] = None,
+    document_cache: Optional[DocumentCache] = None,
+    canonicalize_cache: Optional[CanonicalizeCache] = None,
+):
     def _exec(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
         if not isinstance(payload, dict):
             raise ValueError("payload must be a dict")
@@ -29,17 +39,46 @@ def make_pdf_merge_execution(documents: DocumentService):
             if not isinstance(d, str) or not d.strip():
                 raise ValueError("input_ref.documents must contain non-empty strings")
 
-        provider_res = resolve_pdf_provider("pdf.merge")
+        mode = canonicalize_mode(params)
+        streaming = params.get("streaming", False)
+        if not isinstance(streaming, bool):
+            raise ValueError("streaming must be a bool")
+        if streaming and mode == CANONICALIZE_DEFERRED:
+            raise ValueError("streaming merge supports canonicalize sync or off")
+
+        provider_res = resolve_pdf_provider("pdf.merge", registry=registry)
         if provider_res.get("degraded") is True or not provider_res.get("provider"):
             raise ValueError("no_pdf_provider_available_for_merge")
 
         provider = str(provider_res.get("provider"))
         provider_version = str(provider_res.get("provider_version", ""))
 
-        pdfs: List[bytes] = []
-        for doc_id in doc_ids:
-            rec = documents.get_document(doc_id)
-            pdfs.append(documents.load_bytes(rec))
+        records = [documents.get_document(doc_id) for doc_id in doc_ids]
+
+        if streaming:
+            if provider != "pymupdf":
+                raise ValueError("streaming merge requires pymupdf")
+            spool, canonicalization = stream_merge(
+                documents, records, mode, registry=registry, cache=canonicalize_cache
+            )
+            manifest = {
+                "provider": provider,
+                "provider_version": provider_version,
+                "canonicalization": canonicalization,
+                "canonicalize": mode,
+                "ordered_documents": list(doc_ids),
+                "streaming": True,
+            }
+            return (
+                spool,
+                sort_dict(
+                    {
+                        "artifact_kind": "pdf",
+                        "media_type": "application/pdf",
+                        "manifest": sort_dict(manifest),
+                    }
+                ),
+            )
 
         merged_bytes: bytes
 
@@ -48,13 +87,10 @@ def make_pdf_merge_execution(documents: DocumentService):
 
             out = fitz.open()
             try:
-                for b in pdfs:
-                    src = fitz.open(stream=b, filetype="pdf")
-                    try:
+                for rec in records:
+                    with cached_fitz_document(documents, rec, cache=document_cache) as src:
                         out.insert_pdf(src)
-                    finally:
-                        src.close()
-                merged_bytes = out.write()
+                merged_bytes = out.write(no_new_id=True)
             finally:
                 out.close()
 
@@ -64,8 +100,8 @@ def make_pdf_merge_execution(documents: DocumentService):
 
             merger = PdfMerger()
             try:
-                for b in pdfs:
-                    merger.append(BytesIO(b))
+                for rec in records:
+                    merger.append(document_source(documents, rec))
                 buf = BytesIO()
                 merger.write(buf)
                 merged_bytes = buf.getvalue()
@@ -78,12 +114,13 @@ def make_pdf_merge_execution(documents: DocumentService):
         else:
             raise ValueError("selected_provider_not_supported")
 
-        canon = canonicalize_pdf(merged_bytes)
+        canon = canonicalize_for_mode(merged_bytes, mode, registry=registry, cache=canonicalize_cache)
 
         manifest = {
             "provider": provider,
             "provider_version": provider_version,
             "canonicalization": canon.manifest,
+            "canonicalize": mode,
             "ordered_documents": list(doc_ids),
         }
 
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.capability_registry import RegistryLike
+from domain.document import DocumentRecord
+from execution.pdf.canonicalize import (
+    CANONICALIZE_SYNC,
+    canonicalize_pdf_file,
+    uncanonicalized_manifest,
+)
+from execution.pdf.canonicalize_cache import COPY_CHUNK_BYTES, CanonicalizeCache
+from services.document_service import DocumentService
+from storage.adapter import Spool
+
+
+def _input_paths(documents: DocumentService, records: Sequence[DocumentRecord]) -> List[Path]:
+    paths: List[Path] = []
+    for rec in records:
+        path = documents.local_path(rec)
+        if path is None:
+            raise ValueError("streaming merge requires documents stored on a local filesystem")
+        paths.append(path)
+    return paths
+
+
+def _temp_dir(documents: DocumentService) -> Optional[str]:
+    temp_dir = getattr(documents.storage, "temp_dir", None)
+    return str(temp_dir()) if temp_dir is not None else None
+
+
+def _assemble(paths: Sequence[Path], target: Path) -> None:
+    import fitz
+
+    # Keep the assembled file deterministic: its digest keys the canonicalize cache.
+
+    for i, path in enumerate(paths):
+        src = fitz.open(str(path), filetype="pdf")
+        try:
+            if i == 0:
+                out = fitz.open()
+                try:
+                    out.insert_pdf(src)
+                    out.save(str(target), no_new_id=True)
+                finally:
+                    out.close()
+                continue
+            out = fitz.open(str(target), filetype="pdf")
+            try:
+                out.insert_pdf(src)
+                out.save(str(target), incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP, no_new_id=True)
+            finally:
+                out.close()
+        finally:
+            src.close()
+
+
+def _copy_into(path: Path, spool: Spool) -> None:
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(COPY_CHUNK_BYTES), b""):
+            spool.write(chunk)
+
+
+def stream_merge(
+    documents: DocumentService,
+    records: Sequence[DocumentRecord],
+    mode: str,
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[CanonicalizeCache] = None,
+) -> Tuple[Spool, Dict[str, object]]:
+    manifest = uncanonicalized_manifest(mode)
+    paths = _input_paths(documents, records)
+    spool = documents.storage.open_spool()
+    try:
+        with tempfile.TemporaryDirectory(dir=_temp_dir(documents)) as td:
+            assembled = Path(td) / "merged.pdf"
+            _assemble(paths, assembled)
+            if mode == CANONICALIZE_SYNC:
+                manifest = canonicalize_pdf_file(assembled, spool, registry=registry, cache=cache)
+            else:
+                _copy_into(assembled, spool)
+    except BaseException:
+        spool.discard()
+        raise
+    return spool, manifest
\ No newline at end of file
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any, List, Sequence, Tuple
+
+
+def page_runs(indices: Sequence[int]) -> List[Tuple[int, int]]:
+    runs: List[Tuple[int, int]] = []
+    for idx in indices:
+        if runs:
+            start, end = runs[-1]
+            step = end - start
+            if step >= 0 and idx == end + 1:
+                runs[-1] = (start, idx)
+                continue
+            if step <= 0 and idx == end - 1:
+                runs[-1] = (start, idx)
+                continue
+        runs.append((idx, idx))
+    return runs
+
+
+def insert_page_runs(out: Any, src: Any, indices: Sequence[int]) -> int:
+    runs = page_runs(indices)
+    # final=False keeps the source graft map alive between runs so resources
+    # shared by several runs are copied once; the last run releases it.
+    for i, (start, end) in enumerate(runs):
+        out.insert_pdf(src, from_page=start, to_page=end, final=(i == len(runs) - 1))
+    return len(runs)
\ No newline at end of file
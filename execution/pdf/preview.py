@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
+from core.capability_registry import RegistryLike, shared_registry
 from core.ordering import sort_dict
 from services.document_service import DocumentService
+from execution.pdf.document_cache import DocumentCache
+from execution.pdf.document_source import cached_fitz_document
 from execution.pdf.provider_registry import resolve_pdf_provider
+from execution.pdf.render import image_media_type, render_options, render_page, require_image_encoder
+from execution.pdf.render_cache import RenderCache
 
 
-def make_pdf_preview_execution(documents: DocumentService):
+def make_pdf_preview_execution(
+    documents: DocumentService,
+    registry: Optional[RegistryLike] = None,
+    document_cache: Optional[DocumentCache] = None,
+    render_cache: Optional[RenderCache] = None,
+):
     def _exec(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
         if not isinstance(payload, dict):
             raise ValueError("payload must be a dict")
@@ -22,57 +32,53 @@ def make_pdf_preview_execution(documents: DocumentService):
 
         document_id = params.get("document_id")
         page = params.get("page")
-        dpi = params.get("dpi", 150)
 
         if not isinstance(document_id, str) or not document_id.strip():
             raise ValueError("document_id must be a non-empty string")
         if not isinstance(page, int) or page < 1:
             raise ValueError("page must be an int >= 1")
-        if not isinstance(dpi, int) or dpi != 150:
-            raise ValueError("dpi must be 150")
+        options = render_options(params)
+        require_image_encoder(options, registry if registry is not None else shared_registry())
 
-        provider_res = resolve_pdf_provider("pdf.preview")
+        provider_res = resolve_pdf_provider("pdf.preview", registry=registry)
         if provider_res.get("degraded") is True or not provider_res.get("provider"):
             raise ValueError("no_pdf_provider_available_for_preview")
 
         provider = str(provider_res.get("provider"))
         provider_version = str(provider_res.get("provider_version", ""))
+        renderer = f"{provider}-{provider_version}"
 
         doc_record = documents.get_document(document_id)
-        pdf_bytes = documents.load_bytes(doc_record)
 
         if provider == "pymupdf":
-            import fitz
-
-            pdf = fitz.open(stream=pdf_bytes, filetype="pdf")
-            try:
-                page_index = page - 1
-                if page_index < 0 or page_index >= pdf.page_count:
-                    raise ValueError("page out of range")
-
-                p = pdf.load_page(page_index)
-                scale = float(dpi) / 72.0
-                pix = p.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
-                out_png = pix.tobytes("png")
-            finally:
-                pdf.close()
+            out_image = None
+            if render_cache is not None:
+                out_image = render_cache.get(doc_record.content_sha256, page, options, renderer)
+            if out_image is None:
+                with cached_fitz_document(documents, doc_record, cache=document_cache) as pdf:
+                    out_image = render_page(pdf, page, options)
+                if render_cache is not None:
+                    render_cache.put(doc_record.content_sha256, page, options, renderer, out_image)
 
             manifest = sort_dict(
                 {
                     "page_base": 1,
                     "page": page,
-                    "dpi": dpi,
+                    "dpi": options["dpi"],
+                    "format": options["format"],
+                    "quality": options["quality"],
+                    "width": options["width"],
                     "provider": provider,
                     "provider_version": provider_version,
                 }
             )
 
             return (
-                out_png,
+                out_image,
                 sort_dict(
                     {
                         "artifact_kind": "bin",
-                        "media_type": "image/png",
+                        "media_type": image_media_type(options),
                         "manifest": manifest,
                     }
                 ),
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.capability_registry import RegistryLike, shared_registry
+from core.ordering import sort_dict
+from services.document_service import DocumentService
+from execution.page_pool import MIN_PARALLEL_PAGES, PagePool, shared_page_pool
+from execution.pdf.document_cache import DocumentCache
+from execution.pdf.document_source import cached_fitz_document
+from execution.pdf.provider_registry import resolve_pdf_provider
+from execution.pdf.render import image_extension, render_options, render_page, render_pages_from_path, require_image_encoder
+from execution.pdf.render_cache import RenderCache
+
+
+MAX_BATCH_PAGES = 500
+
+ZIP_FIXED_DT = (1980, 1, 1, 0, 0, 0)
+
+
+def _batch_pages(params: Dict[str, Any]) -> List[int]:
+    pages = params.get("pages")
+    page_range = params.get("page_range")
+
+    if (pages is None) == (page_range is None):
+        raise ValueError("exactly one of pages or page_range is required")
+
+    if pages is not None:
+        if not isinstance(pages, list) or not pages:
+            raise ValueError("pages must be a non-empty list of integers >= 1")
+        if not all(isinstance(p, int) and p >= 1 for p in pages):
+            raise ValueError("pages must be a non-empty list of integers >= 1")
+        out = sorted(set(pages))
+    else:
+        if (
+            not isinstance(page_range, list)
+            or len(page_range) != 2
+            or not all(isinstance(p, int) and p >= 1 for p in page_range)
+            or page_range[0] > page_range[1]
+        ):
+            raise ValueError("page_range must be [first, last] with 1 <= first <= last")
+        out = list(range(page_range[0], page_range[1] + 1))
+
+    if len(out) > MAX_BATCH_PAGES:
+        raise ValueError("batch page limit exceeded")
+    return out
+
+
+def _page_filename(page: int, ext: str) -> str:
+    return f"page_{str(page).zfill(4)}.{ext}"
+
+
+def _zip_bytes(entries: List[Tuple[str, bytes]]) -> bytes:
+    mem = io.BytesIO()
+    with zipfile.ZipFile(mem, mode="w", compression=zipfile.ZIP_STORED) as zf:
+        for name, data in entries:
+            zi = zipfile.ZipInfo(filename=name, date_time=ZIP_FIXED_DT)
+            zi.compress_type = zipfile.ZIP_STORED
+            zf.writestr(zi, data)
+    return mem.getvalue()
+
+
+def make_pdf_preview_batch_execution(
+    documents: DocumentService,
+    registry: Optional[RegistryLike] = None,
+    document_cache: Optional[DocumentCache] = None,
+    page_pool: Optional[PagePool] = None,
+    min_parallel_pages: int = MIN_PARALLEL_PAGES,
+    render_cache: Optional[RenderCache] = None,
+):
+    def _exec(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
+        if not isinstance(payload, dict):
+            raise ValueError("payload must be a dict")
+
+        input_ref = payload.get("input_ref")
+        params = payload.get("params")
+
+        if not isinstance(input_ref, dict):
+            raise ValueError("input_ref must be a dict")
+        if not isinstance(params, dict):
+            raise ValueError("params must be a dict")
+
+        document_id = params.get("document_id")
+
+        if not isinstance(document_id, str) or not document_id.strip():
+            raise ValueError("document_id must be a non-empty string")
+        pages = _batch_pages(params)
+        options = render_options(params)
+        require_image_encoder(options, registry if registry is not None else shared_registry())
+
+        provider_res = resolve_pdf_provider("pdf.preview.batch", registry=registry)
+        if provider_res.get("degraded") is True or not provider_res.get("provider"):
+            raise ValueError("no_pdf_provider_available_for_preview")
+
+        provider = str(provider_res.get("provider"))
+        provider_version = str(provider_res.get("provider_version", ""))
+        renderer = f"{provider}-{provider_version}"
+
+        if provider != "pymupdf":
+            raise ValueError("selected_provider_does_not_support_preview")
+
+        doc_record = documents.get_document(document_id)
+        sha = doc_record.content_sha256
+        images: Dict[int, bytes] = {}
+        if render_cache is not None:
+            for p in pages:
+                cached = render_cache.get(sha, p, options, renderer)
+                if cached is not None:
+                    images[p] = cached
+        missing = [p for p in pages if p not in images]
+
+        pool = page_pool if page_pool is not None else shared_page_pool()
+        path = documents.local_path(doc_record)
+        chunks = pool.plan(missing, min_parallel_pages) if path is not None else [missing]
+
+        with cached_fitz_document(documents, doc_record, cache=document_cache) as pdf:
+            if pages[-1] > pdf.page_count:
+                raise ValueError("page out of range")
+            if len(chunks) == 1:
+                images.update((p, render_page(pdf, p, options)) for p in missing)
+
+        if len(chunks) > 1:
+            calls = [(str(path), sha, doc_record.byte_size, chunk, options) for chunk in chunks]
+            rendered = [img for out in pool.map(render_pages_from_path, calls) for img in out]
+            images.update(zip(missing, rendered))
+
+        if render_cache is not None:
+            for p in missing:
+                render_cache.put(sha, p, options, renderer, images[p])
+
+        ext = image_extension(options)
+        entries = [(_page_filename(p, ext), images[p]) for p in pages]
+
+        manifest = sort_dict(
+            {
+                "dpi": options["dpi"],
+                "entries": len(entries),
+                "entry_format": options["format"],
+                "format": "zip",
+                "page_base": 1,
+                "pages": pages,
+                "provider": provider,
+                "provider_version": provider_version,
+                "quality": options["quality"],
+                "width": options["width"],
+                "zip_timestamp": "1980-01-01T00:00:00",
+            }
+        )
+
+        return (
+            _zip_bytes(entries),
+            sort_dict(
+                {
+                    "artifact_kind": "bin",
+                    "media_type": "application/zip",
+                    "manifest": manifest,
+                }
+            ),
+        )
+
+    return _exec
\ No newline at end of file
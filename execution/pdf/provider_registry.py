@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import importlib.metadata
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional
 
-from core.capability_registry import build_registry
+from core.capability_registry import CapabilityRegistry, RegistryLike, is_available, shared_registry
 from core.ordering import sort_dict
+from core.resolver_cache import ResolverCache, shared_resolver_cache
 
 
 PDF_PROVIDER_PRIORITY: List[str] = [
@@ -20,12 +21,10 @@ def _provider_version(name: str) -> str:
         return "unknown"
 
 
-def resolve_pdf_provider(operation: str) -> Dict[str, str]:
-    registry = build_registry()
-
+def _resolve(reg: CapabilityRegistry) -> Dict[str, str]:
     for provider in PDF_PROVIDER_PRIORITY:
         key = f"pdf_engine.{provider}"
-        if registry.get(key) == "available":
+        if is_available(reg, key):
             return sort_dict(
                 {
                     "provider": provider,
@@ -41,4 +40,14 @@ def resolve_pdf_provider(operation: str) -> Dict[str, str]:
             "degraded": True,
             "reason": "no_pdf_provider_available",
         }
-    )
\ No newline at end of file
+    )
+
+
+def resolve_pdf_provider(
+    operation: str,
+    registry: Optional[RegistryLike] = None,
+    cache: Optional[ResolverCache] = None,
+) -> Dict[str, str]:
+    reg = (registry if registry is not None else shared_registry()).snapshot()
+    rc = cache if cache is not None else shared_resolver_cache()
+    return rc.resolve(f"pdf_engine:{operation}", reg, _resolve)
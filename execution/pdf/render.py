@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import io
+from typing import Any, Dict, List, Sequence
+
+from core.capability_registry import RegistryLike, is_available
+from core.ordering import sort_dict
+from execution.pdf.document_cache import shared_document_cache
+
+
+ALLOWED_DPI = (36, 72, 96, 150, 200, 300)
+ALLOWED_WIDTHS = (128, 256, 512, 1024, 2048)
+DEFAULT_DPI = 150
+
+IMAGE_FORMATS: Dict[str, Dict[str, str]] = {
+    "jpeg": {"ext": "jpg", "media_type": "image/jpeg", "pillow": "JPEG"},
+    "png": {"ext": "png", "media_type": "image/png", "pillow": ""},
+    "webp": {"ext": "webp", "media_type": "image/webp", "pillow": "WEBP"},
+}
+LOSSY_FORMATS = ("jpeg", "webp")
+DEFAULT_QUALITY = 80
+MIN_QUALITY = 1
+MAX_QUALITY = 95
+
+
+def render_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    dpi = params.get("dpi")
+    width = params.get("width")
+    fmt = params.get("format", "png")
+    quality = params.get("quality")
+
+    if dpi is not None and width is not None:
+        raise ValueError("dpi and width are mutually exclusive")
+    if width is None:
+        dpi = DEFAULT_DPI if dpi is None else dpi
+        if not isinstance(dpi, int) or dpi not in ALLOWED_DPI:
+            raise ValueError(f"dpi must be one of {list(ALLOWED_DPI)}")
+    elif not isinstance(width, int) or width not in ALLOWED_WIDTHS:
+        raise ValueError(f"width must be one of {list(ALLOWED_WIDTHS)}")
+
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"format must be one of {sorted(IMAGE_FORMATS)}")
+    if fmt in LOSSY_FORMATS:
+        quality = DEFAULT_QUALITY if quality is None else quality
+        if not isinstance(quality, int) or not (MIN_QUALITY <= quality <= MAX_QUALITY):
+            raise ValueError(f"quality must be an int in [{MIN_QUALITY}, {MAX_QUALITY}]")
+    elif quality is not None:
+        raise ValueError("quality applies only to jpeg and webp")
+
+    return sort_dict({"dpi": dpi, "format": fmt, "quality": quality, "width": width})
+
+
+def require_image_encoder(options: Dict[str, Any], registry: RegistryLike) -> None:
+    if IMAGE_FORMATS[options["format"]]["pillow"] and not is_available(registry.snapshot(), "image_encoder.pillow"):
+        raise ValueError("pillow_required_for_image_format")
+
+
+def image_media_type(options: Dict[str, Any]) -> str:
+    return IMAGE_FORMATS[options["format"]]["media_type"]
+
+
+def image_extension(options: Dict[str, Any]) -> str:
+    return IMAGE_FORMATS[options["format"]]["ext"]
+
+
+def render_variant(options: Dict[str, Any], renderer: str) -> str:
+    if not isinstance(renderer, str) or not renderer.strip():
+        raise ValueError("renderer must be a non-empty string")
+    size = f"d{options['dpi']}" if options["width"] is None else f"w{options['width']}"
+    quality = "" if options["quality"] is None else f"-q{options['quality']}"
+    return f"{size}{quality}-{renderer}"
+
+
+def _encode(pix: Any, options: Dict[str, Any]) -> bytes:
+    if options["format"] == "png":
+        return pix.tobytes("png")
+
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ValueError("pillow_required_for_image_format")
+
+    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    buf = io.BytesIO()
+    img.save(buf, format=IMAGE_FORMATS[options["format"]]["pillow"], quality=options["quality"])
+    return buf.getvalue()
+
+
+def render_page(pdf: Any, page: int, options: Dict[str, Any]) -> bytes:
+    import fitz
+
+    page_index = page - 1
+    if page_index < 0 or page_index >= pdf.page_count:
+        raise ValueError("page out of range")
+
+    p = pdf.load_page(page_index)
+    if options["width"] is not None:
+        scale = float(options["width"]) / float(p.rect.width)
+    else:
+        scale = float(options["dpi"]) / 72.0
+    pix = p.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+    return _encode(pix, options)
+
+
+def render_pages_from_path(
+    path: str,
+    cache_key: str,
+    byte_size: int,
+    pages: Sequence[int],
+    options: Dict[str, Any],
+) -> List[bytes]:
+    import fitz
+
+    def _open() -> Any:
+        return fitz.open(path, filetype="pdf")
+
+    with shared_document_cache().open(cache_key, byte_size, _open) as pdf:
+        return [render_page(pdf, p, options) for p in pages]
\ No newline at end of file
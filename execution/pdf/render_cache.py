@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from execution.pdf.render import image_extension, render_variant
+from storage.adapter import StorageAdapter
+
+
+class RenderCache:
+    def __init__(self, storage: StorageAdapter, prefix: str = "renders"):
+        if not isinstance(prefix, str) or not prefix.strip():
+            raise ValueError("prefix must be a non-empty string")
+        self._storage = storage
+        self._prefix = prefix.strip("/")
+
+    def key(self, content_sha256: str, page: int, options: Dict[str, Any], renderer: str) -> str:
+        if not isinstance(content_sha256, str) or len(content_sha256) != 64:
+            raise ValueError("content_sha256 must be a sha256 hex digest")
+        if not isinstance(page, int) or page < 1:
+            raise ValueError("page must be an int >= 1")
+        return f"{self._prefix}/{content_sha256}/p{page}-{render_variant(options, renderer)}.{image_extension(options)}"
+
+    def get(self, content_sha256: str, page: int, options: Dict[str, Any], renderer: str) -> Optional[bytes]:
+        try:
+            return self._storage.get_bytes(self.key(content_sha256, page, options, renderer))
+        except FileNotFoundError:
+            return None
+
+    def put(self, content_sha256: str, page: int, options: Dict[str, Any], renderer: str, data: bytes) -> None:
+        self._storage.put_bytes(self.key(content_sha256, page, options, renderer), data, overwrite=True)
\ No newline at end of file
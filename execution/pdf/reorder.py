@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from core.capability_registry import RegistryLike
 from core.ordering import sort_dict
 from services.document_service import DocumentService
+from execution.pdf.document_cache import DocumentCache
+from execution.pdf.document_source import cached_fitz_document
 from execution.pdf.provider_registry import resolve_pdf_provider
-from execution.pdf.canonicalize import canonicalize_pdf
+from execution.pdf.canonicalize import canonicalize_for_mode, canonicalize_mode
+from execution.pdf.canonicalize_cache import CanonicalizeCache
+from execution.pdf.page_runs import insert_page_runs
 
 
-def make_pdf_reorder_execution(documents: DocumentService):
+def make_pdf_reorder_execution(
+    documents: DocumentService,
+    registry: Optional[RegistryLike] = None,
+    document_cache: Optional[DocumentCache] = None,
+    canonicalize_cache: Optional[CanonicalizeCache] = None,
+):
     def _exec(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
         input_ref = payload.get("input_ref")
         params = payload.get("params")
@@ -28,7 +38,9 @@ def make_pdf_reorder_execution(documents: DocumentService):
         if not all(isinstance(p, int) and p >= 1 for p in pages):
             raise ValueError("pages must be integers >= 1")
 
-        provider_res = resolve_pdf_provider("pdf.reorder")
+        mode = canonicalize_mode(params)
+
+        provider_res = resolve_pdf_provider("pdf.reorder", registry=registry)
         if provider_res.get("degraded") or not provider_res.get("provider"):
             raise ValueError("no_pdf_provider_available_for_reorder")
 
@@ -36,27 +48,23 @@ def make_pdf_reorder_execution(documents: DocumentService):
         provider_version = provider_res.get("provider_version", "")
 
         rec = documents.get_document(document_id)
-        pdf_bytes = documents.load_bytes(rec)
 
         if provider != "pymupdf":
             raise ValueError("reorder requires pymupdf")
 
         import fitz
 
-        src = fitz.open(stream=pdf_bytes, filetype="pdf")
-        out = fitz.open()
-        try:
-            for p in pages:
-                idx = p - 1
-                if idx < 0 or idx >= src.page_count:
+        with cached_fitz_document(documents, rec, cache=document_cache) as src:
+            out = fitz.open()
+            try:
+                if max(pages) > src.page_count:
                     raise ValueError("page out of range")
-                out.insert_pdf(src, from_page=idx, to_page=idx)
-            new_bytes = out.write()
-        finally:
-            src.close()
-            out.close()
+                insert_page_runs(out, src, [p - 1 for p in pages])
+                new_bytes = out.write(no_new_id=True)
+            finally:
+                out.close()
 
-        canon = canonicalize_pdf(new_bytes)
+        canon = canonicalize_for_mode(new_bytes, mode, registry=registry, cache=canonicalize_cache)
 
         manifest = sort_dict(
             {
@@ -65,6 +73,7 @@ def make_pdf_reorder_execution(documents: DocumentService):
                 "page_base": 1,
                 "pages": list(pages),
                 "canonicalization": canon.manifest,
+                "canonicalize": mode,
             }
         )
 
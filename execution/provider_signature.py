@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+from core.capability_registry import RegistryLike
+from core.ordering import sort_dict
+from execution.pdf.canonicalize_provider_registry import resolve_canonicalizer
+from execution.pdf.provider_registry import resolve_pdf_provider
+from execution.tables.provider_registry import resolve_table_provider
+
+
+PDF_OUTPUT_OPERATIONS = {"pdf.merge", "pdf.reorder", "pdf.remove", "pdf.extract"}
+
+
+def make_provider_signature(registry: Optional[RegistryLike] = None) -> Callable[[str], Dict[str, Any]]:
+    def _signature(operation: str) -> Dict[str, Any]:
+        if not isinstance(operation, str) or not operation.strip():
+            raise ValueError("operation must be a non-empty string")
+
+        sig: Dict[str, Any] = {}
+        if operation.startswith("pdf."):
+            sig["pdf_engine"] = resolve_pdf_provider(operation, registry=registry)
+        if operation in PDF_OUTPUT_OPERATIONS:
+            sig["canonicalizer"] = resolve_canonicalizer(registry=registry)
+        if operation == "tables.detect":
+            sig["table_engine"] = resolve_table_provider(registry=registry)
+        return sort_dict(sig)
+
+    return _signature
\ No newline at end of file
@@ -3,8 +3,11 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from core.capability_registry import RegistryLike
 from core.ordering import sort_dict
 from services.document_service import DocumentService
+from execution.page_pool import MIN_PARALLEL_PAGES, PagePool, shared_page_pool
+from execution.pdf.document_source import document_source
 from execution.tables.provider_registry import resolve_table_provider
 from execution.tables.normalization import normalize_grid
 
@@ -30,7 +33,103 @@ def _bbox_pdfplumber_to_pdf_points(page_height: float, bbox: Tuple[float, float,
     return [float(x0), float(y0), float(x1), float(y1)]
 
 
-def make_tables_detect_execution(documents: DocumentService):
+PLUMBER_TABLE_SETTINGS: Dict[str, Any] = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_min_length": 3,
+    "min_words_vertical": 3,
+    "min_words_horizontal": 1,
+    "intersection_tolerance": 3,
+    "text_tolerance": 3,
+}
+
+CAMELOT_OPTIONS: Dict[str, Any] = {
+    "flavor": "lattice",
+    "strip_text": "\n",
+    "line_scale": 40,
+}
+
+PageTable = Tuple[int, List[float], List[List[str]], Optional[float]]
+
+
+def _plumber_page_tables(pdf: Any, pages: Sequence[int]) -> List[PageTable]:
+    out: List[PageTable] = []
+    for p1 in pages:
+        page = pdf.pages[p1 - 1]
+        page_h = float(page.height)
+        for tb in page.find_tables(table_settings=PLUMBER_TABLE_SETTINGS):
+            bbox = _bbox_pdfplumber_to_pdf_points(page_h, tb.bbox)
+            out.append((int(p1), bbox, normalize_grid(tb.extract()), None))
+    return out
+
+
+def detect_plumber_pages_from_path(path: str, pages: Sequence[int]) -> List[PageTable]:
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return _plumber_page_tables(pdf, pages)
+
+
+def detect_camelot_pages_from_path(path: str, pages_arg: str) -> List[PageTable]:
+    import camelot
+
+    out: List[PageTable] = []
+    for t in camelot.read_pdf(path, pages=pages_arg, **CAMELOT_OPTIONS):
+        bbox = getattr(t, "_bbox", None)
+        if bbox is None:
+            raise ValueError("camelot_table_bbox_missing")
+
+        x0, y0, x1, y1 = bbox
+        conf = None
+        try:
+            rep = getattr(t, "parsing_report", None)
+            if isinstance(rep, dict):
+                acc = rep.get("accuracy")
+                if isinstance(acc, (int, float)):
+                    conf = float(acc)
+        except Exception:
+            conf = None
+
+        out.append(
+            (
+                int(getattr(t, "page", 0)),
+                [float(x0), float(y0), float(x1), float(y1)],
+                normalize_grid(t.df.values.tolist()),
+                conf,
+            )
+        )
+    return out
+
+
+def _pdf_page_count(path: str) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(path).pages)
+
+
+def _indexed_tables(found: Sequence[PageTable]) -> List[Dict[str, Any]]:
+    return [
+        sort_dict(
+            {
+                "page": page,
+                "table_index": i + 1,
+                "bbox": bbox,
+                "grid": grid,
+                "confidence": conf,
+            }
+        )
+        for i, (page, bbox, grid, conf) in enumerate(found)
+    ]
+
+
+def make_tables_detect_execution(
+    documents: DocumentService,
+    registry: Optional[RegistryLike] = None,
+    page_pool: Optional[PagePool] = None,
+    min_parallel_pages: int = MIN_PARALLEL_PAGES,
+):
     def _exec(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
         if not isinstance(payload, dict):
             raise ValueError("payload must be a dict")
@@ -49,7 +148,7 @@ def make_tables_detect_execution(documents: DocumentService):
         if not isinstance(document_id, str) or not document_id.strip():
             raise ValueError("document_id must be a non-empty string")
 
-        provider_res = resolve_table_provider()
+        provider_res = resolve_table_provider(registry=registry)
         if provider_res.get("degraded") is True or not provider_res.get("provider"):
             raise ValueError("no_table_provider_available")
 
@@ -57,7 +156,6 @@ def make_tables_detect_execution(documents: DocumentService):
         provider_version = str(provider_res.get("provider_version", ""))
 
         doc_record = documents.get_document(document_id)
-        pdf_bytes = documents.load_bytes(doc_record)
 
         schema_version = "v1"
         page_base = 1
@@ -65,24 +163,20 @@ def make_tables_detect_execution(documents: DocumentService):
         tables_out: List[Dict[str, Any]] = []
         parameters: Dict[str, Any] = {}
 
+        pool = page_pool if page_pool is not None else shared_page_pool()
+        path = documents.local_path(doc_record)
+
         if provider == "camelot":
             import tempfile
             from pathlib import Path
 
-            import camelot
-
-            parameters = sort_dict(
-                {
-                    "engine": "camelot",
-                    "flavor": "lattice",
-                    "strip_text": "\n",
-                    "line_scale": 40,
-                }
-            )
+            import camelot  # noqa: F401
 
             with tempfile.TemporaryDirectory() as td:
-                p = Path(td) / "in.pdf"
-                p.write_bytes(pdf_bytes)
+                p = path
+                if p is None:
+                    p = Path(td) / "in.pdf"
+                    p.write_bytes(documents.load_bytes(doc_record))
 
                 if pages_req is None:
                     pages_arg = "all"
@@ -91,51 +185,31 @@ def make_tables_detect_execution(documents: DocumentService):
                     pages_arg = ",".join(str(x) for x in pages_req)
                     pages_list_for_manifest = list(pages_req)
 
-                tlist = camelot.read_pdf(
-                    str(p),
-                    pages=pages_arg,
-                    flavor="lattice",
-                    strip_text="\n",
-                    line_scale=40,
-                )
-
-                for i, t in enumerate(tlist):
-                    page_num = int(getattr(t, "page", 0))
-                    bbox = getattr(t, "_bbox", None)
-                    if bbox is None:
-                        raise ValueError("camelot_table_bbox_missing")
-
-                    x0, y0, x1, y1 = bbox
-                    grid = normalize_grid(t.df.values.tolist())
-
-                    conf = None
-                    try:
-                        rep = getattr(t, "parsing_report", None)
-                        if isinstance(rep, dict):
-                            acc = rep.get("accuracy")
-                            if isinstance(acc, (int, float)):
-                                conf = float(acc)
-                    except Exception:
-                        conf = None
-
-                    tables_out.append(
-                        sort_dict(
-                            {
-                                "page": page_num,
-                                "table_index": int(i + 1),
-                                "bbox": [float(x0), float(y0), float(x1), float(y1)],
-                                "grid": grid,
-                                "confidence": conf,
-                            }
-                        )
-                    )
+                # pages_req is already sorted and de-duplicated, so each chunk's
+                # tables come back in the same (page, table) order as one serial
+                # read_pdf call. The page count is only needed when the pool can
+                # actually fan out.
+                chunks: List[List[int]] = []
+                if path is not None and pool.max_workers > 1:
+                    if pages_req is not None:
+                        all_pages = list(pages_req)
+                    else:
+                        all_pages = list(range(1, _pdf_page_count(str(p)) + 1))
+                    chunks = pool.plan(all_pages, min_parallel_pages)
+
+                if len(chunks) > 1:
+                    calls = [(str(p), ",".join(str(x) for x in chunk)) for chunk in chunks]
+                    found = [t for part in pool.map(detect_camelot_pages_from_path, calls) for t in part]
+                else:
+                    found = detect_camelot_pages_from_path(str(p), pages_arg)
+                tables_out = _indexed_tables(found)
 
                 parameters = sort_dict(
                     {
                         "engine": "camelot",
-                        "flavor": "lattice",
-                        "strip_text": "\n",
-                        "line_scale": 40,
+                        "flavor": CAMELOT_OPTIONS["flavor"],
+                        "strip_text": CAMELOT_OPTIONS["strip_text"],
+                        "line_scale": CAMELOT_OPTIONS["line_scale"],
                         "pages": pages_list_for_manifest,
                     }
                 )
@@ -146,24 +220,12 @@ def make_tables_detect_execution(documents: DocumentService):
             parameters = sort_dict(
                 {
                     "engine": "pdfplumber",
-                    "table_settings": sort_dict(
-                        {
-                            "vertical_strategy": "lines",
-                            "horizontal_strategy": "lines",
-                            "snap_tolerance": 3,
-                            "join_tolerance": 3,
-                            "edge_min_length": 3,
-                            "min_words_vertical": 3,
-                            "min_words_horizontal": 1,
-                            "intersection_tolerance": 3,
-                            "text_tolerance": 3,
-                        }
-                    ),
+                    "table_settings": sort_dict(dict(PLUMBER_TABLE_SETTINGS)),
                     "pages": pages_req,
                 }
             )
 
-            with pdfplumber.open(pdf_bytes) as pdf:
+            with pdfplumber.open(document_source(documents, doc_record)) as pdf:
                 page_count = len(pdf.pages)
                 if pages_req is None:
                     page_indices = list(range(1, page_count + 1))
@@ -172,39 +234,14 @@ def make_tables_detect_execution(documents: DocumentService):
                     if len(page_indices) != len(pages_req):
                         raise ValueError("page out of range")
 
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "edge_min_length": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "intersection_tolerance": 3,
-                    "text_tolerance": 3,
-                }
+                chunks = pool.plan(page_indices, min_parallel_pages) if path is not None else [page_indices]
+                if len(chunks) <= 1:
+                    found = _plumber_page_tables(pdf, page_indices)
 
-                t_idx = 1
-                for p1 in page_indices:
-                    page = pdf.pages[p1 - 1]
-                    page_h = float(page.height)
-                    found = page.find_tables(table_settings=table_settings)
-                    for tb in found:
-                        bbox = _bbox_pdfplumber_to_pdf_points(page_h, tb.bbox)
-                        raw = tb.extract()
-                        grid = normalize_grid(raw)
-                        tables_out.append(
-                            sort_dict(
-                                {
-                                    "page": int(p1),
-                                    "table_index": int(t_idx),
-                                    "bbox": bbox,
-                                    "grid": grid,
-                                    "confidence": None,
-                                }
-                            )
-                        )
-                        t_idx += 1
+            if len(chunks) > 1:
+                calls = [(str(path), chunk) for chunk in chunks]
+                found = [t for part in pool.map(detect_plumber_pages_from_path, calls) for t in part]
+            tables_out = _indexed_tables(found)
 
         else:
             raise ValueError("selected_table_provider_not_supported")
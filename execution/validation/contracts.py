@@ -4,11 +4,12 @@ from typing import Dict, Set
 
 
 OPERATION_PARAM_CONTRACT: Dict[str, Set[str]] = {
-    "pdf.preview": {"document_id", "page", "dpi"},
-    "pdf.merge": set(),
-    "pdf.reorder": {"pages"},
-    "pdf.remove": {"pages"},
-    "pdf.extract": {"pages"},
+    "pdf.preview": {"document_id", "page", "dpi", "width", "format", "quality"},
+    "pdf.preview.batch": {"document_id", "pages", "page_range", "dpi", "width", "format", "quality"},
+    "pdf.merge": {"canonicalize", "streaming"},
+    "pdf.reorder": {"pages", "canonicalize"},
+    "pdf.remove": {"pages", "canonicalize"},
+    "pdf.extract": {"pages", "canonicalize"},
     "tables.detect": {"document_id", "pages"},
     "tables.export.csv": {"table_detection_bytes", "include_header", "header_row_index"},
     "tables.export.jsonl": {"table_detection_bytes"},
@@ -2,18 +2,27 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from core.capability_registry import build_registry
+from core.capability_registry import shared_registry
 from core.execution_policy import ExecutionPolicy
 from core.ids import make_artifact_id, sha256_hex
 from domain.artifact import ArtifactRecord
-from storage.adapter import StorageAdapter
+from storage.adapter import Spool, StorageAdapter
+from storage.cas import BlobStore, artifact_blob_ref
+from storage.catalog import Catalog, InMemoryCatalog
 
 
 class ArtifactService:
-    def __init__(self, storage: StorageAdapter, policy: Optional[ExecutionPolicy] = None):
+    def __init__(
+        self,
+        storage: StorageAdapter,
+        policy: Optional[ExecutionPolicy] = None,
+        catalog: Optional[Catalog] = None,
+        blob_store: Optional[BlobStore] = None,
+    ):
         self._storage = storage
-        self._policy = policy if policy is not None else ExecutionPolicy(build_registry())
-        self._by_id: Dict[str, ArtifactRecord] = {}
+        self._policy = policy if policy is not None else ExecutionPolicy(shared_registry())
+        self._catalog = catalog if catalog is not None else InMemoryCatalog()
+        self._blob_store = blob_store
 
     @property
     def storage(self) -> StorageAdapter:
@@ -29,6 +38,7 @@ class ArtifactService:
         manifest: Optional[Dict[str, Any]] = None,
         job_id: str = "",
         compute_content_sha256: bool = True,
+        operation: str = "",
     ) -> ArtifactRecord:
         if not isinstance(kind, str) or not kind.strip():
             raise ValueError("kind must be a non-empty string")
@@ -45,16 +55,65 @@ class ArtifactService:
         if not isinstance(job_id, str):
             raise ValueError("job_id must be a string")
 
-        artifact_id = make_artifact_id(kind=kind, input_ref=input_ref, params=params)
-        storage_key = f"artifacts/{artifact_id}.bin"
+        artifact_id = make_artifact_id(kind=kind, input_ref=input_ref, params=params, operation=operation)
+        if self._blob_store is not None:
+            digest = sha256_hex(data)
+            storage_key = self._blob_store.put_bytes(artifact_blob_ref(artifact_id), data, content_sha256=digest)
+            content_sha = digest if compute_content_sha256 else None
+        else:
+            storage_key = f"artifacts/{artifact_id}.bin"
+            self._storage.put_bytes(storage_key, bytes(data), overwrite=True)
+            content_sha = sha256_hex(bytes(data)) if compute_content_sha256 else None
+
+        rec = ArtifactRecord(
+            artifact_id=artifact_id,
+            byte_size=len(bytes(data)),
+            content_sha256=content_sha,
+            job_id=job_id,
+            kind=kind,
+            manifest=dict(manifest) if manifest is not None else None,
+            media_type=media_type,
+            storage_key=storage_key,
+        )
+        self._catalog.put_artifact(rec)
+        return rec
 
-        self._storage.put_bytes(storage_key, bytes(data), overwrite=True)
+    def create_from_spool(
+        self,
+        kind: str,
+        input_ref: Dict[str, Any],
+        params: Dict[str, Any],
+        spool: Spool,
+        media_type: str = "application/octet-stream",
+        manifest: Optional[Dict[str, Any]] = None,
+        job_id: str = "",
+        operation: str = "",
+    ) -> ArtifactRecord:
+        if not isinstance(kind, str) or not kind.strip():
+            raise ValueError("kind must be a non-empty string")
+        if not isinstance(input_ref, dict):
+            raise ValueError("input_ref must be a dict")
+        if not isinstance(params, dict):
+            raise ValueError("params must be a dict")
+        if not isinstance(spool, Spool):
+            raise ValueError("spool must be a Spool")
+        if not isinstance(media_type, str) or not media_type.strip():
+            raise ValueError("media_type must be a non-empty string")
+        if manifest is not None and not isinstance(manifest, dict):
+            raise ValueError("manifest must be a dict if provided")
 
-        content_sha = sha256_hex(bytes(data)) if compute_content_sha256 else None
+        artifact_id = make_artifact_id(kind=kind, input_ref=input_ref, params=params, operation=operation)
+        content_sha = spool.sha256
+        byte_size = spool.size
+        if self._blob_store is not None:
+            storage_key = self._blob_store.put_spool(artifact_blob_ref(artifact_id), spool)
+        else:
+            storage_key = f"artifacts/{artifact_id}.bin"
+            spool.commit(storage_key, overwrite=True)
 
         rec = ArtifactRecord(
             artifact_id=artifact_id,
-            byte_size=len(bytes(data)),
+            byte_size=byte_size,
             content_sha256=content_sha,
             job_id=job_id,
             kind=kind,
@@ -62,12 +121,54 @@ class ArtifactService:
             media_type=media_type,
             storage_key=storage_key,
         )
-        self._by_id[artifact_id] = rec
+        self._catalog.put_artifact(rec)
         return rec
 
+    def replace(
+        self,
+        record: ArtifactRecord,
+        data: bytes,
+        manifest: Optional[Dict[str, Any]] = None,
+    ) -> ArtifactRecord:
+        if not isinstance(record, ArtifactRecord):
+            raise ValueError("record must be an ArtifactRecord")
+        if not isinstance(data, (bytes, bytearray)):
+            raise ValueError("data must be bytes")
+        if manifest is not None and not isinstance(manifest, dict):
+            raise ValueError("manifest must be a dict if provided")
+
+        digest = sha256_hex(data)
+        if self._blob_store is not None:
+            swap_ref = artifact_blob_ref(record.artifact_id) + "#swap"
+            storage_key = self._blob_store.put_bytes(swap_ref, data, content_sha256=digest)
+        else:
+            storage_key = f"artifacts/{record.artifact_id}.bin"
+            self._storage.put_bytes(storage_key, bytes(data), overwrite=True)
+
+        rec = ArtifactRecord(
+            artifact_id=record.artifact_id,
+            byte_size=len(bytes(data)),
+            content_sha256=digest if record.content_sha256 is not None else None,
+            job_id=record.job_id,
+            kind=record.kind,
+            manifest=dict(manifest) if manifest is not None else record.manifest,
+            media_type=record.media_type,
+            storage_key=storage_key,
+        )
+        self._catalog.put_artifact(rec)
+
+        if self._blob_store is not None:
+            self._blob_store.put_bytes(artifact_blob_ref(record.artifact_id), data, content_sha256=digest)
+            self._blob_store.release(swap_ref)
+        return rec
+
+    def register(self, record: ArtifactRecord) -> ArtifactRecord:
+        if not isinstance(record, ArtifactRecord):
+            raise ValueError("record must be an ArtifactRecord")
+        self._catalog.put_artifact(record)
+        return record
+
     def get(self, artifact_id: str) -> ArtifactRecord:
         if not isinstance(artifact_id, str) or not artifact_id.strip():
             raise ValueError("artifact_id must be a non-empty string")
-        if artifact_id not in self._by_id:
-            raise KeyError(artifact_id)
-        return self._by_id[artifact_id]
\ No newline at end of file
+        return self._catalog.get_artifact(artifact_id)
\ No newline at end of file
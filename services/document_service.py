@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from core.capability_registry import build_registry
+from core.capability_registry import shared_registry
 from core.execution_policy import ExecutionPolicy
-from core.ids import DocumentIdStrategy, HybridDocumentIdStrategy, document_identity_from_bytes
+from core.ids import (
+    DocumentIdentity,
+    DocumentIdStrategy,
+    HybridDocumentIdStrategy,
+    document_identity_from_bytes,
+    document_identity_from_digest,
+)
 from domain.document import DocumentRecord
-from storage.adapter import StorageAdapter
+from storage.adapter import Spool, StorageAdapter
+from storage.cas import BlobStore, document_blob_ref
+from storage.catalog import Catalog, InMemoryCatalog
 
 
 class DocumentService:
@@ -16,29 +25,33 @@ class DocumentService:
         id_strategy: Optional[DocumentIdStrategy] = None,
         policy: Optional[ExecutionPolicy] = None,
         session_namespace: str = "default_session",
+        catalog: Optional[Catalog] = None,
+        blob_store: Optional[BlobStore] = None,
     ):
         if not isinstance(session_namespace, str) or not session_namespace.strip():
             raise ValueError("session_namespace must be a non-empty string")
         self._storage = storage
         self._id_strategy = id_strategy if id_strategy is not None else HybridDocumentIdStrategy()
-        self._policy = policy if policy is not None else ExecutionPolicy(build_registry())
+        self._policy = policy if policy is not None else ExecutionPolicy(shared_registry())
         self._session_namespace = session_namespace
-        self._docs_by_id: Dict[str, DocumentRecord] = {}
+        self._catalog = catalog if catalog is not None else InMemoryCatalog()
+        self._blob_store = blob_store
 
     @property
     def storage(self) -> StorageAdapter:
         return self._storage
 
-    def ingest(
+    @property
+    def catalog(self) -> Catalog:
+        return self._catalog
+
+    def _validate_ingest(
         self,
-        data: bytes,
         ingest_index: int,
-        filename: str = "",
-        media_type: str = "application/octet-stream",
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> DocumentRecord:
-        if not isinstance(data, (bytes, bytearray)):
-            raise ValueError("data must be bytes")
+        filename: str,
+        media_type: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
         if not isinstance(ingest_index, int) or ingest_index < 0:
             raise ValueError("ingest_index must be a non-negative int")
         if not isinstance(filename, str):
@@ -48,20 +61,19 @@ class DocumentService:
         if metadata is not None and not isinstance(metadata, dict):
             raise ValueError("metadata must be a dict if provided")
 
-        identity = document_identity_from_bytes(
-            data=bytes(data),
-            strategy=self._id_strategy,
-            session_namespace=self._session_namespace,
-            ingest_index=ingest_index,
-        )
-
-        storage_key = f"documents/{identity.document_id}"
-        self._storage.put_bytes(storage_key, bytes(data), overwrite=True)
-
+    def _register(
+        self,
+        identity: DocumentIdentity,
+        storage_key: str,
+        byte_size: int,
+        filename: str,
+        media_type: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> DocumentRecord:
         meta = dict(metadata) if metadata is not None else {}
 
         record = DocumentRecord(
-            byte_size=len(bytes(data)),
+            byte_size=byte_size,
             content_sha256=identity.content_sha256,
             document_id=identity.document_id,
             filename=filename,
@@ -72,20 +84,131 @@ class DocumentService:
             storage_key=storage_key,
         )
 
-        self._docs_by_id[record.document_id] = record
+        self._catalog.put_document(record)
         return record
 
+    def ingest(
+        self,
+        data: bytes,
+        ingest_index: int,
+        filename: str = "",
+        media_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> DocumentRecord:
+        if not isinstance(data, (bytes, bytearray)):
+            raise ValueError("data must be bytes")
+        self._validate_ingest(ingest_index, filename, media_type, metadata)
+
+        identity = document_identity_from_bytes(
+            data=data,
+            strategy=self._id_strategy,
+            session_namespace=self._session_namespace,
+            ingest_index=ingest_index,
+        )
+
+        if self._blob_store is not None:
+            storage_key = self._blob_store.put_bytes(
+                document_blob_ref(identity.document_id),
+                data,
+                content_sha256=identity.content_sha256,
+            )
+        else:
+            storage_key = f"documents/{identity.document_id}"
+            self._storage.put_bytes(storage_key, data, overwrite=True)
+
+        return self._register(identity, storage_key, len(data), filename, media_type, metadata)
+
+    def ingest_stream(
+        self,
+        chunks: Iterable[bytes],
+        ingest_index: int,
+        filename: str = "",
+        media_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, Any]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> DocumentRecord:
+        self._validate_ingest(ingest_index, filename, media_type, metadata)
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 0):
+            raise ValueError("max_bytes must be a non-negative int if provided")
+
+        with self._storage.open_spool() as spool:
+            for chunk in chunks:
+                spool.write(chunk)
+                if max_bytes is not None and spool.size > max_bytes:
+                    raise ValueError("upload size limit exceeded")
+            return self._ingest_spool(spool, ingest_index, filename, media_type, metadata)
+
+    def ingest_spool(
+        self,
+        spool: Spool,
+        ingest_index: int,
+        filename: str = "",
+        media_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> DocumentRecord:
+        if not isinstance(spool, Spool):
+            raise ValueError("spool must be a Spool")
+        with spool:
+            self._validate_ingest(ingest_index, filename, media_type, metadata)
+            return self._ingest_spool(spool, ingest_index, filename, media_type, metadata)
+
+    def _ingest_spool(
+        self,
+        spool: Spool,
+        ingest_index: int,
+        filename: str,
+        media_type: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> DocumentRecord:
+        identity = document_identity_from_digest(
+            content_sha256=spool.sha256,
+            strategy=self._id_strategy,
+            session_namespace=self._session_namespace,
+            ingest_index=ingest_index,
+        )
+
+        byte_size = spool.size
+        if self._blob_store is not None:
+            storage_key = self._blob_store.put_spool(document_blob_ref(identity.document_id), spool)
+        else:
+            storage_key = f"documents/{identity.document_id}"
+            spool.commit(storage_key, overwrite=True)
+
+        return self._register(identity, storage_key, byte_size, filename, media_type, metadata)
+
     def load_bytes(self, doc: DocumentRecord) -> bytes:
         return self._storage.get_bytes(doc.storage_key)
 
+    def load_view(self, doc: DocumentRecord) -> memoryview:
+        return self._storage.open_mmap(doc.storage_key)
+
+    def local_path(self, doc: DocumentRecord) -> Optional[Path]:
+        return self._storage.local_path(doc.storage_key)
+
     def get_document(self, document_id: str) -> DocumentRecord:
         if not isinstance(document_id, str) or not document_id.strip():
             raise ValueError("document_id must be a non-empty string")
-        if document_id not in self._docs_by_id:
-            raise KeyError(document_id)
-        return self._docs_by_id[document_id]
+        return self._catalog.get_document(document_id)
 
     def list_documents(self) -> List[DocumentRecord]:
-        items = list(self._docs_by_id.values())
-        items.sort(key=lambda d: (d.ingest_index, d.document_id))
-        return items
\ No newline at end of file
+        return self._catalog.list_documents()
+
+    def list_workspace_documents(
+        self,
+        workspace_id: str,
+        after: Optional[Tuple[int, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[DocumentRecord]:
+        if not isinstance(workspace_id, str):
+            raise ValueError("workspace_id must be a string")
+        if after is not None:
+            if (
+                not isinstance(after, tuple)
+                or len(after) != 2
+                or not isinstance(after[0], int)
+                or not isinstance(after[1], str)
+            ):
+                raise ValueError("after must be an (ingest_index, document_id) tuple if provided")
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            raise ValueError("limit must be a positive int if provided")
+        return self._catalog.list_workspace_documents(workspace_id, after=after, limit=limit)
\ No newline at end of file
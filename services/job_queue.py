@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from core.errors import ErrorCode, JobQueueFullError, failure
+from core.ids import make_job_id
+from core.ordering import sort_dict
+from domain.job import JobRecord, JobStatus
+from services.job_service import JobService
+
+
+_FINISHED = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.BLOCKED)
+
+
+class _Entry:
+    def __init__(self, record: JobRecord):
+        self.record = record
+        self.deferred: Optional[JobRecord] = None
+        self.done = threading.Event()
+
+
+class JobQueue:
+    def __init__(
+        self,
+        jobs: JobService,
+        workers: int = 4,
+        max_depth: int = 64,
+        max_records: int = 10000,
+    ):
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be an int >= 1")
+        if not isinstance(max_depth, int) or max_depth < 1:
+            raise ValueError("max_depth must be an int >= 1")
+        if not isinstance(max_records, int) or max_records < 1:
+            raise ValueError("max_records must be an int >= 1")
+        self._jobs = jobs
+        self._workers = workers
+        self._max_depth = max_depth
+        self._max_records = max_records
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_depth)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._threads: List[threading.Thread] = []
+        jobs.subscribe(self._on_update)
+
+    def submit(
+        self,
+        operation: str,
+        input_ref: Dict[str, Any],
+        params: Dict[str, Any],
+        required_capability: Optional[str] = None,
+        provider_preference: Optional[list[str]] = None,
+    ) -> JobRecord:
+        job_id = make_job_id(operation, input_ref, params)
+
+        with self._lock:
+            existing = self._entries.get(job_id)
+            if existing is not None and existing.record.status in (
+                JobStatus.PENDING,
+                JobStatus.RUNNING,
+                JobStatus.COMPLETED,
+            ):
+                return existing.record
+
+            entry = _Entry(
+                JobRecord(
+                    job_id=job_id,
+                    operation=operation,
+                    status=JobStatus.PENDING,
+                    input_ref=dict(input_ref),
+                    params=dict(params),
+                )
+            )
+            item = {
+                "input_ref": dict(input_ref),
+                "job_id": job_id,
+                "operation": operation,
+                "params": dict(params),
+                "provider_preference": provider_preference,
+                "required_capability": required_capability,
+            }
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                raise JobQueueFullError(
+                    failure(
+                        ErrorCode.QUEUE_FULL,
+                        "job queue is full",
+                        {"max_depth": self._max_depth},
+                    )
+                )
+            self._entries[job_id] = entry
+            self._entries.move_to_end(job_id)
+            self._evict_locked()
+            self._ensure_workers_locked()
+
+        return entry.record
+
+    def get(self, job_id: str) -> JobRecord:
+        if not isinstance(job_id, str) or not job_id.strip():
+            raise ValueError("job_id must be a non-empty string")
+        with self._lock:
+            if job_id not in self._entries:
+                raise KeyError(job_id)
+            return self._entries[job_id].record
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> JobRecord:
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout < 0):
+            raise ValueError("timeout must be a non-negative number")
+        with self._lock:
+            if job_id not in self._entries:
+                raise KeyError(job_id)
+            entry = self._entries[job_id]
+        entry.done.wait(timeout)
+        return entry.record
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return sort_dict(
+                {
+                    "depth": self._queue.qsize(),
+                    "max_depth": self._max_depth,
+                    "tracked": len(self._entries),
+                    "workers": len(self._threads),
+                }
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            threads = list(self._threads)
+            self._threads = []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for t in threads:
+                t.join()
+
+    def _ensure_workers_locked(self) -> None:
+        while len(self._threads) < self._workers:
+            t = threading.Thread(
+                target=self._work,
+                name=f"job-worker-{len(self._threads)}",
+                daemon=True,
+            )
+            self._threads.append(t)
+            t.start()
+
+    def _evict_locked(self) -> None:
+        if len(self._entries) <= self._max_records:
+            return
+        for job_id in list(self._entries.keys()):
+            if len(self._entries) <= self._max_records:
+                break
+            if self._entries[job_id].record.status in _FINISHED:
+                del self._entries[job_id]
+
+    def _set(self, job_id: str, record: JobRecord) -> None:
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return
+            # A deferred swap can finish before execute() returns; keep the
+            # swapped record instead of the raw one it supersedes.
+            if record.status == JobStatus.COMPLETED and entry.deferred is not None:
+                record = entry.deferred
+            entry.record = record
+            if record.status in _FINISHED:
+                entry.done.set()
+
+    def _on_update(self, record: JobRecord) -> None:
+        with self._lock:
+            entry = self._entries.get(record.job_id)
+            if entry is None:
+                return
+            entry.deferred = record
+            if entry.record.status == JobStatus.COMPLETED:
+                entry.record = record
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._run(item)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, item: Dict[str, Any]) -> None:
+        job_id = item["job_id"]
+        base = {
+            "input_ref": item["input_ref"],
+            "job_id": job_id,
+            "operation": item["operation"],
+            "params": item["params"],
+        }
+        self._set(job_id, JobRecord(status=JobStatus.RUNNING, **base))
+
+        try:
+            record = self._jobs.execute(
+                operation=item["operation"],
+                input_ref=item["input_ref"],
+                params=item["params"],
+                required_capability=item["required_capability"],
+                provider_preference=item["provider_preference"],
+            )
+        except ValueError as e:
+            f = failure(ErrorCode.VALIDATION_ERROR, str(e) or "invalid job", {"operation": item["operation"]})
+            record = JobRecord(status=JobStatus.FAILED, failure=f.to_dict(), **base)
+        except Exception as e:
+            f = failure(ErrorCode.INTERNAL_ERROR, "execution failed", {"error": str(e)})
+            record = JobRecord(status=JobStatus.FAILED, failure=f.to_dict(), **base)
+
+        self._set(job_id, record)
\ No newline at end of file
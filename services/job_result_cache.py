@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+from typing import Optional, Tuple
+
+from domain.artifact import ArtifactRecord
+from domain.job import JobRecord, JobStatus
+from storage.adapter import StorageAdapter
+from storage.catalog import Catalog
+
+
+class JobResultCache:
+    def __init__(self, storage: StorageAdapter, prefix: str = "jobs/results", catalog: Optional[Catalog] = None):
+        if not isinstance(prefix, str) or not prefix.strip():
+            raise ValueError("prefix must be a non-empty string")
+        self._storage = storage
+        self._prefix = prefix.strip("/")
+        self._catalog = catalog
+
+    def _key(self, result_key: str) -> str:
+        if not isinstance(result_key, str) or not result_key.strip():
+            raise ValueError("result_key must be a non-empty string")
+        return f"{self._prefix}/{result_key}.json"
+
+    def get(self, result_key: str) -> Optional[Tuple[JobRecord, ArtifactRecord]]:
+        key = self._key(result_key)
+        if not self._storage.exists(key):
+            return None
+        try:
+            obj = json.loads(self._storage.get_bytes(key).decode("utf-8"))
+            job = JobRecord(**obj["job"])
+            artifact = ArtifactRecord(**obj["artifact"])
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            return None
+        if job.status != JobStatus.COMPLETED:
+            return None
+        if not self._storage.exists(artifact.storage_key):
+            return None
+        if self._catalog is not None:
+            try:
+                current = self._catalog.get_artifact(artifact.artifact_id)
+            except KeyError:
+                current = None
+            if current is not None and current.content_sha256 != artifact.content_sha256:
+                return None
+        return job, artifact
+
+    def put(self, result_key: str, job: JobRecord, artifact: ArtifactRecord) -> None:
+        if job.status != JobStatus.COMPLETED:
+            raise ValueError("only completed jobs can be cached")
+        payload = {
+            "artifact": artifact.to_dict(),
+            "job": job.to_dict(),
+        }
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        self._storage.put_bytes(self._key(result_key), data, overwrite=True)
\ No newline at end of file
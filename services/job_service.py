@@ -1,16 +1,50 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 
 from core.execution_policy import ExecutionPolicy, ProviderResolution
 from core.errors import ErrorCode, failure
-from core.ids import HybridDocumentIdStrategy, make_job_id
+from core.ids import HybridDocumentIdStrategy, make_job_id, make_job_result_key
+from domain.artifact import ArtifactRecord
 from domain.job import JobRecord, JobStatus
 from services.artifact_service import ArtifactService
 from services.document_service import DocumentService
+from services.job_result_cache import JobResultCache
+from services.single_flight import SingleFlight
+from storage.adapter import Spool
 
 
 ExecutionFn = Callable[[Dict[str, Any]], Tuple[bytes, Dict[str, Any]]]
+ProviderSignatureFn = Callable[[str], Dict[str, Any]]
+DeferredCanonicalizeFn = Callable[[bytes, Dict[str, Any]], Tuple[bytes, Dict[str, Any]]]
+JobListener = Callable[[JobRecord], None]
+
+DEFERRED_CANONICALIZE_MODE = "deferred"
+
+logger = logging.getLogger(__name__)
+
+
+def _output_ref(artifact: ArtifactRecord) -> Dict[str, Any]:
+    output_ref = {
+        "artifact_id": artifact.artifact_id,
+        "byte_size": artifact.byte_size,
+        "content_sha256": artifact.content_sha256,
+        "kind": artifact.kind,
+        "media_type": artifact.media_type,
+        "storage_key": artifact.storage_key,
+    }
+    return {k: output_ref[k] for k in sorted(output_ref.keys())}
+
+
+class ExecutionBackend(Protocol):
+    def handles(self, operation: str) -> bool:
+        ...
+
+    def run(self, operation: str, payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
+        ...
 
 
 class JobService:
@@ -23,7 +57,15 @@ class JobService:
         document_service: Optional[DocumentService] = None,
         artifact_service: Optional[ArtifactService] = None,
         storage: Any = None,
+        result_cache: Optional[JobResultCache] = None,
+        provider_signature: Optional[ProviderSignatureFn] = None,
+        single_flight: Optional[SingleFlight] = None,
+        backend: Optional[ExecutionBackend] = None,
+        deferred_canonicalizer: Optional[DeferredCanonicalizeFn] = None,
+        deferred_workers: int = 1,
     ):
+        if not isinstance(deferred_workers, int) or deferred_workers < 1:
+            raise ValueError("deferred_workers must be an int >= 1")
         self._policy = policy
 
         self._artifacts = artifacts if artifacts is not None else artifact_service
@@ -45,6 +87,35 @@ class JobService:
             )
 
         self._execution_map = dict(execution_map) if execution_map is not None else {}
+        self._result_cache = result_cache
+        self._provider_signature = provider_signature
+        self._single_flight = single_flight if single_flight is not None else SingleFlight()
+        self._backend = backend
+        self._deferred_canonicalizer = deferred_canonicalizer
+        self._deferred_workers = deferred_workers
+        self._deferred_lock = threading.Lock()
+        self._deferred_pool: Optional[ThreadPoolExecutor] = None
+        self._deferred_futures: List[Future] = []
+        self._listeners: List[JobListener] = []
+
+    def subscribe(self, listener: JobListener) -> None:
+        with self._deferred_lock:
+            self._listeners.append(listener)
+
+    def wait_deferred(self, timeout: Optional[float] = None) -> bool:
+        with self._deferred_lock:
+            futures = list(self._deferred_futures)
+        done, not_done = wait(futures, timeout=timeout)
+        with self._deferred_lock:
+            self._deferred_futures = [f for f in self._deferred_futures if f not in done]
+        return not not_done and all(f.result() for f in done)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._deferred_lock:
+            pool = self._deferred_pool
+            self._deferred_pool = None
+        if pool is not None:
+            pool.shutdown(wait=wait)
 
     def execute(
         self,
@@ -117,6 +188,32 @@ class JobService:
 
         fn = self._execution_map[operation]
 
+        result_key: Optional[str] = None
+        if self._result_cache is not None:
+            provider = self._provider_signature(operation) if self._provider_signature is not None else {}
+            result_key = make_job_result_key(job_id, provider)
+
+        return self._single_flight.do(
+            result_key if result_key is not None else job_id,
+            lambda: self._execute_once(job_id, operation, input_ref, params, fn, result_key),
+        )
+
+    def _execute_once(
+        self,
+        job_id: str,
+        operation: str,
+        input_ref: Dict[str, Any],
+        params: Dict[str, Any],
+        fn: ExecutionFn,
+        result_key: Optional[str],
+    ) -> JobRecord:
+        if result_key is not None:
+            cached = self._result_cache.get(result_key)
+            if cached is not None:
+                cached_job, cached_artifact = cached
+                self._artifacts.register(cached_artifact)
+                return cached_job
+
         running = JobRecord(
             job_id=job_id,
             operation=operation,
@@ -128,17 +225,21 @@ class JobService:
             degradation=None,
         )
 
-        out_bytes, out_meta = fn(
-            {
-                "input_ref": dict(input_ref),
-                "job": running.to_dict(),
-                "params": dict(params),
-            }
-        )
+        payload = {
+            "input_ref": dict(input_ref),
+            "job": running.to_dict(),
+            "params": dict(params),
+        }
+        if self._backend is not None and self._backend.handles(operation):
+            out_bytes, out_meta = self._backend.run(operation, payload)
+        else:
+            out_bytes, out_meta = fn(payload)
 
-        if not isinstance(out_bytes, (bytes, bytearray)):
-            raise ValueError("execution function must return bytes")
+        if not isinstance(out_bytes, (bytes, bytearray, Spool)):
+            raise ValueError("execution function must return bytes or a spool")
         if not isinstance(out_meta, dict):
+            if isinstance(out_bytes, Spool):
+                out_bytes.discard()
             raise ValueError("execution function must return metadata dict")
 
         kind = str(out_meta.get("kind", out_meta.get("artifact_kind", "bin")))
@@ -146,34 +247,141 @@ class JobService:
         manifest = out_meta.get("manifest")
         manifest_dict = dict(manifest) if isinstance(manifest, dict) else None
 
-        artifact = self._artifacts.create(
-            kind=kind,
-            input_ref=dict(input_ref),
-            params=dict(params),
-            data=bytes(out_bytes),
-            media_type=media_type,
-            manifest=manifest_dict,
-            job_id=job_id,
-            compute_content_sha256=True,
-        )
-
-        output_ref = {
-            "artifact_id": artifact.artifact_id,
-            "byte_size": artifact.byte_size,
-            "content_sha256": artifact.content_sha256,
-            "kind": artifact.kind,
-            "media_type": artifact.media_type,
-            "storage_key": artifact.storage_key,
-        }
-        output_ref = {k: output_ref[k] for k in sorted(output_ref.keys())}
+        if isinstance(out_bytes, Spool):
+            artifact = self._artifacts.create_from_spool(
+                kind=kind,
+                input_ref=dict(input_ref),
+                params=dict(params),
+                spool=out_bytes,
+                media_type=media_type,
+                manifest=manifest_dict,
+                job_id=job_id,
+                operation=operation,
+            )
+        else:
+            artifact = self._artifacts.create(
+                kind=kind,
+                input_ref=dict(input_ref),
+                params=dict(params),
+                data=bytes(out_bytes),
+                media_type=media_type,
+                manifest=manifest_dict,
+                job_id=job_id,
+                compute_content_sha256=True,
+                operation=operation,
+            )
 
-        return JobRecord(
+        record = JobRecord(
             job_id=job_id,
             operation=operation,
             status=JobStatus.COMPLETED,
             input_ref=dict(input_ref),
             params=dict(params),
-            output_ref=output_ref,
+            output_ref=_output_ref(artifact),
             failure=None,
             degradation=None,
-        )
\ No newline at end of file
+        )
+
+        if result_key is not None:
+            self._result_cache.put(result_key, record, artifact)
+
+        if (
+            self._deferred_canonicalizer is not None
+            and not isinstance(out_bytes, Spool)
+            and manifest_dict is not None
+            and manifest_dict.get("canonicalize") == DEFERRED_CANONICALIZE_MODE
+        ):
+            self._schedule_deferred(record, artifact, bytes(out_bytes), result_key)
+
+        return record
+
+    def _schedule_deferred(
+        self,
+        record: JobRecord,
+        artifact: ArtifactRecord,
+        data: bytes,
+        result_key: Optional[str],
+    ) -> None:
+        with self._deferred_lock:
+            if self._deferred_pool is None:
+                self._deferred_pool = ThreadPoolExecutor(
+                    max_workers=self._deferred_workers,
+                    thread_name_prefix="deferred-canonicalize",
+                )
+            self._deferred_futures = [f for f in self._deferred_futures if not f.done() or not f.result()]
+            future = self._deferred_pool.submit(self._finish_deferred, record, artifact, data, result_key)
+            self._deferred_futures.append(future)
+
+    def _finish_deferred(
+        self,
+        record: JobRecord,
+        artifact: ArtifactRecord,
+        data: bytes,
+        result_key: Optional[str],
+    ) -> bool:
+        try:
+            out_bytes, manifest = self._deferred_canonicalizer(data, dict(artifact.manifest or {}))
+            swapped = self._artifacts.replace(artifact, bytes(out_bytes), manifest=manifest)
+        except Exception as exc:
+            logger.exception("deferred canonicalization failed for artifact %s", artifact.artifact_id)
+            try:
+                self._publish_deferred(record, self._record_deferred_failure(artifact, exc), result_key)
+            except Exception:
+                logger.exception("could not record deferred failure for artifact %s", artifact.artifact_id)
+            return False
+
+        try:
+            self._publish_deferred(record, swapped, result_key)
+        except Exception:
+            logger.exception("could not publish deferred result for artifact %s", artifact.artifact_id)
+            return False
+        return True
+
+    def _record_deferred_failure(self, artifact: ArtifactRecord, exc: Exception) -> ArtifactRecord:
+        f = failure(
+            ErrorCode.INTERNAL_ERROR,
+            "deferred canonicalization failed",
+            {"error": f"{type(exc).__name__}: {exc}"},
+        )
+        manifest = dict(artifact.manifest or {})
+        manifest["canonicalization"] = {
+            "canonicalized": False,
+            "degraded": True,
+            "failure": f.to_dict(),
+            "pending": False,
+        }
+        failed = ArtifactRecord(
+            artifact_id=artifact.artifact_id,
+            byte_size=artifact.byte_size,
+            content_sha256=artifact.content_sha256,
+            job_id=artifact.job_id,
+            kind=artifact.kind,
+            manifest={k: manifest[k] for k in sorted(manifest.keys())},
+            media_type=artifact.media_type,
+            storage_key=artifact.storage_key,
+        )
+        return self._artifacts.register(failed)
+
+    def _publish_deferred(
+        self,
+        record: JobRecord,
+        swapped: ArtifactRecord,
+        result_key: Optional[str],
+    ) -> None:
+        updated = JobRecord(
+            job_id=record.job_id,
+            operation=record.operation,
+            status=record.status,
+            input_ref=dict(record.input_ref),
+            params=dict(record.params),
+            output_ref=_output_ref(swapped),
+            failure=None,
+            degradation=None,
+        )
+        if result_key is not None:
+            self._result_cache.put(result_key, updated, swapped)
+
+        with self._deferred_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(updated)
\ No newline at end of file
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.capability_registry import CachedCapabilityRegistry, CapabilityRegistry, RegistryLike, shared_registry
+from domain.document import DocumentRecord
+from services.document_service import DocumentService
+from storage.local_fs import LocalFSSpool, LocalFSStorage
+
+
+DEFAULT_PROCESS_OPERATIONS: Tuple[str, ...] = (
+    "pdf.preview",
+    "pdf.merge",
+    "pdf.reorder",
+    "pdf.remove",
+    "pdf.extract",
+    "tables.detect",
+)
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _registry_config(registry: Optional[RegistryLike]) -> Any:
+    # A CachedCapabilityRegistry holds a lock and cannot be pickled; workers
+    # rebuild one with the same TTL and probe the same host themselves.
+    if registry is None:
+        return None
+    if isinstance(registry, CachedCapabilityRegistry):
+        return {"ttl_seconds": registry.ttl_seconds}
+    return registry.snapshot()
+
+
+def _worker_registry(config: Any) -> RegistryLike:
+    if config is None:
+        return shared_registry()
+    if isinstance(config, CapabilityRegistry):
+        return config
+    return CachedCapabilityRegistry(ttl_seconds=config["ttl_seconds"])
+
+
+def _init_worker(root_dir: str, registry_config: Any = None) -> None:
+    from execution.page_pool import PagePool, preload_modules
+    from execution.pdf.canonicalize_cache import CanonicalizeCache
+    from execution.pdf.render_cache import RenderCache
+
+    preload_modules()
+    storage = LocalFSStorage(root_dir)
+    _worker_state["storage"] = storage
+    _worker_state["registry"] = _worker_registry(registry_config)
+    _worker_state["canonicalize_cache"] = CanonicalizeCache(storage)
+    _worker_state["render_cache"] = RenderCache(storage)
+    _worker_state["page_pool"] = PagePool(max_workers=1)
+
+
+def _ping() -> bool:
+    return True
+
+
+class _WorkerDocuments:
+    def __init__(self, storage: LocalFSStorage, records: Dict[str, Dict[str, Any]]):
+        self._storage = storage
+        self._records = dict(records)
+
+    @property
+    def storage(self) -> LocalFSStorage:
+        return self._storage
+
+    def get_document(self, document_id: str) -> DocumentRecord:
+        if not isinstance(document_id, str) or not document_id.strip():
+            raise ValueError("document_id must be a non-empty string")
+        if document_id not in self._records:
+            raise KeyError(document_id)
+        return DocumentRecord(**self._records[document_id])
+
+    def load_bytes(self, doc: DocumentRecord) -> bytes:
+        return self._storage.get_bytes(doc.storage_key)
+
+    def load_view(self, doc: DocumentRecord) -> memoryview:
+        return self._storage.open_mmap(doc.storage_key)
+
+    def local_path(self, doc: DocumentRecord) -> Optional[Path]:
+        return self._storage.local_path(doc.storage_key)
+
+
+def _build_execution(operation: str, documents: Any):
+    from execution.pdf.extract import make_pdf_extract_execution
+    from execution.pdf.merge import make_pdf_merge_execution
+    from execution.pdf.preview import make_pdf_preview_execution
+    from execution.pdf.remove import make_pdf_remove_execution
+    from execution.pdf.reorder import make_pdf_reorder_execution
+    from execution.tables.detect import make_tables_detect_execution
+
+    factories = {
+        "pdf.preview": make_pdf_preview_execution,
+        "pdf.merge": make_pdf_merge_execution,
+        "pdf.reorder": make_pdf_reorder_execution,
+        "pdf.remove": make_pdf_remove_execution,
+        "pdf.extract": make_pdf_extract_execution,
+        "tables.detect": make_tables_detect_execution,
+    }
+    if operation not in factories:
+        raise ValueError("operation is not supported by the process backend")
+    registry = _worker_state["registry"]
+    if operation == "tables.detect":
+        return make_tables_detect_execution(documents, registry=registry, page_pool=_worker_state["page_pool"])
+    if operation == "pdf.preview":
+        return make_pdf_preview_execution(documents, registry=registry, render_cache=_worker_state["render_cache"])
+    return factories[operation](documents, registry=registry, canonicalize_cache=_worker_state["canonicalize_cache"])
+
+
+def _run_in_worker(
+    operation: str,
+    payload: Dict[str, Any],
+    records: Dict[str, Dict[str, Any]],
+) -> Tuple[bytes, Dict[str, Any]]:
+    storage = _worker_state.get("storage")
+    if storage is None:
+        raise RuntimeError("process worker is not initialized")
+    fn = _build_execution(operation, _WorkerDocuments(storage, records))
+    out_bytes, out_meta = fn(payload)
+    if isinstance(out_bytes, LocalFSSpool):
+        return out_bytes.detach(), out_meta
+    return bytes(out_bytes), out_meta
+
+
+def referenced_document_ids(payload: Dict[str, Any]) -> List[str]:
+    ids: List[str] = []
+    for section in ("input_ref", "params"):
+        ref = payload.get(section)
+        if not isinstance(ref, dict):
+            continue
+        doc_id = ref.get("document_id")
+        if isinstance(doc_id, str) and doc_id.strip():
+            ids.append(doc_id)
+        docs = ref.get("documents")
+        if isinstance(docs, list):
+            ids.extend(d for d in docs if isinstance(d, str) and d.strip())
+    return sorted(set(ids))
+
+
+class ProcessPoolBackend:
+    def __init__(
+        self,
+        documents: DocumentService,
+        operations: Iterable[str] = DEFAULT_PROCESS_OPERATIONS,
+        max_workers: Optional[int] = None,
+        start_method: str = "spawn",
+        registry: Optional[RegistryLike] = None,
+    ):
+        storage = documents.storage
+        if not isinstance(storage, LocalFSStorage):
+            raise ValueError("process backend requires LocalFSStorage")
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+            raise ValueError("max_workers must be an int >= 1")
+        self._documents = documents
+        self._root_dir = str(storage.root_dir)
+        self._operations = frozenset(operations)
+        self._max_workers = max_workers if max_workers is not None else (multiprocessing.cpu_count() or 1)
+        self._start_method = start_method
+        self._registry_config = _registry_config(registry)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def handles(self, operation: str) -> bool:
+        return operation in self._operations
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context(self._start_method),
+                    initializer=_init_worker,
+                    initargs=(self._root_dir, self._registry_config),
+                )
+            return self._executor
+
+    def warm(self) -> None:
+        pool = self._pool()
+        futures = [pool.submit(_ping) for _ in range(self._max_workers)]
+        for f in futures:
+            f.result()
+
+    def run(self, operation: str, payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
+        if not self.handles(operation):
+            raise ValueError("operation is not handled by the process backend")
+
+        records: Dict[str, Dict[str, Any]] = {}
+        for doc_id in referenced_document_ids(payload):
+            try:
+                records[doc_id] = self._documents.get_document(doc_id).to_dict()
+            except KeyError:
+                continue
+
+        out, out_meta = self._pool().submit(_run_in_worker, operation, payload, records).result()
+        if isinstance(out, tuple):
+            path, sha256, size = out
+            return self._documents.storage.adopt_spool(path, sha256, size), out_meta
+        return out, out_meta
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
\ No newline at end of file
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
+
+from storage.file_lock import DEFAULT_LOCK_STRIPES, StripedFileLock, file_locks_supported
+
+
+T = TypeVar("T")
+
+_KEY_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def waiters(self, key: str) -> int:
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        if not isinstance(key, str) or not key.strip():
+            raise ValueError("key must be a non-empty string")
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, fn)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _run(self, key: str, fn: Callable[[], T]) -> T:
+        return fn()
+
+
+class FileLockSingleFlight(SingleFlight):
+    def __init__(
+        self,
+        root_dir: Union[str, os.PathLike],
+        lock_dir: str = ".locks",
+        stripes: int = DEFAULT_LOCK_STRIPES,
+    ):
+        if not file_locks_supported():
+            raise RuntimeError("file locks are not supported on this platform")
+        if not isinstance(lock_dir, str) or not lock_dir.strip():
+            raise ValueError("lock_dir must be a non-empty string")
+        super().__init__()
+        # Keys hash onto a fixed set of lock files, so the lock directory
+        # stays bounded no matter how many distinct jobs run.
+        self._file_lock = StripedFileLock(Path(root_dir) / lock_dir, stripes=stripes)
+
+    def _run(self, key: str, fn: Callable[[], T]) -> T:
+        if not _KEY_RE.match(key):
+            raise ValueError("key must be a safe file name")
+        with self._file_lock.hold(key):
+            return fn()
\ No newline at end of file
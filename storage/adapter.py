@@ -1,8 +1,90 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional
+
 from core.errors import Failure, StorageCollisionError, StorageError
 
 
+SPOOL_MEMORY_BYTES = 1024 * 1024
+
+
+class Spool:
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def write(self, chunk: bytes) -> None:
+        if self._closed:
+            raise ValueError("spool is closed")
+        if not isinstance(chunk, (bytes, bytearray, memoryview)):
+            raise ValueError("chunk must be bytes")
+        if len(chunk) == 0:
+            return
+        self._write(chunk)
+        self._hash.update(chunk)
+        self._size += len(chunk)
+
+    def commit(self, key: str, overwrite: bool = False) -> None:
+        if self._closed:
+            raise ValueError("spool is closed")
+        self._closed = True
+        self._commit(key, overwrite)
+
+    def discard(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._discard()
+
+    def __enter__(self) -> "Spool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.discard()
+
+    def _write(self, chunk: bytes) -> None:
+        raise NotImplementedError
+
+    def _commit(self, key: str, overwrite: bool) -> None:
+        raise NotImplementedError
+
+    def _discard(self) -> None:
+        raise NotImplementedError
+
+
+class _BufferedSpool(Spool):
+    def __init__(self, storage: "StorageAdapter"):
+        super().__init__()
+        self._storage = storage
+        self._fh = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+
+    def _write(self, chunk: bytes) -> None:
+        self._fh.write(chunk)
+
+    def _commit(self, key: str, overwrite: bool) -> None:
+        try:
+            self._fh.seek(0)
+            self._storage.put_bytes(key, self._fh.read(), overwrite=overwrite)
+        finally:
+            self._fh.close()
+
+    def _discard(self) -> None:
+        self._fh.close()
+
+
 class StorageAdapter:
     def get_bytes(self, key: str) -> bytes:
         raise NotImplementedError
@@ -13,6 +95,21 @@ class StorageAdapter:
     def exists(self, key: str) -> bool:
         raise NotImplementedError
 
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def local_path(self, key: str) -> Optional[Path]:
+        return None
+
+    def open_read(self, key: str) -> BinaryIO:
+        return io.BytesIO(self.get_bytes(key))
+
+    def open_mmap(self, key: str) -> memoryview:
+        return memoryview(self.get_bytes(key))
+
+    def open_spool(self) -> Spool:
+        return _BufferedSpool(self)
+
     def read_bytes(self, key: str) -> bytes:
         return self.get_bytes(key)
 
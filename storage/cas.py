@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from core.ids import sha256_hex
+from storage.adapter import Spool, StorageAdapter
+from storage.catalog import Catalog
+from storage.file_lock import StripedFileLock, file_locks_supported
+
+
+BLOB_PREFIX = "blobs/sha256"
+BLOB_LOCK_DIR = ".locks/blobs"
+
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def document_blob_ref(document_id: str) -> str:
+    return f"document:{document_id}"
+
+
+def artifact_blob_ref(artifact_id: str) -> str:
+    return f"artifact:{artifact_id}"
+
+
+class BlobStore:
+    def __init__(
+        self,
+        storage: StorageAdapter,
+        catalog: Catalog,
+        prefix: str = BLOB_PREFIX,
+        file_lock: Optional[StripedFileLock] = None,
+    ):
+        if not isinstance(prefix, str) or not prefix.strip():
+            raise ValueError("prefix must be a non-empty string")
+        self._storage = storage
+        self._catalog = catalog
+        self._prefix = prefix.strip("/")
+        self._lock = threading.Lock()
+        root_dir = getattr(storage, "root_dir", None)
+        if file_lock is None and root_dir is not None and file_locks_supported():
+            file_lock = StripedFileLock(Path(root_dir) / BLOB_LOCK_DIR)
+        self._file_lock = file_lock
+
+    @property
+    def storage(self) -> StorageAdapter:
+        return self._storage
+
+    def blob_key(self, content_sha256: str) -> str:
+        if not isinstance(content_sha256, str) or not _SHA256_RE.match(content_sha256):
+            raise ValueError("content_sha256 must be a lowercase hex sha256 digest")
+        return f"{self._prefix}/{content_sha256}"
+
+    def refcount(self, content_sha256: str) -> int:
+        return self._catalog.count_blob_refs(content_sha256)
+
+    def put_bytes(self, ref_id: str, data: bytes, content_sha256: Optional[str] = None) -> str:
+        if not isinstance(data, (bytes, bytearray)):
+            raise ValueError("data must be bytes")
+        if content_sha256 is None:
+            content_sha256 = sha256_hex(data)
+        key = self.blob_key(content_sha256)
+        with self._locked(content_sha256):
+            previous = self._catalog.put_blob_ref(ref_id, content_sha256)
+            if not self._storage.exists(key):
+                self._storage.put_bytes(key, data)
+        self._collect_replaced(previous, content_sha256)
+        return key
+
+    def put_spool(self, ref_id: str, spool: Spool) -> str:
+        content_sha256 = spool.sha256
+        key = self.blob_key(content_sha256)
+        with self._locked(content_sha256):
+            previous = self._catalog.put_blob_ref(ref_id, content_sha256)
+            if self._storage.exists(key):
+                spool.discard()
+            else:
+                spool.commit(key)
+        self._collect_replaced(previous, content_sha256)
+        return key
+
+    def release(self, ref_id: str) -> None:
+        previous = self._catalog.delete_blob_ref(ref_id)
+        if previous is not None:
+            self._collect(previous)
+
+    @contextmanager
+    def _locked(self, content_sha256: str) -> Iterator[None]:
+        # The ref insert, the existence check and the collector's count/delete
+        # for one blob must not interleave, including across worker processes
+        # sharing the same root; one blob is locked at a time so the lock
+        # order can never deadlock.
+        with self._lock:
+            if self._file_lock is None:
+                yield
+                return
+            with self._file_lock.hold(content_sha256):
+                yield
+
+    def _collect_replaced(self, previous: Optional[str], content_sha256: str) -> None:
+        if previous is not None and previous != content_sha256:
+            self._collect(previous)
+
+    def _collect(self, content_sha256: str) -> None:
+        with self._locked(content_sha256):
+            if self._catalog.count_blob_refs(content_sha256) == 0:
+                self._storage.delete(self.blob_key(content_sha256))
\ No newline at end of file
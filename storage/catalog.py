@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from domain.artifact import ArtifactRecord
+from domain.document import DocumentRecord
+
+
+def document_workspace_id(record: DocumentRecord) -> str:
+    meta = record.metadata or {}
+    workspace_id = meta.get("workspace_id")
+    return workspace_id if isinstance(workspace_id, str) else ""
+
+
+def document_cursor(record: DocumentRecord) -> Tuple[int, str]:
+    return (record.ingest_index, record.document_id)
+
+
+class Catalog:
+    def put_document(self, record: DocumentRecord) -> None:
+        raise NotImplementedError
+
+    def get_document(self, document_id: str) -> DocumentRecord:
+        raise NotImplementedError
+
+    def list_documents(self) -> List[DocumentRecord]:
+        raise NotImplementedError
+
+    def list_workspace_documents(
+        self,
+        workspace_id: str,
+        after: Optional[Tuple[int, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[DocumentRecord]:
+        raise NotImplementedError
+
+    def find_documents_by_sha256(self, content_sha256: str) -> List[DocumentRecord]:
+        raise NotImplementedError
+
+    def put_artifact(self, record: ArtifactRecord) -> None:
+        raise NotImplementedError
+
+    def get_artifact(self, artifact_id: str) -> ArtifactRecord:
+        raise NotImplementedError
+
+    def list_artifacts_by_job(self, job_id: str) -> List[ArtifactRecord]:
+        raise NotImplementedError
+
+    def put_blob_ref(self, ref_id: str, content_sha256: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def delete_blob_ref(self, ref_id: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def count_blob_refs(self, content_sha256: str) -> int:
+        raise NotImplementedError
+
+
+class InMemoryCatalog(Catalog):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs_by_id: Dict[str, DocumentRecord] = {}
+        self._workspace_index: Dict[str, List[Tuple[int, str]]] = {}
+        self._artifacts_by_id: Dict[str, ArtifactRecord] = {}
+        self._blob_by_ref: Dict[str, str] = {}
+        self._blob_refcounts: Dict[str, int] = {}
+
+    def put_document(self, record: DocumentRecord) -> None:
+        with self._lock:
+            previous = self._docs_by_id.get(record.document_id)
+            if previous is not None:
+                self._unindex(previous)
+            self._docs_by_id[record.document_id] = record
+            bisect.insort(
+                self._workspace_index.setdefault(document_workspace_id(record), []),
+                document_cursor(record),
+            )
+
+    def _unindex(self, record: DocumentRecord) -> None:
+        workspace_id = document_workspace_id(record)
+        keys = self._workspace_index.get(workspace_id)
+        if not keys:
+            return
+        cursor = document_cursor(record)
+        i = bisect.bisect_left(keys, cursor)
+        if i < len(keys) and keys[i] == cursor:
+            del keys[i]
+        if not keys:
+            del self._workspace_index[workspace_id]
+
+    def get_document(self, document_id: str) -> DocumentRecord:
+        with self._lock:
+            if document_id not in self._docs_by_id:
+                raise KeyError(document_id)
+            return self._docs_by_id[document_id]
+
+    def list_documents(self) -> List[DocumentRecord]:
+        with self._lock:
+            items = list(self._docs_by_id.values())
+        items.sort(key=lambda d: (d.ingest_index, d.document_id))
+        return items
+
+    def list_workspace_documents(
+        self,
+        workspace_id: str,
+        after: Optional[Tuple[int, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[DocumentRecord]:
+        with self._lock:
+            keys = self._workspace_index.get(workspace_id, [])
+            start = bisect.bisect_right(keys, after) if after is not None else 0
+            stop = len(keys) if limit is None else min(len(keys), start + limit)
+            return [self._docs_by_id[document_id] for _, document_id in keys[start:stop]]
+
+    def find_documents_by_sha256(self, content_sha256: str) -> List[DocumentRecord]:
+        return [d for d in self.list_documents() if d.content_sha256 == content_sha256]
+
+    def put_artifact(self, record: ArtifactRecord) -> None:
+        with self._lock:
+            self._artifacts_by_id[record.artifact_id] = record
+
+    def get_artifact(self, artifact_id: str) -> ArtifactRecord:
+        with self._lock:
+            if artifact_id not in self._artifacts_by_id:
+                raise KeyError(artifact_id)
+            return self._artifacts_by_id[artifact_id]
+
+    def list_artifacts_by_job(self, job_id: str) -> List[ArtifactRecord]:
+        with self._lock:
+            items = [a for a in self._artifacts_by_id.values() if a.job_id == job_id]
+        items.sort(key=lambda a: a.artifact_id)
+        return items
+
+    def put_blob_ref(self, ref_id: str, content_sha256: str) -> Optional[str]:
+        with self._lock:
+            previous = self._blob_by_ref.get(ref_id)
+            if previous == content_sha256:
+                return previous
+            if previous is not None:
+                self._decref(previous)
+            self._blob_by_ref[ref_id] = content_sha256
+            self._blob_refcounts[content_sha256] = self._blob_refcounts.get(content_sha256, 0) + 1
+            return previous
+
+    def delete_blob_ref(self, ref_id: str) -> Optional[str]:
+        with self._lock:
+            previous = self._blob_by_ref.pop(ref_id, None)
+            if previous is not None:
+                self._decref(previous)
+            return previous
+
+    def _decref(self, content_sha256: str) -> None:
+        remaining = self._blob_refcounts.get(content_sha256, 0) - 1
+        if remaining > 0:
+            self._blob_refcounts[content_sha256] = remaining
+        else:
+            self._blob_refcounts.pop(content_sha256, None)
+
+    def count_blob_refs(self, content_sha256: str) -> int:
+        with self._lock:
+            return self._blob_refcounts.get(content_sha256, 0)
\ No newline at end of file
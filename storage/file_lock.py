@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+DEFAULT_LOCK_STRIPES = 256
+
+
+def file_locks_supported() -> bool:
+    return fcntl is not None
+
+
+class StripedFileLock:
+    def __init__(self, lock_root: Union[str, os.PathLike], stripes: int = DEFAULT_LOCK_STRIPES):
+        if fcntl is None:
+            raise RuntimeError("file locks are not supported on this platform")
+        if not isinstance(stripes, int) or stripes < 1:
+            raise ValueError("stripes must be an int >= 1")
+        self._root = Path(lock_root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._stripes = stripes
+
+    @property
+    def stripes(self) -> int:
+        return self._stripes
+
+    def stripe_path(self, key: str) -> Path:
+        if not isinstance(key, str) or not key:
+            raise ValueError("key must be a non-empty string")
+        digest = hashlib.sha256(key.encode("utf-8")).digest()
+        stripe = int.from_bytes(digest[:4], "big") % self._stripes
+        return self._root / f"{stripe:04x}.lock"
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        with open(self.stripe_path(key), "a+b") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
\ No newline at end of file
@@ -1,24 +1,192 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import itertools
+import mmap
 import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import List, Union
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 
 from core.errors import ErrorCode, StorageCollisionError, failure
-from core.ordering import sort_strings
-from storage.adapter import StorageAdapter
+from storage.adapter import Spool, StorageAdapter
+
+
+SPOOL_DIR = ".tmp"
+DIGEST_DIR = ".digests"
+DIGEST_SUFFIX = ".sha256"
+LAYOUT_MARKER = ".layout"
+LAYOUT_FLAT = "flat"
+LAYOUT_SHARDED = "sharded"
+LAYOUTS = (LAYOUT_FLAT, LAYOUT_SHARDED)
+SHARD_WIDTH = 2
+SHARD_DEPTH = 2
+SHARD_ESCAPE = "~"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def _file_sha256(p: Path) -> str:
+    h = hashlib.sha256()
+    with open(p, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _is_shardable(name: str) -> bool:
+    head = name[: SHARD_WIDTH * SHARD_DEPTH]
+    return len(name) >= SHARD_WIDTH * SHARD_DEPTH and head.isascii() and head.isalnum()
+
+
+def _is_shard_dir(name: str) -> bool:
+    return len(name) == SHARD_WIDTH and name.isascii() and name.isalnum()
+
+
+def _needs_escape(name: str) -> bool:
+    return _is_shard_dir(name.rstrip(SHARD_ESCAPE))
+
+
+def _entirely_before(prefix: str, bound: str) -> bool:
+    return prefix < bound and not bound.startswith(prefix)
+
+
+def _shard_parts(name: str) -> List[str]:
+    return [name[i * SHARD_WIDTH : (i + 1) * SHARD_WIDTH] for i in range(SHARD_DEPTH)]
+
+
+def shard_key(key: str) -> str:
+    parent, _, name = key.rpartition("/")
+    if not _is_shardable(name):
+        # Names that would share a path with a shard directory ("ab", and
+        # "ab~", "ab~~", ... to keep the mapping reversible) gain a suffix.
+        if not _needs_escape(name):
+            return key
+        return (parent + "/" if parent else "") + name + SHARD_ESCAPE
+    parts = ([parent] if parent else []) + _shard_parts(name) + [name]
+    return "/".join(parts)
+
+
+def unshard_key(rel: str) -> Optional[str]:
+    parts = rel.split("/")
+    name = parts[-1]
+    if not _is_shardable(name):
+        if name.endswith(SHARD_ESCAPE) and _needs_escape(name):
+            return "/".join(parts[:-1] + [name[: -len(SHARD_ESCAPE)]])
+        return rel
+    if len(parts) <= SHARD_DEPTH or parts[-1 - SHARD_DEPTH : -1] != _shard_parts(name):
+        return None
+    return "/".join(parts[: -1 - SHARD_DEPTH] + [name])
+
+
+def read_layout(root: Path) -> Optional[str]:
+    try:
+        layout = (root / LAYOUT_MARKER).read_text(encoding="ascii").strip()
+    except FileNotFoundError:
+        return None
+    if layout not in LAYOUTS:
+        raise ValueError(f"unknown storage layout: {layout!r}")
+    return layout
+
+
+def write_layout(root: Path, layout: str) -> None:
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout must be one of {LAYOUTS}")
+    tmp = root / f"{LAYOUT_MARKER}.{os.getpid()}.tmp"
+    tmp.write_text(layout + "\n", encoding="ascii")
+    tmp.replace(root / LAYOUT_MARKER)
+
+
+def _has_objects(root: Path) -> bool:
+    with os.scandir(root) as it:
+        return any(not entry.name.startswith(".") for entry in it)
+
+
+class LocalFSSpool(Spool):
+    def __init__(self, storage: "LocalFSStorage", spool_dir: Path):
+        super().__init__()
+        self._storage = storage
+        fd, name = tempfile.mkstemp(dir=str(spool_dir), suffix=".spool")
+        self._path = Path(name)
+        self._fh = os.fdopen(fd, "wb")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _write(self, chunk: bytes) -> None:
+        self._fh.write(chunk)
+
+    def _commit(self, key: str, overwrite: bool) -> None:
+        try:
+            self._fh.close()
+            self._storage._commit_file(key, self._path, self.sha256, self.size, overwrite)
+        finally:
+            if self._path.exists():
+                self._path.unlink()
+
+    def _discard(self) -> None:
+        self._fh.close()
+        if self._path.exists():
+            self._path.unlink()
+
+    def detach(self) -> Tuple[str, str, int]:
+        if self._closed:
+            raise ValueError("spool is closed")
+        self._closed = True
+        self._fh.close()
+        return str(self._path), self.sha256, self.size
+
+
+class _AdoptedSpool(LocalFSSpool):
+    def __init__(self, storage: "LocalFSStorage", path: Path, sha256: str, size: int):
+        Spool.__init__(self)
+        self._storage = storage
+        self._path = path
+        self._fh = open(path, "rb")
+        self._sha256 = sha256
+        self._size = size
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256
+
+    def _write(self, chunk: bytes) -> None:
+        raise ValueError("adopted spool is read-only")
 
 
 class LocalFSStorage(StorageAdapter):
-    def __init__(self, root_dir: Union[str, os.PathLike]):
+    def __init__(self, root_dir: Union[str, os.PathLike], layout: Optional[str] = None):
         root = Path(root_dir)
         root.mkdir(parents=True, exist_ok=True)
         self._root = root.resolve()
+        self._layout = self._init_layout(layout)
+
+    def _init_layout(self, layout: Optional[str]) -> str:
+        recorded = read_layout(self._root)
+        if layout is None:
+            return recorded if recorded is not None else LAYOUT_FLAT
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}")
+        if recorded is None:
+            if layout != LAYOUT_FLAT:
+                if _has_objects(self._root):
+                    raise ValueError("storage root holds flat objects; migrate it with storage.migrate_layout")
+                write_layout(self._root, layout)
+            return layout
+        if recorded != layout:
+            raise ValueError(f"storage root uses the {recorded} layout; migrate it with storage.migrate_layout")
+        return layout
 
     @property
     def root_dir(self) -> Path:
         return self._root
 
+    @property
+    def layout(self) -> str:
+        return self._layout
+
     def _normalize_key(self, key: str) -> str:
         if not isinstance(key, str) or not key.strip():
             raise ValueError("storage key must be a non-empty string")
@@ -27,16 +195,84 @@ class LocalFSStorage(StorageAdapter):
             raise ValueError("storage key must be a non-empty string")
         return k
 
-    def _resolve_key(self, key: str) -> Path:
-        k = self._normalize_key(key)
-        p = (self._root / k).resolve()
+    def _resolve_rel(self, rel: str) -> Path:
+        p = (self._root / rel).resolve()
         if p != self._root and self._root not in p.parents:
             raise ValueError("storage key escapes root")
         return p
 
+    def _resolve_key(self, key: str) -> Path:
+        k = self._normalize_key(key)
+        self._resolve_rel(k)
+        if self._layout != LAYOUT_SHARDED:
+            return self._resolve_rel(k)
+        p = self._resolve_rel(shard_key(k))
+        if _is_shard_dir(k.rpartition("/")[2]) and not p.exists():
+            # Roots written before two-character names were escaped keep
+            # them unsuffixed; serve those in place.
+            legacy = self._resolve_rel(k)
+            if legacy.is_file():
+                return legacy
+        return p
+
+    def _logical_key(self, fp: Path) -> Optional[str]:
+        rel = fp.relative_to(self._root).as_posix()
+        if self._layout == LAYOUT_SHARDED:
+            return unshard_key(rel)
+        return rel
+
+    def _digest_path(self, p: Path) -> Path:
+        return self._root / DIGEST_DIR / (p.relative_to(self._root).as_posix() + DIGEST_SUFFIX)
+
+    def _read_digest(self, p: Path, st: os.stat_result) -> Optional[str]:
+        try:
+            parts = self._digest_path(p).read_text(encoding="ascii").split()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
+            return None
+        sha256, size, mtime_ns = parts
+        if int(size) != st.st_size or int(mtime_ns) != st.st_mtime_ns:
+            return None
+        return sha256
+
+    def _write_digest(self, p: Path, sha256: str) -> None:
+        st = p.stat()
+        dp = self._digest_path(p)
+        dp.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dp.with_name(f"{dp.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(f"{sha256} {st.st_size} {st.st_mtime_ns}\n", encoding="ascii")
+        tmp.replace(dp)
+
+    def _stored_sha256(self, p: Path, st: os.stat_result) -> str:
+        sha256 = self._read_digest(p, st)
+        if sha256 is None:
+            sha256 = _file_sha256(p)
+            self._write_digest(p, sha256)
+        return sha256
+
+    def _same_content(self, p: Path, sha256: str, size: int) -> bool:
+        st = p.stat()
+        if st.st_size != size:
+            return False
+        return self._stored_sha256(p, st) == sha256
+
     def exists(self, key: str) -> bool:
         return self._resolve_key(key).exists()
 
+    def delete(self, key: str) -> None:
+        p = self._resolve_key(key)
+        if p.is_dir():
+            raise ValueError("object is not a file")
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            self._digest_path(p).unlink()
+        except FileNotFoundError:
+            pass
+
     def get_bytes(self, key: str) -> bytes:
         p = self._resolve_key(key)
         if not p.exists():
@@ -45,17 +281,33 @@ class LocalFSStorage(StorageAdapter):
             raise ValueError("object is not a file")
         return p.read_bytes()
 
+    def local_path(self, key: str) -> Optional[Path]:
+        p = self._resolve_key(key)
+        if not p.exists():
+            raise FileNotFoundError(key)
+        if not p.is_file():
+            raise ValueError("object is not a file")
+        return p
+
+    def open_read(self, key: str) -> BinaryIO:
+        return open(self.local_path(key), "rb")
+
+    def open_mmap(self, key: str) -> memoryview:
+        with open(self.local_path(key), "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+
     def put_bytes(self, key: str, data: bytes, overwrite: bool = False) -> None:
         if not isinstance(data, (bytes, bytearray)):
             raise ValueError("data must be bytes")
         p = self._resolve_key(key)
         p.parent.mkdir(parents=True, exist_ok=True)
 
-        new_bytes = bytes(data)
+        new_sha256 = hashlib.sha256(data).hexdigest()
 
         if p.exists() and p.is_file():
-            existing = p.read_bytes()
-            if existing == new_bytes:
+            if self._same_content(p, new_sha256, len(data)):
                 return
             if not overwrite:
                 raise StorageCollisionError(
@@ -67,21 +319,113 @@ class LocalFSStorage(StorageAdapter):
                 )
 
         tmp = p.with_suffix(p.suffix + ".tmp")
-        tmp.write_bytes(new_bytes)
+        tmp.write_bytes(data)
         tmp.replace(p)
+        self._write_digest(p, new_sha256)
+
+    def open_spool(self) -> LocalFSSpool:
+        return LocalFSSpool(self, self.temp_dir())
+
+    def temp_dir(self) -> Path:
+        spool_dir = self._root / SPOOL_DIR
+        spool_dir.mkdir(parents=True, exist_ok=True)
+        return spool_dir
+
+    def adopt_spool(self, path: Union[str, os.PathLike], sha256: str, size: int) -> LocalFSSpool:
+        p = Path(path).resolve()
+        if p.parent != self._root / SPOOL_DIR or not p.is_file():
+            raise ValueError("path is not a spool file of this storage")
+        if p.stat().st_size != size:
+            raise ValueError("spool size mismatch")
+        return _AdoptedSpool(self, p, sha256, size)
+
+    def _commit_file(self, key: str, src: Path, sha256: str, size: int, overwrite: bool) -> None:
+        p = self._resolve_key(key)
+        p.parent.mkdir(parents=True, exist_ok=True)
+
+        if p.exists() and p.is_file():
+            if self._same_content(p, sha256, size):
+                return
+            if not overwrite:
+                raise StorageCollisionError(
+                    failure(
+                        ErrorCode.COLLISION,
+                        "object already exists with different content",
+                        {"key": self._normalize_key(key)},
+                    )
+                )
+
+        os.chmod(src, 0o644)
+        os.replace(src, p)
+        self._write_digest(p, sha256)
+
+    def _dir_key_prefixes(self, rel: str) -> List[str]:
+        if self._layout != LAYOUT_SHARDED:
+            return [rel + "/"]
+        parent, _, name = rel.rpartition("/")
+        if not _is_shard_dir(name):
+            return [rel + "/"]
+        prefixes = [rel]
+        if parent:
+            grand, _, parent_name = parent.rpartition("/")
+            if _is_shard_dir(parent_name):
+                prefixes.append((grand + "/" if grand else "") + parent_name + name)
+        return prefixes
+
+    def _push_children(self, heap: List[Tuple[str, int, str]], d: Path, start_after: Optional[str]) -> None:
+        rel_dir = d.relative_to(self._root).as_posix()
+        at_root = rel_dir == "."
+        with os.scandir(d) as it:
+            for entry in it:
+                if at_root and entry.name.startswith("."):
+                    continue
+                rel = entry.name if at_root else f"{rel_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    prefixes = self._dir_key_prefixes(rel)
+                    if start_after is not None and all(_entirely_before(p, start_after) for p in prefixes):
+                        continue
+                    heapq.heappush(heap, (min(prefixes), 1, entry.path))
+                elif entry.is_file():
+                    key = unshard_key(rel) if self._layout == LAYOUT_SHARDED else rel
+                    if key is None or (start_after is not None and key <= start_after):
+                        continue
+                    heapq.heappush(heap, (key, 0, entry.path))
+
+    def _walk_keys(self, pref: str, start_after: Optional[str]) -> Iterator[str]:
+        if pref:
+            if self._resolve_key(pref).is_file():
+                if start_after is None or pref > start_after:
+                    yield pref
+                return
+            base = self._resolve_rel(pref)
+        else:
+            base = self._root
+        if not base.is_dir():
+            return
+
+        scope = pref + "/" if pref else ""
+        heap: List[Tuple[str, int, str]] = []
+        self._push_children(heap, base, start_after)
+        while heap:
+            key, is_dir, path = heapq.heappop(heap)
+            if is_dir:
+                self._push_children(heap, Path(path), start_after)
+            elif key.startswith(scope) and not key.startswith("."):
+                yield key
+
+    def iter_keys(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[str]:
+        pref = self._normalize_key(prefix) if prefix else ""
+        if start_after is not None and not isinstance(start_after, str):
+            raise ValueError("start_after must be a string if provided")
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise ValueError("limit must be a non-negative int if provided")
+        keys = self._walk_keys(pref, start_after)
+        return keys if limit is None else itertools.islice(keys, limit)
 
     def list_keys(self, prefix: str) -> List[str]:
-        pref = self._normalize_key(prefix) if prefix is not None else ""
-        base = self._resolve_key(pref) if pref else self._root
-        if not base.exists():
-            return []
-        if base.is_file():
-            rel = base.relative_to(self._root).as_posix()
-            return [rel]
-
-        keys: List[str] = []
-        for fp in base.rglob("*"):
-            if fp.is_file():
-                rel = fp.relative_to(self._root).as_posix()
-                keys.append(rel)
-        return sort_strings(keys)
\ No newline at end of file
+        return list(self.iter_keys(prefix))
\ No newline at end of file
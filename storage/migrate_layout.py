@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from storage.local_fs import (
+    DIGEST_DIR,
+    DIGEST_SUFFIX,
+    LAYOUT_FLAT,
+    LAYOUT_SHARDED,
+    LAYOUTS,
+    LocalFSStorage,
+    read_layout,
+    shard_key,
+    unshard_key,
+    write_layout,
+)
+
+
+def _iter_object_paths(root: Path) -> Iterator[str]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        if rel_dir == ".":
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            rel_dir = ""
+        for name in filenames:
+            if rel_dir == "" and name.startswith("."):
+                continue
+            yield f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _planned_moves(root: Path, layout: str) -> List[Tuple[str, str]]:
+    moves: List[Tuple[str, str]] = []
+    for rel in _iter_object_paths(root):
+        flat = unshard_key(rel)
+        already_sharded = flat not in (None, rel)
+        if layout == LAYOUT_SHARDED and not already_sharded:
+            target = shard_key(rel)
+        elif layout == LAYOUT_FLAT and already_sharded:
+            target = flat
+        else:
+            continue
+        if target != rel:
+            moves.append((rel, target))
+    return moves
+
+
+def _move(src: Path, dst: Path) -> None:
+    if not src.exists():
+        return
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(src, dst)
+
+
+def _is_rename(move: Tuple[str, str]) -> bool:
+    rel, target = move
+    return rel.rpartition("/")[0] == target.rpartition("/")[0]
+
+
+def _apply_moves(root: Path, moves: List[Tuple[str, str]]) -> None:
+    digest_root = root / DIGEST_DIR
+    for rel, target in moves:
+        _move(root / rel, root / target)
+        _move(digest_root / (rel + DIGEST_SUFFIX), digest_root / (target + DIGEST_SUFFIX))
+
+
+def _prune_empty_dirs(root: Path) -> None:
+    for dirpath, _, filenames in os.walk(root, topdown=False):
+        p = Path(dirpath)
+        if p == root or filenames:
+            continue
+        top = p.relative_to(root).parts[0]
+        if top.startswith(".") and top != DIGEST_DIR:
+            continue
+        try:
+            p.rmdir()
+        except OSError:
+            continue
+
+
+def migrate_layout(root_dir: Union[str, os.PathLike], layout: str) -> int:
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout must be one of {LAYOUTS}")
+    root = Path(root_dir).resolve()
+    if not root.is_dir():
+        raise FileNotFoundError(str(root))
+    if (read_layout(root) or LAYOUT_FLAT) == layout:
+        return 0
+
+    moves = _planned_moves(root, layout)
+    # Escaped two-character names must leave their shard-directory path
+    # before shards are created there, and can only take it back once the
+    # emptied shard directories are gone.
+    renames = [m for m in moves if _is_rename(m)]
+    reshards = [m for m in moves if not _is_rename(m)]
+    if layout == LAYOUT_SHARDED:
+        _apply_moves(root, renames + reshards)
+    else:
+        _apply_moves(root, reshards)
+        _prune_empty_dirs(root)
+        _apply_moves(root, renames)
+
+    _prune_empty_dirs(root)
+    write_layout(root, layout)
+    LocalFSStorage(root, layout=layout)
+    return len(moves)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m storage.migrate_layout",
+        description="Move every object under a LocalFSStorage root into the requested directory layout.",
+    )
+    parser.add_argument("root_dir")
+    parser.add_argument("--to", dest="layout", choices=LAYOUTS, default=LAYOUT_SHARDED)
+    args = parser.parse_args(argv)
+
+    moved = migrate_layout(args.root_dir, args.layout)
+    print(f"moved {moved} objects; {args.root_dir} now uses the {args.layout} layout")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import create_engine, event, text
+
+from domain.artifact import ArtifactRecord
+from domain.document import DocumentRecord
+from storage.catalog import Catalog, document_workspace_id
+
+
+CATALOG_DIR = ".catalog"
+CATALOG_FILENAME = "catalog.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS documents (
+        document_id TEXT PRIMARY KEY,
+        workspace_id TEXT NOT NULL,
+        content_sha256 TEXT NOT NULL,
+        ingest_index INTEGER NOT NULL,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_documents_workspace_cursor ON documents (workspace_id, ingest_index, document_id)",
+    "CREATE INDEX IF NOT EXISTS ix_documents_content_sha256 ON documents (content_sha256)",
+    "CREATE INDEX IF NOT EXISTS ix_documents_ingest_index ON documents (ingest_index, document_id)",
+    """
+    CREATE TABLE IF NOT EXISTS artifacts (
+        artifact_id TEXT PRIMARY KEY,
+        job_id TEXT NOT NULL,
+        content_sha256 TEXT,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_artifacts_job_id ON artifacts (job_id)",
+    "CREATE INDEX IF NOT EXISTS ix_artifacts_content_sha256 ON artifacts (content_sha256)",
+    """
+    CREATE TABLE IF NOT EXISTS blob_refs (
+        ref_id TEXT PRIMARY KEY,
+        content_sha256 TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_blob_refs_content_sha256 ON blob_refs (content_sha256)",
+)
+
+_PUT_DOCUMENT = text(
+    """
+    INSERT INTO documents (document_id, workspace_id, content_sha256, ingest_index, payload)
+    VALUES (:document_id, :workspace_id, :content_sha256, :ingest_index, :payload)
+    ON CONFLICT (document_id) DO UPDATE SET
+        workspace_id = excluded.workspace_id,
+        content_sha256 = excluded.content_sha256,
+        ingest_index = excluded.ingest_index,
+        payload = excluded.payload
+    """
+)
+_GET_DOCUMENT = text("SELECT payload FROM documents WHERE document_id = :document_id")
+_LIST_DOCUMENTS = text("SELECT payload FROM documents ORDER BY ingest_index, document_id")
+_LIST_WORKSPACE_DOCUMENTS = text(
+    """
+    SELECT payload FROM documents
+    WHERE workspace_id = :workspace_id AND (ingest_index, document_id) > (:after_index, :after_id)
+    ORDER BY ingest_index, document_id
+    LIMIT :limit
+    """
+)
+_FIND_DOCUMENTS_BY_SHA256 = text(
+    "SELECT payload FROM documents WHERE content_sha256 = :content_sha256 ORDER BY ingest_index, document_id"
+)
+
+_PUT_ARTIFACT = text(
+    """
+    INSERT INTO artifacts (artifact_id, job_id, content_sha256, payload)
+    VALUES (:artifact_id, :job_id, :content_sha256, :payload)
+    ON CONFLICT (artifact_id) DO UPDATE SET
+        job_id = excluded.job_id,
+        content_sha256 = excluded.content_sha256,
+        payload = excluded.payload
+    """
+)
+_GET_ARTIFACT = text("SELECT payload FROM artifacts WHERE artifact_id = :artifact_id")
+_LIST_ARTIFACTS_BY_JOB = text("SELECT payload FROM artifacts WHERE job_id = :job_id ORDER BY artifact_id")
+
+_GET_BLOB_REF = text("SELECT content_sha256 FROM blob_refs WHERE ref_id = :ref_id")
+_PUT_BLOB_REF = text(
+    """
+    INSERT INTO blob_refs (ref_id, content_sha256) VALUES (:ref_id, :content_sha256)
+    ON CONFLICT (ref_id) DO UPDATE SET content_sha256 = excluded.content_sha256
+    """
+)
+_DELETE_BLOB_REF = text("DELETE FROM blob_refs WHERE ref_id = :ref_id")
+_COUNT_BLOB_REFS = text("SELECT COUNT(*) FROM blob_refs WHERE content_sha256 = :content_sha256")
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+    finally:
+        cursor.close()
+
+
+class SQLiteCatalog(Catalog):
+    def __init__(self, path: Union[str, os.PathLike]):
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = db_path.resolve()
+        self._engine = create_engine(
+            f"sqlite:///{self._path.as_posix()}",
+            connect_args={"check_same_thread": False},
+        )
+        event.listen(self._engine, "connect", _set_sqlite_pragmas)
+        with self._engine.begin() as conn:
+            for stmt in _SCHEMA:
+                conn.execute(text(stmt))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        self._engine.dispose()
+
+    def put_document(self, record: DocumentRecord) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                _PUT_DOCUMENT,
+                {
+                    "content_sha256": record.content_sha256,
+                    "document_id": record.document_id,
+                    "ingest_index": record.ingest_index,
+                    "payload": _dumps(record.to_dict()),
+                    "workspace_id": document_workspace_id(record),
+                },
+            )
+
+    def get_document(self, document_id: str) -> DocumentRecord:
+        with self._engine.connect() as conn:
+            row = conn.execute(_GET_DOCUMENT, {"document_id": document_id}).first()
+        if row is None:
+            raise KeyError(document_id)
+        return DocumentRecord(**json.loads(row[0]))
+
+    def list_documents(self) -> List[DocumentRecord]:
+        with self._engine.connect() as conn:
+            rows = conn.execute(_LIST_DOCUMENTS).all()
+        return [DocumentRecord(**json.loads(r[0])) for r in rows]
+
+    def list_workspace_documents(
+        self,
+        workspace_id: str,
+        after: Optional[Tuple[int, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[DocumentRecord]:
+        after_index, after_id = after if after is not None else (-1, "")
+        params = {
+            "after_id": after_id,
+            "after_index": after_index,
+            "limit": -1 if limit is None else limit,
+            "workspace_id": workspace_id,
+        }
+        with self._engine.connect() as conn:
+            rows = conn.execute(_LIST_WORKSPACE_DOCUMENTS, params).all()
+        return [DocumentRecord(**json.loads(r[0])) for r in rows]
+
+    def find_documents_by_sha256(self, content_sha256: str) -> List[DocumentRecord]:
+        with self._engine.connect() as conn:
+            rows = conn.execute(_FIND_DOCUMENTS_BY_SHA256, {"content_sha256": content_sha256}).all()
+        return [DocumentRecord(**json.loads(r[0])) for r in rows]
+
+    def put_artifact(self, record: ArtifactRecord) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                _PUT_ARTIFACT,
+                {
+                    "artifact_id": record.artifact_id,
+                    "content_sha256": record.content_sha256,
+                    "job_id": record.job_id,
+                    "payload": _dumps(record.to_dict()),
+                },
+            )
+
+    def get_artifact(self, artifact_id: str) -> ArtifactRecord:
+        with self._engine.connect() as conn:
+            row = conn.execute(_GET_ARTIFACT, {"artifact_id": artifact_id}).first()
+        if row is None:
+            raise KeyError(artifact_id)
+        return ArtifactRecord(**json.loads(row[0]))
+
+    def list_artifacts_by_job(self, job_id: str) -> List[ArtifactRecord]:
+        with self._engine.connect() as conn:
+            rows = conn.execute(_LIST_ARTIFACTS_BY_JOB, {"job_id": job_id}).all()
+        return [ArtifactRecord(**json.loads(r[0])) for r in rows]
+
+    def put_blob_ref(self, ref_id: str, content_sha256: str) -> Optional[str]:
+        with self._engine.begin() as conn:
+            row = conn.execute(_GET_BLOB_REF, {"ref_id": ref_id}).first()
+            previous = row[0] if row is not None else None
+            if previous != content_sha256:
+                conn.execute(_PUT_BLOB_REF, {"content_sha256": content_sha256, "ref_id": ref_id})
+        return previous
+
+    def delete_blob_ref(self, ref_id: str) -> Optional[str]:
+        with self._engine.begin() as conn:
+            row = conn.execute(_GET_BLOB_REF, {"ref_id": ref_id}).first()
+            if row is None:
+                return None
+            conn.execute(_DELETE_BLOB_REF, {"ref_id": ref_id})
+        return row[0]
+
+    def count_blob_refs(self, content_sha256: str) -> int:
+        with self._engine.connect() as conn:
+            return int(conn.execute(_COUNT_BLOB_REFS, {"content_sha256": content_sha256}).scalar_one())
\ No newline at end of file
@@ -9,6 +9,7 @@ def test_health_endpoint_structure(client):
 
     assert "capabilities" in data
     assert "schema_version" in data
+    assert {"hits", "misses"} <= set(data["resolver_cache"].keys())
 
     assert list(data.keys()) == sorted(data.keys())
 
@@ -35,6 +36,29 @@ def test_document_upload_and_ingest(client):
     assert list(data.keys()) == sorted(data.keys())
 
 
+def test_document_upload_streams_file_part(client):
+    body = bytes(range(256)) * 5000
+    files = {"file": ("big.pdf", body, "application/pdf")}
+    response = client.post("/documents/upload", files=files, data={"note": "ignored"})
+
+    assert response.status_code == 200
+    doc = response.json()
+    assert doc["filename"] == "big.pdf"
+    assert doc["media_type"] == "application/pdf"
+    assert doc["byte_size"] == len(body)
+    assert client.get(f"/documents/{doc['document_id']}/content").content == body
+
+
+def test_document_upload_rejects_missing_or_oversized_file(client, monkeypatch):
+    missing = client.post("/documents/upload", data={"note": "no file"})
+    assert missing.status_code == 400
+
+    monkeypatch.setattr("api.routes.documents.MAX_UPLOAD_BYTES", 10)
+    too_big = client.post("/documents/upload", files={"file": ("x.pdf", b"x" * 11, "application/pdf")})
+    assert too_big.status_code == 400
+    assert list((client.app.state.storage.root_dir / ".tmp").iterdir()) == []
+
+
 def test_job_execution_endpoint_deterministic(client):
     files = {"file": ("test.pdf", b"hello world", "application/pdf")}
     upload = client.post("/documents/upload", files=files)
@@ -71,4 +95,117 @@ def test_error_envelope_structure(client):
 
     assert "code" in data
     assert "message" in data
-    assert list(data.keys()) == sorted(data.keys())
\ No newline at end of file
+    assert list(data.keys()) == sorted(data.keys())
+
+
+def test_admin_capability_refresh(client):
+    response = client.post("/admin/capabilities/refresh")
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data["ok"] is True
+    assert "capabilities" in data
+    assert list(data.keys()) == sorted(data.keys())
+
+
+def test_job_submit_and_wait(client):
+    payload = {
+        "operation": "pdf.preview",
+        "input_ref": {},
+        "params": {"document_id": "missing", "page": 1},
+    }
+
+    submitted = client.post("/jobs/submit", json=payload)
+    assert submitted.status_code == 202
+    assert submitted.json()["status"] in {"PENDING", "RUNNING", "FAILED"}
+
+    job_id = submitted.json()["job_id"]
+    waited = client.get(f"/jobs/{job_id}/wait", params={"timeout": 5})
+
+    assert waited.status_code == 200
+    assert waited.json()["status"] == "FAILED"
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "FAILED"
+
+
+def test_app_shutdown_stops_worker_pools(app):
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as c:
+        payload = {"operation": "pdf.preview", "input_ref": {}, "params": {"document_id": "missing", "page": 1}}
+        job_id = c.post("/jobs/submit", json=payload).json()["job_id"]
+        c.get(f"/jobs/{job_id}/wait", params={"timeout": 5})
+        assert app.state.job_queue.stats()["workers"] > 0
+
+    assert app.state.job_queue.stats()["workers"] == 0
+
+
+def test_unknown_job_status_not_found(client):
+    response = client.get("/jobs/does-not-exist")
+
+    assert response.status_code == 404
+    assert response.json()["code"] == "NOT_FOUND"
+
+
+def test_document_content_streams_stored_bytes(client):
+    body = b"%PDF-1.4 streamed content" * 100
+    files = {"file": ("stream.pdf", body, "application/pdf")}
+    upload = client.post("/documents/upload", files=files)
+    doc_id = upload.json()["document_id"]
+
+    response = client.get(f"/documents/{doc_id}/content")
+
+    assert response.status_code == 200
+    assert response.content == body
+    assert response.headers["content-type"].startswith("application/pdf")
+
+
+def test_document_content_etag_and_conditional_get(client):
+    body = b"%PDF-1.4 cached content"
+    upload = client.post("/documents/upload", files={"file": ("c.pdf", body, "application/pdf")})
+    doc = upload.json()
+
+    response = client.get(f"/documents/{doc['document_id']}/content")
+    etag = response.headers["etag"]
+
+    assert etag == f'"{doc["content_sha256"]}"'
+    assert "immutable" in response.headers["cache-control"]
+
+    cached = client.get(f"/documents/{doc['document_id']}/content", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_document_content_range_request(client):
+    body = bytes(range(256)) * 4
+    upload = client.post("/documents/upload", files={"file": ("r.pdf", body, "application/pdf")})
+    doc_id = upload.json()["document_id"]
+
+    response = client.get(f"/documents/{doc_id}/content", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == body[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(body)}"
+
+
+def test_workspace_document_listing_paginates(client):
+    uploaded = []
+    for i in range(3):
+        files = {"file": (f"p{i}.pdf", f"page-{i}".encode("ascii"), "application/pdf")}
+        res = client.post("/workspaces/paging/documents/upload", files=files)
+        assert res.status_code == 200
+        uploaded.append(res.json())
+    expected = sorted((d["ingest_index"], d["document_id"]) for d in uploaded)
+
+    first = client.get("/workspaces/paging/documents", params={"limit": 2})
+    assert first.status_code == 200
+    assert [(d["ingest_index"], d["document_id"]) for d in first.json()] == expected[:2]
+    cursor = first.headers["x-next-cursor"]
+
+    rest = client.get("/workspaces/paging/documents", params={"limit": 2, "after": cursor})
+    assert [(d["ingest_index"], d["document_id"]) for d in rest.json()] == expected[2:]
+    assert "x-next-cursor" not in rest.headers
+
+    bad = client.get("/workspaces/paging/documents", params={"after": "nope"})
+    assert bad.status_code == 400
\ No newline at end of file
@@ -0,0 +1,117 @@
+import io
+import pathlib
+import re
+
+import pytest
+
+from core.capability_contract import Capability, CapabilityStatus
+from core.capability_registry import CapabilityRegistry, build_registry
+from execution.pdf.canonicalize import (
+    QPDF_CANONICAL_ARGS,
+    _canonicalize_with_pikepdf,
+    _normalize_with_pikepdf,
+    canonicalize_pdf,
+    canonicalize_pdf_file,
+)
+
+
+pikepdf = pytest.importorskip("pikepdf")
+fitz = pytest.importorskip("fitz")
+
+
+def _pdf_bytes(pages=3):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"page {i + 1}")
+    doc.set_metadata({"title": "draft"})
+    data = doc.write()
+    doc.close()
+    return data
+
+
+def test_in_process_canonicalization_is_deterministic():
+    source = _pdf_bytes()
+    first = canonicalize_pdf(source, registry=build_registry())
+    second = canonicalize_pdf(source, registry=build_registry())
+
+    assert first.manifest["canonicalized"] is True
+    assert first.manifest["degraded"] is False
+    assert first.manifest["canonicalizer"]["mode"] == "in_process"
+    assert first.manifest["canonicalizer"]["provider"] == "pikepdf"
+    assert first.pdf_bytes == second.pdf_bytes
+
+    with pikepdf.Pdf.open(io.BytesIO(first.pdf_bytes)) as pdf:
+        assert len(pdf.pages) == 3
+        assert "/Title" not in pdf.docinfo
+
+
+def test_identical_edits_canonicalize_to_identical_bytes():
+    first = canonicalize_pdf(_pdf_bytes(), registry=build_registry())
+    second = canonicalize_pdf(_pdf_bytes(), registry=build_registry())
+
+    assert first.manifest["canonicalized"] is True
+    assert first.pdf_bytes == second.pdf_bytes
+
+
+def _without_id(data):
+    return re.sub(rb"/ID \[<[0-9a-f]*><[0-9a-f]*>\]", b"/ID []", data)
+
+
+@pytest.mark.parametrize("pages", [1, 4, 25])
+def test_in_process_output_matches_qpdf_cli(tmp_path, pages):
+    source = _pdf_bytes(pages=pages)
+    stage1, _ = _normalize_with_pikepdf(source)
+    in_path = tmp_path / "in.pdf"
+    out_path = tmp_path / "out.pdf"
+    in_path.write_bytes(stage1)
+    # pikepdf.Job runs the qpdf command line against the same libqpdf.
+    pikepdf.Job(["qpdf", *QPDF_CANONICAL_ARGS, str(in_path), str(out_path)]).run()
+
+    assert _without_id(_canonicalize_with_pikepdf(source)) == _without_id(out_path.read_bytes())
+
+def _registry_with(available):
+    caps = build_registry().all()
+    for name in ("canonicalizer.qpdf", "canonicalizer.mutool", "canonicalizer.pikepdf"):
+        ok = name in available
+        caps[name] = Capability(
+            name=name,
+            status=CapabilityStatus.AVAILABLE if ok else CapabilityStatus.DEGRADED,
+            providers=[name.split(".")[1]] if ok else [],
+        )
+    return CapabilityRegistry(caps)
+
+
+def test_file_canonicalization_runs_cli_file_to_file(tmp_path, monkeypatch):
+    import execution.pdf.canonicalize as canonicalize
+
+    calls = []
+
+    def _fake_qpdf(input_pdf, output_pdf):
+        calls.append(input_pdf)
+        output_pdf.write_text("canonical")
+
+    source = tmp_path / "merged.pdf"
+    source.write_bytes(_pdf_bytes())
+    monkeypatch.setattr(canonicalize, "_run_qpdf", _fake_qpdf)
+    monkeypatch.setattr(pathlib.Path, "read_bytes", lambda self: pytest.fail("buffered the file"))
+
+    out = io.BytesIO()
+    manifest = canonicalize_pdf_file(source, out, registry=_registry_with({"canonicalizer.qpdf"}))
+
+    assert calls == [source]
+    assert out.getvalue() == b"canonical"
+    assert manifest["canonicalized"] is True
+    assert manifest["canonicalizer"]["provider"] == "qpdf"
+
+
+def test_file_canonicalization_without_canonicalizer_is_degraded(tmp_path):
+    source = tmp_path / "merged.pdf"
+    source.write_bytes(_pdf_bytes())
+
+    out = io.BytesIO()
+    manifest = canonicalize_pdf_file(source, out, registry=_registry_with(set()))
+
+    assert out.getvalue() == source.read_bytes()
+    assert manifest["canonicalized"] is False
+    assert manifest["degradation"]["reason"] == "no_canonicalizer_capability"
\ No newline at end of file
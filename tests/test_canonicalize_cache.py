@@ -0,0 +1,146 @@
+import os
+
+import execution.pdf.canonicalize as canonicalize
+from execution.pdf.canonicalize import CanonicalizeResult, canonicalize_pdf
+from execution.pdf.canonicalize_cache import CanonicalizeCache
+from core.ids import sha256_hex
+from storage.local_fs import LocalFSStorage
+
+
+SIG = "pikepdf=1.0"
+
+
+def test_roundtrip_and_signature_isolation(tmp_path):
+    cache = CanonicalizeCache(LocalFSStorage(tmp_path))
+    sha = sha256_hex(b"input")
+
+    assert cache.get(sha, SIG) is None
+    cache.put(sha, SIG, b"%PDF-canonical", {"canonicalized": True})
+
+    assert cache.get(sha, SIG) == (b"%PDF-canonical", {"canonicalized": True})
+    assert cache.get(sha, "qpdf=11") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_evicts_least_recently_used_by_size(tmp_path):
+    storage = LocalFSStorage(tmp_path)
+    cache = CanonicalizeCache(storage, max_bytes=2600)
+    shas = [sha256_hex(bytes([i])) for i in range(3)]
+
+    cache.put(shas[0], SIG, b"a" * 1000, {})
+    cache.put(shas[1], SIG, b"b" * 1000, {})
+    assert cache.get(shas[0], SIG) is not None
+    cache.put(shas[2], SIG, b"c" * 1000, {})
+
+    assert cache.get(shas[1], SIG) is None
+    assert cache.get(shas[0], SIG) is not None
+    assert cache.get(shas[2], SIG) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_seeds_index_from_existing_entries(tmp_path):
+    storage = LocalFSStorage(tmp_path)
+    first = CanonicalizeCache(storage)
+    shas = [sha256_hex(bytes([i])) for i in range(2)]
+    first.put(shas[0], SIG, b"a" * 1000, {})
+    first.put(shas[1], SIG, b"b" * 1000, {})
+    old = tmp_path / "canonical" / shas[0]
+    for name in os.listdir(old):
+        os.utime(old / name, ns=(1, 1))
+
+    reopened = CanonicalizeCache(storage, max_bytes=1500)
+    assert reopened.stats()["entries"] == 1
+    assert reopened.get(shas[0], SIG) is None
+    assert reopened.get(shas[1], SIG) is not None
+
+
+def test_canonicalize_pdf_reuses_cached_output(tmp_path, monkeypatch):
+    calls = []
+
+    def _fake(pdf_bytes, registry):
+        calls.append(pdf_bytes)
+        return CanonicalizeResult(pdf_bytes=b"%PDF-out", manifest={"canonicalized": True, "degraded": False})
+
+    monkeypatch.setattr(canonicalize, "_canonicalize_pdf", _fake)
+    cache = CanonicalizeCache(LocalFSStorage(tmp_path))
+
+    first = canonicalize_pdf(b"%PDF-in", cache=cache)
+    second = canonicalize_pdf(b"%PDF-in", cache=cache)
+
+    assert calls == [b"%PDF-in"]
+    assert first == second
+
+
+def test_canonicalize_pdf_does_not_cache_degraded_output(tmp_path, monkeypatch):
+    calls = []
+
+    def _fake(pdf_bytes, registry):
+        calls.append(pdf_bytes)
+        return CanonicalizeResult(pdf_bytes=pdf_bytes, manifest={"canonicalized": False, "degraded": True})
+
+    monkeypatch.setattr(canonicalize, "_canonicalize_pdf", _fake)
+    cache = CanonicalizeCache(LocalFSStorage(tmp_path))
+
+    canonicalize_pdf(b"%PDF-in", cache=cache)
+    canonicalize_pdf(b"%PDF-in", cache=cache)
+
+    assert len(calls) == 2
+
+
+def test_repeated_edits_hit_the_cache(tmp_path):
+    import pytest
+
+    fitz = pytest.importorskip("fitz")
+    pytest.importorskip("pikepdf")
+    from core.capability_registry import build_registry
+    from core.execution_policy import ExecutionPolicy
+    from execution.pdf.remove import make_pdf_remove_execution
+    from services.document_service import DocumentService
+
+    doc = fitz.open()
+    for i in range(3):
+        doc.new_page().insert_text((72, 72), f"page {i + 1}")
+    storage = LocalFSStorage(tmp_path)
+    registry = build_registry()
+    documents = DocumentService(storage=storage, policy=ExecutionPolicy(registry))
+    rec = documents.ingest(doc.write(), ingest_index=0)
+    cache = CanonicalizeCache(storage)
+    remove = make_pdf_remove_execution(documents, registry=registry, canonicalize_cache=cache)
+
+    outputs = [remove({"input_ref": {"document_id": rec.document_id}, "params": {"pages": [1]}})[0] for _ in range(3)]
+
+    assert outputs[0] == outputs[1] == outputs[2]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+
+def test_eviction_accounts_for_entries_written_by_other_processes(tmp_path):
+    storage = LocalFSStorage(tmp_path)
+    ours = CanonicalizeCache(storage, max_bytes=2600, rescan_seconds=0)
+    theirs = CanonicalizeCache(storage, max_bytes=2600, rescan_seconds=0)
+    shas = [sha256_hex(bytes([i])) for i in range(3)]
+
+    ours.stats()
+    theirs.stats()
+    theirs.put(shas[0], SIG, b"a" * 1000, {})
+    theirs.put(shas[1], SIG, b"b" * 1000, {})
+    ours.put(shas[2], SIG, b"c" * 1000, {})
+
+    assert ours.stats()["entries"] == 2
+    assert ours.get(shas[0], SIG) is None
+    assert theirs.get(shas[1], SIG) is not None
+
+
+def test_puts_within_rescan_interval_do_not_rescan(tmp_path, monkeypatch):
+    cache = CanonicalizeCache(LocalFSStorage(tmp_path), rescan_seconds=3600)
+    cache.stats()
+    scans = []
+    original = cache._scan_locked
+    monkeypatch.setattr(cache, "_scan_locked", lambda: scans.append(1) or original())
+
+    for i in range(5):
+        cache.put(sha256_hex(bytes([i])), SIG, b"x" * 100, {})
+
+    assert scans == []
+    assert cache.stats()["entries"] == 5
\ No newline at end of file
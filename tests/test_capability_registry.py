@@ -1,9 +1,9 @@
-import importlib
+import importlib.util
 import types
 
 import pytest
 
-from core.capability_registry import build_registry
+from core.capability_registry import CachedCapabilityRegistry, build_registry
 
 
 def test_registry_builds_and_reports():
@@ -24,16 +24,53 @@ def test_registry_contains_expected_capabilities():
 
 
 def test_missing_module_degrades(monkeypatch):
-    original_import = importlib.import_module
+    original_find_spec = importlib.util.find_spec
 
-    def fake_import(name, *args, **kwargs):
+    def fake_find_spec(name, *args, **kwargs):
         if name == "pdfplumber":
-            raise ImportError("simulated missing")
-        return original_import(name, *args, **kwargs)
+            return None
+        return original_find_spec(name, *args, **kwargs)
 
-    monkeypatch.setattr(importlib, "import_module", fake_import)
+    monkeypatch.setattr(importlib.util, "find_spec", fake_find_spec)
 
     registry = build_registry()
     cap = registry.get("pdfplumber")
 
-    assert cap.status.value in {"degraded", "unavailable"}
\ No newline at end of file
+    assert cap.status.value in {"degraded", "unavailable"}
+
+
+def test_cached_registry_builds_once_until_refresh():
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return build_registry()
+
+    cached = CachedCapabilityRegistry(ttl_seconds=None, builder=builder)
+    cached.get("python_runtime")
+    cached.report()
+
+    assert len(calls) == 1
+    assert cached.generation == 1
+
+    cached.refresh()
+
+    assert len(calls) == 2
+    assert cached.generation == 2
+
+
+def test_cached_registry_rebuilds_after_ttl(monkeypatch):
+    import core.capability_registry as mod
+
+    now = [1000.0]
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now[0])
+
+    cached = CachedCapabilityRegistry(ttl_seconds=10)
+    first = cached.snapshot()
+
+    now[0] += 5
+    assert cached.snapshot() is first
+
+    now[0] += 10
+    assert cached.snapshot() is not first
+    assert cached.generation == 2
@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+
+from core.capability_registry import build_registry
+from core.execution_policy import ExecutionPolicy
+from core.ids import sha256_hex
+from services.artifact_service import ArtifactService
+from services.document_service import DocumentService
+from storage.cas import BLOB_LOCK_DIR, BlobStore
+from storage.catalog import InMemoryCatalog
+from storage.file_lock import StripedFileLock
+from storage.local_fs import LocalFSStorage
+from storage.sqlite_catalog import SQLiteCatalog
+
+
+def _catalog(tmp_path, kind):
+    return InMemoryCatalog() if kind == "memory" else SQLiteCatalog(tmp_path / "catalog.sqlite3")
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_blob_store_refcounts_and_collects(tmp_path, kind):
+    storage = LocalFSStorage(tmp_path / "store")
+    blobs = BlobStore(storage, _catalog(tmp_path, kind))
+
+    key_a = blobs.put_bytes("ref-a", b"same")
+    key_b = blobs.put_bytes("ref-b", b"same")
+    digest = sha256_hex(b"same")
+
+    assert key_a == key_b == blobs.blob_key(digest)
+    assert blobs.refcount(digest) == 2
+
+    blobs.put_bytes("ref-a", b"same")
+    assert blobs.refcount(digest) == 2
+
+    blobs.release("ref-a")
+    assert storage.exists(key_a)
+    blobs.release("ref-b")
+    assert blobs.refcount(digest) == 0
+    assert not storage.exists(key_a)
+
+
+def test_blob_store_rebinding_ref_collects_previous_blob(tmp_path):
+    storage = LocalFSStorage(tmp_path / "store")
+    blobs = BlobStore(storage, InMemoryCatalog())
+
+    old_key = blobs.put_bytes("ref", b"v1")
+    new_key = blobs.put_bytes("ref", b"v2")
+
+    assert not storage.exists(old_key)
+    assert storage.read_bytes(new_key) == b"v2"
+
+
+def test_blob_store_spool_skips_existing_blob(tmp_path):
+    storage = LocalFSStorage(tmp_path / "store")
+    blobs = BlobStore(storage, InMemoryCatalog())
+    key = blobs.put_bytes("ref-a", b"payload")
+
+    with storage.open_spool() as spool:
+        spool.write(b"payload")
+        assert blobs.put_spool("ref-b", spool) == key
+
+    assert blobs.refcount(sha256_hex(b"payload")) == 2
+    assert list((tmp_path / "store" / ".tmp").iterdir()) == []
+
+
+def test_blob_store_collection_waits_for_the_blob_file_lock(tmp_path):
+    storage = LocalFSStorage(tmp_path / "store")
+    catalog = SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    blobs = BlobStore(storage, catalog)
+    key = blobs.put_bytes("ref", b"payload")
+    digest = sha256_hex(b"payload")
+
+    # A second lock over the same directory stands in for another process.
+    other = StripedFileLock(tmp_path / "store" / BLOB_LOCK_DIR)
+    with other.hold(digest):
+        worker = threading.Thread(target=blobs.release, args=("ref",))
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+        assert storage.exists(key)
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert not storage.exists(key)
+    assert blobs.refcount(digest) == 0
+
+
+def test_services_store_duplicate_content_once(tmp_path):
+    storage = LocalFSStorage(tmp_path / "store")
+    catalog = InMemoryCatalog()
+    blobs = BlobStore(storage, catalog)
+    policy = ExecutionPolicy(build_registry())
+    docs = DocumentService(storage=storage, policy=policy, catalog=catalog, blob_store=blobs)
+    arts = ArtifactService(storage=storage, policy=policy, catalog=catalog, blob_store=blobs)
+
+    records = [docs.ingest(b"%PDF-same", ingest_index=i) for i in range(5)]
+    streamed = docs.ingest_stream([b"%PDF-", b"same"], ingest_index=9)
+    art = arts.create("bin", {"document_ids": [records[0].document_id]}, {}, b"%PDF-same")
+
+    keys = {r.storage_key for r in records} | {streamed.storage_key, art.storage_key}
+    assert len(keys) == 1
+    assert storage.list_keys("blobs") == [keys.pop()]
+    assert len({r.document_id for r in records}) == 5
+    assert blobs.refcount(sha256_hex(b"%PDF-same")) == 7
+    assert docs.load_bytes(streamed) == b"%PDF-same"
\ No newline at end of file
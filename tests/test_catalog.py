@@ -0,0 +1,99 @@
+import sqlite3
+
+import pytest
+
+from core.capability_registry import build_registry
+from core.execution_policy import ExecutionPolicy
+from services.artifact_service import ArtifactService
+from services.document_service import DocumentService
+from storage.catalog import InMemoryCatalog
+from storage.local_fs import LocalFSStorage
+from storage.sqlite_catalog import SQLiteCatalog
+
+
+def _services(tmp_path, catalog):
+    storage = LocalFSStorage(tmp_path / "store")
+    policy = ExecutionPolicy(build_registry())
+    docs = DocumentService(storage=storage, policy=policy, catalog=catalog)
+    arts = ArtifactService(storage=storage, policy=policy, catalog=catalog)
+    return docs, arts
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_catalog_document_and_artifact_roundtrip(tmp_path, kind):
+    catalog = InMemoryCatalog() if kind == "memory" else SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    docs, arts = _services(tmp_path, catalog)
+
+    d1 = docs.ingest(b"one", ingest_index=1, metadata={"workspace_id": "w1"})
+    d0 = docs.ingest(b"zero", ingest_index=0)
+    art = arts.create("bin", {"document_ids": [d0.document_id]}, {}, b"out")
+
+    assert docs.get_document(d1.document_id) == d1
+    assert [d.document_id for d in docs.list_documents()] == [d0.document_id, d1.document_id]
+    assert catalog.find_documents_by_sha256(d1.content_sha256) == [d1]
+    assert arts.get(art.artifact_id) == art
+    assert catalog.list_artifacts_by_job(art.job_id) == [art]
+
+    with pytest.raises(KeyError):
+        docs.get_document("missing")
+    with pytest.raises(KeyError):
+        arts.get("missing")
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_catalog_workspace_listing_is_indexed_and_paginated(tmp_path, kind):
+    catalog = InMemoryCatalog() if kind == "memory" else SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    docs, _ = _services(tmp_path, catalog)
+
+    ws = [docs.ingest(f"w{i}".encode(), ingest_index=i, metadata={"workspace_id": "w"}) for i in (2, 0, 1)]
+    docs.ingest(b"other", ingest_index=0, metadata={"workspace_id": "other"})
+    ordered = sorted(ws, key=lambda d: (d.ingest_index, d.document_id))
+
+    assert docs.list_workspace_documents("w") == ordered
+    page = docs.list_workspace_documents("w", limit=2)
+    assert page == ordered[:2]
+    last = page[-1]
+    assert docs.list_workspace_documents("w", after=(last.ingest_index, last.document_id), limit=2) == ordered[2:]
+    assert docs.list_workspace_documents("missing") == []
+
+    moved = docs.ingest(b"w0", ingest_index=0, metadata={"workspace_id": "other"})
+    assert moved.document_id == ordered[0].document_id
+    assert docs.list_workspace_documents("w") == ordered[1:]
+    assert moved in docs.list_workspace_documents("other")
+
+    with pytest.raises(ValueError):
+        docs.list_workspace_documents("w", limit=0)
+
+
+def test_sqlite_catalog_persists_across_instances(tmp_path):
+    path = tmp_path / "catalog.sqlite3"
+    docs, arts = _services(tmp_path, SQLiteCatalog(path))
+    doc = docs.ingest(b"abc", ingest_index=0)
+    art = arts.create("bin", {"document_ids": [doc.document_id]}, {}, b"out")
+
+    reopened_docs, reopened_arts = _services(tmp_path, SQLiteCatalog(path))
+
+    assert reopened_docs.get_document(doc.document_id) == doc
+    assert reopened_docs.load_bytes(reopened_docs.get_document(doc.document_id)) == b"abc"
+    assert reopened_arts.get(art.artifact_id) == art
+
+
+def test_sqlite_catalog_uses_wal_and_indexes(tmp_path):
+    catalog = SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    docs, _ = _services(tmp_path, catalog)
+    docs.ingest(b"abc", ingest_index=0)
+
+    conn = sqlite3.connect(str(catalog.path))
+    try:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    finally:
+        conn.close()
+
+    assert mode == "wal"
+    assert {
+        "ix_documents_workspace_cursor",
+        "ix_documents_content_sha256",
+        "ix_documents_ingest_index",
+        "ix_artifacts_job_id",
+    } <= indexes
\ No newline at end of file
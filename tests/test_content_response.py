@@ -0,0 +1,67 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from api.content import storage_content_response
+from storage.adapter import StorageAdapter
+
+
+class _MemoryStorage(StorageAdapter):
+    def __init__(self):
+        self._objects = {}
+
+    def get_bytes(self, key):
+        if key not in self._objects:
+            raise FileNotFoundError(key)
+        return self._objects[key]
+
+    def put_bytes(self, key, data, overwrite=False):
+        self._objects[key] = bytes(data)
+
+    def exists(self, key):
+        return key in self._objects
+
+
+def _client(body):
+    storage = _MemoryStorage()
+    storage.put_bytes("k", body)
+    app = FastAPI()
+
+    @app.get("/content")
+    def content(request: Request):
+        return storage_content_response(
+            request,
+            storage,
+            "k",
+            "application/pdf",
+            content_sha256="abc",
+            byte_size=len(body),
+        )
+
+    return TestClient(app)
+
+
+def test_streaming_fallback_full_body():
+    client = _client(b"0123456789")
+
+    response = client.get("/content")
+
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    assert response.headers["etag"] == '"abc"'
+
+
+def test_streaming_fallback_ranges():
+    client = _client(b"0123456789")
+
+    assert client.get("/content", headers={"Range": "bytes=2-4"}).content == b"234"
+    assert client.get("/content", headers={"Range": "bytes=-3"}).content == b"789"
+    assert client.get("/content", headers={"Range": "bytes=7-"}).content == b"789"
+    assert client.get("/content", headers={"Range": "bytes=20-"}).status_code == 416
+
+
+def test_streaming_fallback_if_none_match():
+    client = _client(b"0123456789")
+
+    response = client.get("/content", headers={"If-None-Match": 'W/"abc", "other"'})
+
+    assert response.status_code == 304
\ No newline at end of file
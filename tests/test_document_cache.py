@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+from execution.pdf.document_cache import DocumentCache
+
+
+class _Doc:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _opener(opened, name):
+    def _open():
+        doc = _Doc(name)
+        opened.append(doc)
+        return doc
+
+    return _open
+
+
+def test_document_cache_reuses_open_handle():
+    cache = DocumentCache(max_bytes=100, max_entries=4)
+    opened = []
+
+    for _ in range(3):
+        with cache.open("a", 10, _opener(opened, "a")) as doc:
+            assert doc.name == "a"
+
+    assert len(opened) == 1
+    assert not opened[0].closed
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_document_cache_evicts_least_recently_used_by_bytes():
+    cache = DocumentCache(max_bytes=25, max_entries=10)
+    opened = []
+
+    with cache.open("a", 10, _opener(opened, "a")):
+        pass
+    with cache.open("b", 10, _opener(opened, "b")):
+        pass
+    with cache.open("a", 10, _opener(opened, "a")):
+        pass
+    with cache.open("c", 10, _opener(opened, "c")):
+        pass
+
+    a, b, c = opened
+    assert b.closed
+    assert not a.closed and not c.closed
+    assert cache.stats()["bytes"] == 20
+    assert cache.stats()["evictions"] == 1
+
+
+def test_document_cache_defers_close_of_evicted_handle_in_use():
+    cache = DocumentCache(max_bytes=10, max_entries=10)
+    opened = []
+
+    with cache.open("a", 10, _opener(opened, "a")) as doc:
+        with cache.open("b", 10, _opener(opened, "b")):
+            pass
+        assert not doc.closed
+    assert doc.closed
+
+
+def test_document_cache_gives_concurrent_users_private_handles():
+    cache = DocumentCache(max_bytes=100, max_entries=4)
+    opened = []
+    inside = threading.Event()
+    release = threading.Event()
+    seen = []
+
+    def _hold():
+        with cache.open("a", 10, _opener(opened, "a")) as doc:
+            seen.append(doc)
+            inside.set()
+            release.wait(5)
+
+    t = threading.Thread(target=_hold)
+    t.start()
+    assert inside.wait(5)
+    with cache.open("a", 10, _opener(opened, "a")) as doc:
+        seen.append(doc)
+    release.set()
+    t.join(5)
+
+    assert seen[0] is not seen[1]
+    assert seen[1].closed
+    assert not seen[0].closed
+    assert cache.stats()["private_opens"] == 1
+
+
+def test_document_cache_skips_oversized_documents():
+    cache = DocumentCache(max_bytes=5)
+    opened = []
+
+    with cache.open("a", 10, _opener(opened, "a")) as doc:
+        assert not doc.closed
+
+    assert doc.closed
+    assert len(opened) == 1
+    assert cache.stats()["entries"] == 0
+
+    with pytest.raises(ValueError):
+        with cache.open("", 1, _opener(opened, "x")):
+            pass
\ No newline at end of file
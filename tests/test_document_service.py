@@ -43,4 +43,27 @@ def test_ingest_document_different_index(tmp_path):
     doc1 = service.ingest(data, ingest_index=0)
     doc2 = service.ingest(data, ingest_index=1)
 
-    assert doc1.document_id != doc2.document_id
\ No newline at end of file
+    assert doc1.document_id != doc2.document_id
+
+
+def test_ingest_stream_matches_ingest(tmp_path):
+    service = _build_service(tmp_path)
+
+    data = b"abc" * 1000
+    chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+
+    streamed = service.ingest_stream(chunks, ingest_index=0)
+    direct = service.ingest(data, ingest_index=0)
+
+    assert streamed.to_dict() == direct.to_dict()
+    assert service.storage.read_bytes(streamed.storage_key) == data
+
+
+def test_ingest_stream_enforces_size_limit(tmp_path):
+    service = _build_service(tmp_path)
+
+    with pytest.raises(ValueError):
+        service.ingest_stream([b"a" * 10, b"b" * 10], ingest_index=0, max_bytes=15)
+
+    assert service.list_documents() == []
+    assert list((tmp_path / ".tmp").iterdir()) == []
\ No newline at end of file
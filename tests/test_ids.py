@@ -49,4 +49,14 @@ def test_artifact_id_deterministic():
     a1 = make_artifact_id(kind, input_ref, params)
     a2 = make_artifact_id(kind, input_ref, params)
 
-    assert a1 == a2
\ No newline at end of file
+    assert a1 == a2
+
+
+def test_artifact_id_includes_operation():
+    plain = make_artifact_id("pdf", {"document_id": "d"}, {"pages": [1]})
+
+    remove = make_artifact_id("pdf", {"document_id": "d"}, {"pages": [1]}, operation="pdf.remove")
+    extract = make_artifact_id("pdf", {"document_id": "d"}, {"pages": [1]}, operation="pdf.extract")
+
+    assert remove != extract
+    assert plain not in (remove, extract)
\ No newline at end of file
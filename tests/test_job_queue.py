@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+
+from core.capability_registry import build_registry
+from core.errors import JobQueueFullError
+from core.execution_policy import ExecutionPolicy
+from domain.job import JobStatus
+from services.artifact_service import ArtifactService
+from services.job_queue import JobQueue
+from services.job_service import JobService
+from storage.local_fs import LocalFSStorage
+
+
+def _build_queue(tmp_path, fn, workers=1, max_depth=4):
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=ArtifactService(storage=storage, policy=policy),
+        execution_map={"op": fn},
+    )
+    return JobQueue(job_service, workers=workers, max_depth=max_depth)
+
+
+def test_submit_returns_pending_then_completes(tmp_path):
+    release = threading.Event()
+
+    def fn(payload):
+        release.wait(5)
+        return b"out", {"kind": "bin", "manifest": {}}
+
+    jq = _build_queue(tmp_path, fn)
+
+    record = jq.submit("op", {"document_id": "d"}, {})
+    assert record.status == JobStatus.PENDING
+
+    release.set()
+    done = jq.wait(record.job_id, timeout=5)
+
+    assert done.status == JobStatus.COMPLETED
+    assert done.job_id == record.job_id
+    assert jq.get(record.job_id).status == JobStatus.COMPLETED
+    jq.shutdown()
+
+
+def test_submit_deduplicates_pending_jobs(tmp_path):
+    release = threading.Event()
+
+    def fn(payload):
+        release.wait(5)
+        return b"out", {"kind": "bin", "manifest": {}}
+
+    jq = _build_queue(tmp_path, fn)
+
+    first = jq.submit("op", {"document_id": "d"}, {})
+    second = jq.submit("op", {"document_id": "d"}, {})
+
+    assert first.job_id == second.job_id
+    release.set()
+    jq.wait(first.job_id, timeout=5)
+    jq.shutdown()
+
+
+def test_queue_full_raises(tmp_path):
+    release = threading.Event()
+    started = threading.Event()
+
+    def fn(payload):
+        started.set()
+        release.wait(5)
+        return b"out", {"kind": "bin", "manifest": {}}
+
+    jq = _build_queue(tmp_path, fn, workers=1, max_depth=1)
+
+    jq.submit("op", {"document_id": "a"}, {})
+    started.wait(5)
+    jq.submit("op", {"document_id": "b"}, {})
+
+    with pytest.raises(JobQueueFullError):
+        jq.submit("op", {"document_id": "c"}, {})
+
+    release.set()
+    jq.shutdown()
+
+
+def test_failed_execution_is_recorded(tmp_path):
+    def fn(payload):
+        raise ValueError("broken input")
+
+    jq = _build_queue(tmp_path, fn)
+
+    record = jq.submit("op", {"document_id": "d"}, {})
+    done = jq.wait(record.job_id, timeout=5)
+
+    assert done.status == JobStatus.FAILED
+    assert done.failure["message"] == "broken input"
+    jq.shutdown()
+
+
+def test_unknown_job_raises(tmp_path):
+    jq = _build_queue(tmp_path, lambda payload: (b"", {}))
+
+    with pytest.raises(KeyError):
+        jq.get("missing")
+
+
+def test_deferred_swap_finishing_before_completion_is_kept(tmp_path):
+    from storage.cas import BlobStore
+    from storage.catalog import InMemoryCatalog
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    catalog = InMemoryCatalog()
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=ArtifactService(
+            storage=storage, policy=policy, catalog=catalog, blob_store=BlobStore(storage, catalog)
+        ),
+        execution_map={
+            "op": lambda payload: (b"raw", {"kind": "pdf", "manifest": {"canonicalize": "deferred"}})
+        },
+        deferred_canonicalizer=lambda data, manifest: (data + b"-canonical", dict(manifest)),
+    )
+
+    class _SwapFirstQueue(JobQueue):
+        def _set(self, job_id, record):
+            if record.status == JobStatus.COMPLETED:
+                assert job_service.wait_deferred(timeout=5)
+            super()._set(job_id, record)
+
+    jq = _SwapFirstQueue(job_service, workers=1)
+    record = jq.submit("op", {"document_id": "d"}, {})
+    done = jq.wait(record.job_id, timeout=5)
+    jq.shutdown()
+    job_service.shutdown()
+
+    assert done.status == JobStatus.COMPLETED
+    assert storage.get_bytes(done.output_ref["storage_key"]) == b"raw-canonical"
+    assert jq.get(record.job_id).output_ref == done.output_ref
\ No newline at end of file
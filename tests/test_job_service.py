@@ -5,6 +5,7 @@ from core.execution_policy import ExecutionPolicy
 from storage.local_fs import LocalFSStorage
 from services.document_service import DocumentService
 from services.artifact_service import ArtifactService
+from services.job_result_cache import JobResultCache
 from services.job_service import JobService
 from core.ids import HybridDocumentIdStrategy
 
@@ -54,4 +55,278 @@ def test_job_blocks_missing_capability(tmp_path, monkeypatch):
     monkeypatch.setattr(policy, "require", fake_require)
 
     with pytest.raises(Exception):
-        job_service.execute("noop", {"document_id": "x"}, {})
\ No newline at end of file
+        job_service.execute("noop", {"document_id": "x"}, {})
+
+
+def _build_cached_job_service(tmp_path, calls):
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    art_service = ArtifactService(storage=storage, policy=policy)
+
+    def _exec(payload):
+        calls.append(payload["job"]["job_id"])
+        return b"out", {"kind": "bin", "media_type": "application/octet-stream", "manifest": {}}
+
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=art_service,
+        execution_map={"echo": _exec},
+        result_cache=JobResultCache(storage),
+        provider_signature=lambda op: {"engine": "v1"},
+    )
+    return storage, job_service
+
+
+def test_job_result_cache_skips_reexecution(tmp_path):
+    calls = []
+    storage, job_service = _build_cached_job_service(tmp_path, calls)
+
+    job1 = job_service.execute("echo", {"document_id": "d"}, {})
+    job2 = job_service.execute("echo", {"document_id": "d"}, {})
+
+    assert len(calls) == 1
+    assert job1.to_dict() == job2.to_dict()
+
+
+def test_job_result_cache_shared_through_storage(tmp_path):
+    calls = []
+    _, first = _build_cached_job_service(tmp_path, calls)
+    _, second = _build_cached_job_service(tmp_path, calls)
+
+    job1 = first.execute("echo", {"document_id": "d"}, {})
+    job2 = second.execute("echo", {"document_id": "d"}, {})
+
+    assert len(calls) == 1
+    assert job1.output_ref == job2.output_ref
+
+
+def test_job_result_cache_misses_when_artifact_missing(tmp_path):
+    calls = []
+    storage, job_service = _build_cached_job_service(tmp_path, calls)
+
+    job1 = job_service.execute("echo", {"document_id": "d"}, {})
+    (storage.root_dir / job1.output_ref["storage_key"]).unlink()
+    job_service.execute("echo", {"document_id": "d"}, {})
+
+    assert len(calls) == 2
+
+
+def test_concurrent_identical_jobs_execute_once(tmp_path):
+    import threading
+    import time
+    from services.single_flight import SingleFlight
+
+    class _RecordingSingleFlight(SingleFlight):
+        def do(self, key, fn):
+            keys.append(key)
+            return super().do(key, fn)
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    art_service = ArtifactService(storage=storage, policy=policy)
+    single_flight = _RecordingSingleFlight()
+    keys = []
+    calls = []
+    callers = 4
+    all_joined = threading.Event()
+
+    def _exec(payload):
+        calls.append(1)
+        # Hold the leader until every other caller is parked on its flight.
+        deadline = time.monotonic() + 10
+        while not all_joined.wait(0.001) and time.monotonic() < deadline:
+            if single_flight.waiters(keys[0]) == callers - 1:
+                all_joined.set()
+        return b"out", {"kind": "bin", "manifest": {}}
+
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=art_service,
+        execution_map={"slow": _exec},
+        single_flight=single_flight,
+    )
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(job_service.execute("slow", {"document_id": "d"}, {})))
+        for _ in range(callers)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert all_joined.is_set()
+    assert len(calls) == 1
+    assert len(results) == callers
+    assert len({id(r) for r in results}) == 1
+
+
+def test_deferred_canonicalization_swaps_artifact(tmp_path):
+    from core.ids import sha256_hex
+    from storage.cas import BlobStore
+    from storage.catalog import InMemoryCatalog
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    catalog = InMemoryCatalog()
+    art_service = ArtifactService(storage=storage, policy=policy, catalog=catalog, blob_store=BlobStore(storage, catalog))
+    result_cache = JobResultCache(storage)
+
+    def _exec(payload):
+        return b"raw", {"kind": "pdf", "media_type": "application/pdf", "manifest": {"canonicalize": "deferred"}}
+
+    def _canonicalize(data, manifest):
+        return data + b"-canonical", dict(manifest, canonicalization={"canonicalized": True})
+
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=art_service,
+        execution_map={"edit": _exec},
+        result_cache=result_cache,
+        provider_signature=lambda op: {"engine": "v1"},
+        deferred_canonicalizer=_canonicalize,
+    )
+    updates = []
+    job_service.subscribe(updates.append)
+
+    job = job_service.execute("edit", {"document_id": "d"}, {"canonicalize": "deferred"})
+    assert job.output_ref["content_sha256"] == sha256_hex(b"raw")
+    assert job_service.wait_deferred(timeout=10)
+
+    artifact = art_service.get(job.output_ref["artifact_id"])
+    assert storage.get_bytes(artifact.storage_key) == b"raw-canonical"
+    assert artifact.manifest == {"canonicalization": {"canonicalized": True}, "canonicalize": "deferred"}
+    assert not storage.exists(job.output_ref["storage_key"])
+    assert [u.output_ref for u in updates] == [{**job.output_ref, "byte_size": 13, "content_sha256": artifact.content_sha256, "storage_key": artifact.storage_key}]
+
+    cached = job_service.execute("edit", {"document_id": "d"}, {"canonicalize": "deferred"})
+    assert cached.output_ref["content_sha256"] == sha256_hex(b"raw-canonical")
+
+
+def test_deferred_canonicalization_failure_is_recorded(tmp_path, caplog):
+    from core.ids import sha256_hex
+    from storage.catalog import InMemoryCatalog
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    art_service = ArtifactService(storage=storage, policy=policy, catalog=InMemoryCatalog())
+
+    def _exec(payload):
+        return b"raw", {"kind": "pdf", "media_type": "application/pdf", "manifest": {"canonicalize": "deferred"}}
+
+    def _canonicalize(data, manifest):
+        raise RuntimeError("qpdf exploded")
+
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=art_service,
+        execution_map={"edit": _exec},
+        deferred_canonicalizer=_canonicalize,
+    )
+    updates = []
+    job_service.subscribe(updates.append)
+
+    job = job_service.execute("edit", {"document_id": "d"}, {"canonicalize": "deferred"})
+    assert not job_service.wait_deferred(timeout=10)
+    assert job_service.wait_deferred(timeout=10)
+    job_service.shutdown()
+
+    artifact = art_service.get(job.output_ref["artifact_id"])
+    assert artifact.content_sha256 == sha256_hex(b"raw")
+    canonicalization = artifact.manifest["canonicalization"]
+    assert canonicalization["canonicalized"] is False
+    assert canonicalization["degraded"] is True
+    assert canonicalization["failure"]["details"] == {"error": "RuntimeError: qpdf exploded"}
+    assert [u.output_ref for u in updates] == [job.output_ref]
+    assert "deferred canonicalization failed" in caplog.text
+
+
+def test_spool_output_is_committed_as_artifact(tmp_path):
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    art_service = ArtifactService(storage=storage, policy=policy)
+
+    def _exec(payload):
+        spool = storage.open_spool()
+        for chunk in (b"a" * 10, b"b" * 5):
+            spool.write(chunk)
+        return spool, {"kind": "pdf", "media_type": "application/pdf", "manifest": {"streaming": True}}
+
+    job_service = JobService(storage=storage, policy=policy, artifact_service=art_service, execution_map={"stream": _exec})
+    job = job_service.execute("stream", {"document_id": "d"}, {})
+
+    assert job.output_ref["byte_size"] == 15
+    assert storage.get_bytes(job.output_ref["storage_key"]) == b"a" * 10 + b"b" * 5
+    assert list((tmp_path / ".tmp").iterdir()) == []
+
+
+def test_operations_sharing_params_get_distinct_cached_artifacts(tmp_path):
+    from storage.cas import BlobStore
+    from storage.catalog import InMemoryCatalog
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    catalog = InMemoryCatalog()
+    art_service = ArtifactService(storage=storage, policy=policy, catalog=catalog, blob_store=BlobStore(storage, catalog))
+    calls = []
+
+    def _make(out):
+        def _exec(payload):
+            calls.append(out)
+            return out, {"kind": "pdf", "media_type": "application/pdf", "manifest": {}}
+
+        return _exec
+
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=art_service,
+        execution_map={"pdf.remove": _make(b"two pages"), "pdf.extract": _make(b"one page")},
+        result_cache=JobResultCache(storage, catalog=catalog),
+        provider_signature=lambda op: {"engine": "v1"},
+    )
+
+    removed = job_service.execute("pdf.remove", {"document_id": "d"}, {"pages": [1]})
+    extracted = job_service.execute("pdf.extract", {"document_id": "d"}, {"pages": [1]})
+    again = job_service.execute("pdf.remove", {"document_id": "d"}, {"pages": [1]})
+
+    assert removed.output_ref["artifact_id"] != extracted.output_ref["artifact_id"]
+    assert again.output_ref == removed.output_ref
+    assert storage.get_bytes(again.output_ref["storage_key"]) == b"two pages"
+    assert calls == [b"two pages", b"one page"]
+
+
+def test_job_result_cache_rejects_records_the_catalog_has_superseded(tmp_path):
+    from storage.catalog import InMemoryCatalog
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    catalog = InMemoryCatalog()
+    art_service = ArtifactService(storage=storage, policy=policy, catalog=catalog)
+    result_cache = JobResultCache(storage, catalog=catalog)
+    calls = []
+
+    def _exec(payload):
+        calls.append(1)
+        return b"out", {"kind": "bin", "media_type": "application/octet-stream", "manifest": {}}
+
+    job_service = JobService(
+        storage=storage,
+        policy=policy,
+        artifact_service=art_service,
+        execution_map={"echo": _exec},
+        result_cache=result_cache,
+        provider_signature=lambda op: {"engine": "v1"},
+    )
+
+    job = job_service.execute("echo", {"document_id": "d"}, {})
+    stale = art_service.get(job.output_ref["artifact_id"])
+    art_service.replace(stale, b"different")
+    job_service.execute("echo", {"document_id": "d"}, {})
+
+    assert len(calls) == 2
\ No newline at end of file
@@ -0,0 +1,21 @@
+import pytest
+
+from execution.page_pool import PagePool, chunk_pages
+
+
+def test_chunk_pages_keeps_order_and_balances():
+    assert chunk_pages([1, 2, 3, 4, 5], 2) == [[1, 2, 3], [4, 5]]
+    assert chunk_pages([1, 2], 4) == [[1], [2]]
+    assert chunk_pages([], 3) == []
+
+    with pytest.raises(ValueError):
+        chunk_pages([1], 0)
+
+
+def test_page_pool_plan_respects_threshold():
+    pool = PagePool(max_workers=4)
+    pages = list(range(1, 21))
+
+    assert pool.plan(pages, min_parallel_pages=16) == [pages]
+    assert pool.plan(pages, min_parallel_pages=5) == chunk_pages(pages, 4)
+    assert [len(c) for c in pool.plan(pages, min_parallel_pages=8)] == [10, 10]
\ No newline at end of file
@@ -0,0 +1,441 @@
+import pytest
+
+from core.capability_contract import Capability, CapabilityStatus
+from core.capability_registry import CapabilityRegistry, build_registry
+from core.execution_policy import ExecutionPolicy
+from execution.pdf.extract import make_pdf_extract_execution
+from execution.pdf.merge import make_pdf_merge_execution
+from execution.pdf.preview import make_pdf_preview_execution
+from services.document_service import DocumentService
+from storage.local_fs import LocalFSStorage
+
+
+fitz = pytest.importorskip("fitz")
+
+
+def _pdf_bytes(pages=2):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"page {i + 1}")
+    data = doc.write()
+    doc.close()
+    return data
+
+
+def _documents(tmp_path):
+    storage = LocalFSStorage(tmp_path)
+    registry = build_registry()
+    return DocumentService(storage=storage, policy=ExecutionPolicy(registry)), registry
+
+
+def _page_count(data):
+    doc = fitz.open(stream=data, filetype="pdf")
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
+
+
+def test_load_view_is_read_only_mmap(tmp_path):
+    documents, _ = _documents(tmp_path)
+    data = _pdf_bytes()
+    doc = documents.ingest(data, ingest_index=0)
+
+    view = documents.load_view(doc)
+
+    assert view.readonly
+    assert view.tobytes() == data
+    assert documents.local_path(doc).read_bytes() == data
+
+
+def test_executors_open_documents_without_loading_bytes(tmp_path, monkeypatch):
+    documents, registry = _documents(tmp_path)
+    a = documents.ingest(_pdf_bytes(3), ingest_index=0)
+    b = documents.ingest(_pdf_bytes(2), ingest_index=1)
+    monkeypatch.setattr(documents, "load_bytes", lambda rec: pytest.fail("document bytes were copied"))
+
+    png, _ = make_pdf_preview_execution(documents, registry=registry)(
+        {"input_ref": {}, "params": {"document_id": a.document_id, "page": 3}}
+    )
+    extracted, _ = make_pdf_extract_execution(documents, registry=registry)(
+        {"input_ref": {"document_id": a.document_id}, "params": {"pages": [3, 1]}}
+    )
+    merged, _ = make_pdf_merge_execution(documents, registry=registry)(
+        {"input_ref": {"documents": [a.document_id, b.document_id]}, "params": {}}
+    )
+
+    assert png.startswith(b"\x89PNG")
+    assert _page_count(extracted) == 2
+    assert _page_count(merged) == 5
+
+
+def test_executors_fall_back_to_mapped_view(tmp_path, monkeypatch):
+    documents, registry = _documents(tmp_path)
+    a = documents.ingest(_pdf_bytes(3), ingest_index=0)
+    monkeypatch.setattr(documents, "local_path", lambda rec: None)
+
+    extracted, _ = make_pdf_extract_execution(documents, registry=registry)(
+        {"input_ref": {"document_id": a.document_id}, "params": {"pages": [2]}}
+    )
+
+    assert _page_count(extracted) == 1
+
+
+def test_repeated_previews_parse_document_once(tmp_path, monkeypatch):
+    import execution.pdf.document_source as document_source
+    from execution.pdf.document_cache import DocumentCache
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(3), ingest_index=0)
+    opens = []
+    real_open = document_source.open_fitz_document
+
+    def _counting_open(docs, rec):
+        opens.append(rec.document_id)
+        return real_open(docs, rec)
+
+    monkeypatch.setattr(document_source, "open_fitz_document", _counting_open)
+    preview = make_pdf_preview_execution(documents, registry=registry, document_cache=DocumentCache())
+
+    for page in (1, 2, 3, 1):
+        png, _ = preview({"input_ref": {}, "params": {"document_id": doc.document_id, "page": page}})
+        assert png.startswith(b"\x89PNG")
+
+    assert opens == [doc.document_id]
+
+
+def _zip_entries(data):
+    import io
+    import zipfile
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def test_preview_batch_renders_pages_into_zip(tmp_path):
+    from execution.page_pool import PagePool
+    from execution.pdf.preview_batch import make_pdf_preview_batch_execution
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(4), ingest_index=0)
+    pool = PagePool(max_workers=2)
+    try:
+        inline = make_pdf_preview_batch_execution(documents, registry=registry, page_pool=pool, min_parallel_pages=100)
+        parallel = make_pdf_preview_batch_execution(documents, registry=registry, page_pool=pool, min_parallel_pages=1)
+
+        by_list, meta = inline({"input_ref": {}, "params": {"document_id": doc.document_id, "pages": [4, 2, 2]}})
+        by_range, _ = inline({"input_ref": {}, "params": {"document_id": doc.document_id, "page_range": [1, 4]}})
+        fanned_out, _ = parallel({"input_ref": {}, "params": {"document_id": doc.document_id, "page_range": [1, 4]}})
+    finally:
+        pool.shutdown()
+
+    assert meta["media_type"] == "application/zip"
+    assert meta["manifest"]["pages"] == [2, 4]
+    assert sorted(_zip_entries(by_list)) == ["page_0002.png", "page_0004.png"]
+    entries = _zip_entries(by_range)
+    assert sorted(entries) == [f"page_000{i}.png" for i in range(1, 5)]
+    assert all(v.startswith(b"\x89PNG") for v in entries.values())
+    assert fanned_out == by_range
+
+
+def test_preview_batch_validates_pages(tmp_path):
+    from execution.pdf.preview_batch import make_pdf_preview_batch_execution
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(2), ingest_index=0)
+    batch = make_pdf_preview_batch_execution(documents, registry=registry)
+
+    for params in (
+        {"document_id": doc.document_id},
+        {"document_id": doc.document_id, "pages": [1], "page_range": [1, 2]},
+        {"document_id": doc.document_id, "page_range": [2, 1]},
+        {"document_id": doc.document_id, "pages": [3]},
+    ):
+        with pytest.raises(ValueError):
+            batch({"input_ref": {}, "params": params})
+
+
+def test_preview_sizes_and_formats(tmp_path):
+    pytest.importorskip("PIL")
+    from PIL import Image
+    import io
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(1), ingest_index=0)
+    preview = make_pdf_preview_execution(documents, registry=registry)
+
+    thumb, meta = preview({"input_ref": {}, "params": {"document_id": doc.document_id, "page": 1, "width": 256, "format": "webp"}})
+    assert meta["media_type"] == "image/webp"
+    assert meta["manifest"]["quality"] == 80
+    assert Image.open(io.BytesIO(thumb)).size[0] == 256
+
+    jpeg, meta = preview({"input_ref": {}, "params": {"document_id": doc.document_id, "page": 1, "dpi": 72, "format": "jpeg", "quality": 60}})
+    assert meta["media_type"] == "image/jpeg"
+    assert jpeg.startswith(b"\xff\xd8")
+
+    for params in ({"dpi": 151}, {"width": 300}, {"dpi": 72, "width": 256}, {"format": "gif"}, {"format": "png", "quality": 50}, {"format": "jpeg", "quality": 0}):
+        with pytest.raises(ValueError):
+            preview({"input_ref": {}, "params": {"document_id": doc.document_id, "page": 1, **params}})
+
+
+def test_lossy_formats_require_the_pillow_encoder(tmp_path):
+    documents, registry = _documents(tmp_path)
+    caps = registry.all()
+    caps["image_encoder.pillow"] = Capability(name="image_encoder.pillow", status=CapabilityStatus.DEGRADED, providers=[])
+    preview = make_pdf_preview_execution(documents, registry=CapabilityRegistry(caps))
+    doc = documents.ingest(_pdf_bytes(1), ingest_index=0)
+
+    png, _ = preview({"input_ref": {}, "params": {"document_id": doc.document_id, "page": 1, "dpi": 72}})
+    assert png.startswith(b"\x89PNG")
+    for fmt in ("jpeg", "webp"):
+        with pytest.raises(ValueError, match="pillow_required_for_image_format"):
+            preview({"input_ref": {}, "params": {"document_id": doc.document_id, "page": 1, "format": fmt}})
+
+
+def test_render_cache_serves_repeated_previews(tmp_path, monkeypatch):
+    import execution.pdf.preview as preview_module
+    import execution.pdf.preview_batch as batch_module
+    from execution.pdf.preview_batch import make_pdf_preview_batch_execution
+    from execution.pdf.render_cache import RenderCache
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(3), ingest_index=0)
+    cache = RenderCache(documents.storage)
+    preview = make_pdf_preview_execution(documents, registry=registry, render_cache=cache)
+    batch = make_pdf_preview_batch_execution(documents, registry=registry, render_cache=cache, min_parallel_pages=100)
+    params = {"document_id": doc.document_id, "page": 2, "dpi": 72}
+
+    first, meta = preview({"input_ref": {}, "params": params})
+    renderer = f"pymupdf-{meta['manifest']['provider_version']}"
+    assert cache.get(doc.content_sha256, 2, preview_module.render_options(params), renderer) == first
+    assert cache.get(doc.content_sha256, 2, preview_module.render_options(params), "pymupdf-0.0.0") is None
+
+    rendered = []
+    real_render = batch_module.render_page
+
+    def _counting_render(pdf, page, options):
+        rendered.append(page)
+        return real_render(pdf, page, options)
+
+    monkeypatch.setattr(preview_module, "render_page", _counting_render)
+    monkeypatch.setattr(batch_module, "render_page", _counting_render)
+
+    again, _ = preview({"input_ref": {}, "params": params})
+    zipped, _ = batch({"input_ref": {}, "params": {"document_id": doc.document_id, "page_range": [1, 3], "dpi": 72}})
+
+    assert again == first
+    assert rendered == [1, 3]
+    assert _zip_entries(zipped)["page_0002.png"] == first
+
+
+def test_page_runs_coalesce_contiguous_pages():
+    from execution.pdf.page_runs import page_runs
+
+    assert page_runs([]) == []
+    assert page_runs([0, 1, 2, 4, 5, 9]) == [(0, 2), (4, 5), (9, 9)]
+    assert page_runs([5, 4, 3, 0, 1, 1]) == [(5, 3), (0, 1), (1, 1)]
+
+
+def test_page_runs_copy_shared_resources_once():
+    from execution.pdf.page_runs import insert_page_runs
+
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+    pix.clear_with(200)
+    doc = fitz.open()
+    xref = 0
+    for _ in range(6):
+        page = doc.new_page()
+        if xref == 0:
+            xref = page.insert_image(fitz.Rect(0, 0, 50, 50), stream=pix.tobytes("png"))
+        else:
+            page.insert_image(fitz.Rect(0, 0, 50, 50), xref=xref)
+    src = fitz.open(stream=doc.write(), filetype="pdf")
+
+    out = fitz.open()
+    assert insert_page_runs(out, src, [0, 2, 4]) == 3
+    written = fitz.open(stream=out.write(), filetype="pdf")
+    images = [x for x in range(1, written.xref_length()) if written.xref_get_key(x, "Subtype") == ("name", "/Image")]
+    assert written.page_count == 3
+    assert len(images) == 1
+
+
+def test_page_edits_keep_requested_order(tmp_path):
+    from execution.pdf.remove import make_pdf_remove_execution
+    from execution.pdf.reorder import make_pdf_reorder_execution
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(6), ingest_index=0)
+    ref = {"document_id": doc.document_id}
+
+    def _texts(data):
+        out = fitz.open(stream=data, filetype="pdf")
+        try:
+            return [p.get_text().strip() for p in out]
+        finally:
+            out.close()
+
+    reordered, _ = make_pdf_reorder_execution(documents, registry=registry)({"input_ref": ref, "params": {"pages": [6, 5, 4, 1, 2, 2]}})
+    removed, _ = make_pdf_remove_execution(documents, registry=registry)({"input_ref": ref, "params": {"pages": [3]}})
+    extracted, _ = make_pdf_extract_execution(documents, registry=registry)({"input_ref": ref, "params": {"pages": [2, 3, 4]}})
+
+    assert _texts(reordered) == ["page 6", "page 5", "page 4", "page 1", "page 2", "page 2"]
+    assert _texts(removed) == ["page 1", "page 2", "page 4", "page 5", "page 6"]
+    assert _texts(extracted) == ["page 2", "page 3", "page 4"]
+
+
+def test_canonicalize_modes_are_recorded(tmp_path):
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_pdf_bytes(3), ingest_index=0)
+    extract = make_pdf_extract_execution(documents, registry=registry)
+    ref = {"document_id": doc.document_id}
+
+    _, off = extract({"input_ref": ref, "params": {"pages": [1, 2], "canonicalize": "off"}})
+    _, deferred = extract({"input_ref": ref, "params": {"pages": [1, 2], "canonicalize": "deferred"}})
+    _, sync = extract({"input_ref": ref, "params": {"pages": [1, 2]}})
+
+    assert off["manifest"]["canonicalize"] == "off"
+    assert off["manifest"]["canonicalization"] == {"canonicalized": False, "degraded": False, "pending": False}
+    assert deferred["manifest"]["canonicalization"]["pending"] is True
+    assert sync["manifest"]["canonicalize"] == "sync"
+    assert "pending" not in sync["manifest"]["canonicalization"]
+
+    with pytest.raises(ValueError):
+        extract({"input_ref": ref, "params": {"pages": [1], "canonicalize": "later"}})
+
+
+def test_streaming_merge_writes_spool_without_buffering(tmp_path):
+    pytest.importorskip("pikepdf")
+    from execution.pdf.merge_stream import stream_merge
+    from storage.adapter import Spool
+
+    documents, registry = _documents(tmp_path)
+    docs = [documents.ingest(_pdf_bytes(n), ingest_index=i) for i, n in enumerate((2, 3, 1))]
+    merge = make_pdf_merge_execution(documents, registry=registry)
+    ref = {"documents": [d.document_id for d in docs]}
+
+    spool, meta = merge({"input_ref": ref, "params": {"streaming": True}})
+    again, canonicalization = stream_merge(documents, docs, "sync", registry=registry)
+    assert isinstance(spool, Spool)
+    assert meta["manifest"]["streaming"] is True
+    assert meta["manifest"]["canonicalize"] == "sync"
+    assert meta["manifest"]["canonicalization"] == canonicalization
+    assert canonicalization["canonicalized"] is True
+    assert canonicalization["canonicalizer"]["provider_version"]
+
+    spool.commit("out/merged.pdf")
+    again.commit("out/again.pdf")
+    merged = documents.storage.get_bytes("out/merged.pdf")
+    assert merged == documents.storage.get_bytes("out/again.pdf")
+    assert _page_count(merged) == 6
+    assert list((tmp_path / ".tmp").iterdir()) == []
+
+    with pytest.raises(ValueError):
+        merge({"input_ref": ref, "params": {"streaming": True, "canonicalize": "deferred"}})
+
+
+def test_streaming_merge_matches_buffered_merge_and_uses_cache(tmp_path):
+    pytest.importorskip("pikepdf")
+    from execution.pdf.canonicalize_cache import CanonicalizeCache
+
+    documents, registry = _documents(tmp_path)
+    docs = [documents.ingest(_pdf_bytes(n), ingest_index=i) for i, n in enumerate((2, 3, 1))]
+    cache = CanonicalizeCache(documents.storage)
+    merge = make_pdf_merge_execution(documents, registry=registry, canonicalize_cache=cache)
+    ref = {"documents": [d.document_id for d in docs]}
+
+    buffered, buffered_meta = merge({"input_ref": ref, "params": {"streaming": False}})
+    for name in ("first", "second"):
+        spool, meta = merge({"input_ref": ref, "params": {"streaming": True}})
+        spool.commit(f"out/{name}.pdf")
+        assert documents.storage.get_bytes(f"out/{name}.pdf") == buffered
+        assert meta["manifest"]["canonicalization"] == buffered_meta["manifest"]["canonicalization"]
+
+    assert cache.stats()["hits"] == 1
+
+
+def _table_pdf_bytes(pages):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        for t in range(1 + i % 2):
+            top = 100 + t * 250
+            for r in range(4):
+                page.draw_line((72, top + r * 30), (372, top + r * 30))
+            for c in range(4):
+                page.draw_line((72 + c * 100, top), (72 + c * 100, top + 90))
+            for r in range(3):
+                for c in range(3):
+                    page.insert_text((80 + c * 100, top + 20 + r * 30), f"p{i + 1}t{t}r{r}c{c}")
+    data = doc.write()
+    doc.close()
+    return data
+
+
+def test_table_detection_parallel_matches_serial(tmp_path):
+    pytest.importorskip("pdfplumber")
+    from execution.page_pool import PagePool
+    from execution.tables.detect import make_tables_detect_execution
+
+    documents, registry = _documents(tmp_path)
+    doc = documents.ingest(_table_pdf_bytes(6), ingest_index=0)
+    pool = PagePool(max_workers=3)
+    try:
+        serial = make_tables_detect_execution(documents, registry=registry, page_pool=pool, min_parallel_pages=100)
+        parallel = make_tables_detect_execution(documents, registry=registry, page_pool=pool, min_parallel_pages=1)
+        payload = {"input_ref": {}, "params": {"document_id": doc.document_id}}
+
+        serial_out, serial_meta = serial(payload)
+        parallel_out, parallel_meta = parallel(payload)
+    finally:
+        pool.shutdown()
+
+    assert serial_meta["manifest"]["table_count"] == 9
+    assert parallel_out == serial_out
+    assert parallel_meta == serial_meta
+
+def test_camelot_table_detection_fans_out_in_page_order(tmp_path, monkeypatch):
+    import json
+    import sys
+    import types
+
+    import execution.tables.detect as detect
+    from core.capability_contract import Capability, CapabilityStatus
+    from core.capability_registry import CapabilityRegistry
+    from execution.page_pool import PagePool
+    from execution.tables.detect import make_tables_detect_execution
+
+    class _InlinePool(PagePool):
+        def map(self, fn, calls):
+            return [fn(*args) for args in calls]
+
+    def _fake_camelot(path, pages_arg):
+        pages = list(range(1, 7)) if pages_arg == "all" else [int(x) for x in pages_arg.split(",")]
+        return [(page, [0.0, 0.0, 1.0, 1.0], [[f"p{page}t{t}"]], None) for page in pages for t in range(2)]
+
+    counted = []
+    monkeypatch.setitem(sys.modules, "camelot", types.ModuleType("camelot"))
+    monkeypatch.setattr(detect, "detect_camelot_pages_from_path", _fake_camelot)
+    monkeypatch.setattr(detect, "_pdf_page_count", lambda path: counted.append(path) or 6)
+
+    documents, _ = _documents(tmp_path)
+    caps = build_registry().all()
+    caps["table_engine.camelot"] = Capability(
+        name="table_engine.camelot", status=CapabilityStatus.AVAILABLE, providers=["camelot"]
+    )
+    registry = CapabilityRegistry(caps)
+    doc = documents.ingest(_table_pdf_bytes(6), ingest_index=0)
+    params = {"document_id": doc.document_id, "pages": [5, 1, 3, 1, 6, 2]}
+
+    serial = make_tables_detect_execution(documents, registry=registry, page_pool=_InlinePool(max_workers=1))
+    parallel = make_tables_detect_execution(
+        documents, registry=registry, page_pool=_InlinePool(max_workers=3), min_parallel_pages=1
+    )
+    serial_out, _ = serial({"input_ref": {}, "params": params})
+    parallel_out, _ = parallel({"input_ref": {}, "params": params})
+    serial({"input_ref": {}, "params": {"document_id": doc.document_id}})
+
+    tables = json.loads(parallel_out)["tables"]
+    assert parallel_out == serial_out
+    assert [(t["page"], t["table_index"]) for t in tables][:4] == [(1, 1), (1, 2), (2, 3), (2, 4)]
+    assert counted == []
\ No newline at end of file
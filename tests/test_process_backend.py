@@ -0,0 +1,106 @@
+import pytest
+
+from core.capability_contract import Capability, CapabilityStatus
+from core.capability_registry import CachedCapabilityRegistry, CapabilityRegistry, build_registry
+from core.execution_policy import ExecutionPolicy
+from services.artifact_service import ArtifactService
+from services.document_service import DocumentService
+from services.job_service import JobService
+from services.process_backend import (
+    ProcessPoolBackend,
+    _registry_config,
+    _worker_registry,
+    referenced_document_ids,
+)
+from storage.local_fs import LocalFSStorage
+
+
+fitz = pytest.importorskip("fitz")
+
+
+def _pdf_bytes(pages=2):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"page {i + 1}")
+    data = doc.write()
+    doc.close()
+    return data
+
+
+def test_referenced_document_ids():
+    payload = {
+        "input_ref": {"documents": ["b", "a"], "document_id": "c"},
+        "params": {"document_id": "a"},
+    }
+
+    assert referenced_document_ids(payload) == ["a", "b", "c"]
+
+
+def test_process_backend_runs_operation_in_worker(tmp_path):
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(build_registry())
+    documents = DocumentService(storage=storage, policy=policy)
+    doc = documents.ingest(_pdf_bytes(), ingest_index=0)
+
+    backend = ProcessPoolBackend(documents, max_workers=1)
+    try:
+        job_service = JobService(
+            policy=policy,
+            documents=documents,
+            artifacts=ArtifactService(storage=storage, policy=policy),
+            execution_map={"pdf.preview": lambda payload: pytest.fail("ran in parent")},
+            backend=backend,
+        )
+
+        job = job_service.execute("pdf.preview", {}, {"document_id": doc.document_id, "page": 2})
+    finally:
+        backend.shutdown()
+
+    assert job.status.value == "COMPLETED"
+    assert job.output_ref["media_type"] == "image/png"
+    assert storage.get_bytes(job.output_ref["storage_key"]).startswith(b"\x89PNG")
+
+
+def test_process_backend_workers_use_the_app_registry(tmp_path):
+    caps = build_registry().all()
+    for name in ("canonicalizer.qpdf", "canonicalizer.mutool", "canonicalizer.pikepdf"):
+        caps[name] = Capability(name=name, status=CapabilityStatus.DEGRADED, providers=[])
+    registry = CapabilityRegistry(caps)
+
+    storage = LocalFSStorage(tmp_path)
+    policy = ExecutionPolicy(registry)
+    documents = DocumentService(storage=storage, policy=policy)
+    artifacts = ArtifactService(storage=storage, policy=policy)
+    doc = documents.ingest(_pdf_bytes(3), ingest_index=0)
+
+    backend = ProcessPoolBackend(documents, max_workers=1, registry=registry)
+    try:
+        job_service = JobService(
+            policy=policy,
+            documents=documents,
+            artifacts=artifacts,
+            execution_map={"pdf.extract": lambda payload: pytest.fail("ran in parent")},
+            backend=backend,
+        )
+        job = job_service.execute("pdf.extract", {"document_id": doc.document_id}, {"pages": [1, 2]})
+    finally:
+        backend.shutdown()
+
+    manifest = artifacts.get(job.output_ref["artifact_id"]).manifest
+    assert manifest["canonicalization"]["degradation"]["reason"] == "no_canonicalizer_capability"
+
+
+def test_cached_registry_config_keeps_ttl():
+    config = _registry_config(CachedCapabilityRegistry(ttl_seconds=12.0))
+
+    assert _worker_registry(config).ttl_seconds == 12.0
+    assert _worker_registry(None) is not None
+
+
+def test_process_backend_requires_local_storage():
+    class _Docs:
+        storage = object()
+
+    with pytest.raises(ValueError):
+        ProcessPoolBackend(_Docs())
\ No newline at end of file
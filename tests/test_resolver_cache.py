@@ -0,0 +1,38 @@
+from core.capability_registry import build_registry
+from core.resolver_cache import ResolverCache
+
+
+def test_resolver_cache_hits_within_snapshot():
+    cache = ResolverCache()
+    snapshot = build_registry()
+    calls = []
+
+    def compute(reg):
+        calls.append(1)
+        return {"provider": "x"}
+
+    r1 = cache.resolve("op", snapshot, compute)
+    r2 = cache.resolve("op", snapshot, compute)
+
+    assert r1 == r2 == {"provider": "x"}
+    assert len(calls) == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert list(stats.keys()) == sorted(stats.keys())
+
+
+def test_resolver_cache_invalidated_on_new_snapshot():
+    cache = ResolverCache()
+    calls = []
+
+    def compute(reg):
+        calls.append(1)
+        return {"provider": "x"}
+
+    cache.resolve("op", build_registry(), compute)
+    cache.resolve("op", build_registry(), compute)
+
+    assert len(calls) == 2
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from services.single_flight import FileLockSingleFlight, SingleFlight
+
+
+def _run_concurrently(targets):
+    results = [None] * len(targets)
+
+    def _wrap(i, fn):
+        results[i] = fn()
+
+    threads = [threading.Thread(target=_wrap, args=(i, fn)) for i, fn in enumerate(targets)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_single_flight_shares_one_execution():
+    sf = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def work():
+        calls.append(1)
+        started.set()
+        deadline = time.monotonic() + 10
+        while sf.waiters("k") < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return object()
+
+    def leader():
+        return sf.do("k", work)
+
+    def follower():
+        started.wait()
+        return sf.do("k", work)
+
+    results = _run_concurrently([leader, follower, follower])
+
+    assert len(calls) == 1
+    assert results[0] is results[1] is results[2]
+    assert not sf.in_flight("k")
+    assert sf.waiters("k") == 0
+
+
+def test_single_flight_propagates_errors():
+    sf = SingleFlight()
+
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        sf.do("k", boom)
+
+    assert sf.do("k", lambda: 1) == 1
+
+
+def test_file_lock_single_flight_serializes_across_instances(tmp_path):
+    first = FileLockSingleFlight(tmp_path)
+    second = FileLockSingleFlight(tmp_path)
+    active = []
+    overlaps = []
+
+    def work():
+        active.append(1)
+        if len(active) > 1:
+            overlaps.append(1)
+        time.sleep(0.05)
+        active.pop()
+        return True
+
+    _run_concurrently([lambda: first.do("job", work), lambda: second.do("job", work)])
+
+    assert overlaps == []
+
+
+def test_file_lock_single_flight_rejects_unsafe_key(tmp_path):
+    sf = FileLockSingleFlight(tmp_path)
+
+    with pytest.raises(ValueError):
+        sf.do("../escape", lambda: 1)
+
+
+def test_file_lock_single_flight_reuses_lock_stripes(tmp_path):
+    sf = FileLockSingleFlight(tmp_path, stripes=4)
+
+    for i in range(50):
+        assert sf.do(f"job-{i}", lambda: i) == i
+
+    assert 0 < len(list((tmp_path / ".locks").iterdir())) <= 4
\ No newline at end of file
@@ -62,4 +62,239 @@ def test_no_path_traversal(tmp_path: Path):
     storage = LocalFSStorage(tmp_path)
 
     with pytest.raises(ValueError):
-        storage.read_bytes("../outside.pdf")
\ No newline at end of file
+        storage.read_bytes("../outside.pdf")
+
+
+def test_spool_commit_and_hash(tmp_path: Path):
+    import hashlib
+
+    storage = LocalFSStorage(tmp_path)
+
+    with storage.open_spool() as spool:
+        spool.write(b"hel")
+        spool.write(b"lo")
+        assert spool.size == 5
+        assert spool.sha256 == hashlib.sha256(b"hello").hexdigest()
+        spool.commit("documents/spooled.pdf")
+
+    assert storage.read_bytes("documents/spooled.pdf") == b"hello"
+    assert not spool.path.exists()
+
+
+def test_spool_collision_raises(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("documents/test.pdf", b"hello")
+
+    with storage.open_spool() as spool:
+        spool.write(b"different")
+        with pytest.raises(StorageCollisionError):
+            spool.commit("documents/test.pdf")
+
+    assert storage.read_bytes("documents/test.pdf") == b"hello"
+    assert not spool.path.exists()
+
+
+def test_local_path_and_open_read(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("artifacts/a.bin", b"payload")
+
+    assert storage.local_path("artifacts/a.bin").read_bytes() == b"payload"
+    with storage.open_read("artifacts/a.bin") as fh:
+        assert fh.read() == b"payload"
+
+    with pytest.raises(FileNotFoundError):
+        storage.local_path("artifacts/missing.bin")
+
+
+def test_delete_removes_object_and_ignores_missing(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("artifacts/a.bin", b"payload")
+
+    storage.delete("artifacts/a.bin")
+    storage.delete("artifacts/a.bin")
+
+    assert not storage.exists("artifacts/a.bin")
+
+
+def test_idempotent_put_uses_sidecar_digest(tmp_path: Path, monkeypatch):
+    import storage.local_fs as local_fs
+
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("artifacts/a.bin", b"payload")
+
+    def _no_rehash(p):
+        raise AssertionError("existing object was re-read")
+
+    monkeypatch.setattr(local_fs, "_file_sha256", _no_rehash)
+
+    storage.write_bytes("artifacts/a.bin", b"payload")
+    with pytest.raises(StorageCollisionError):
+        storage.write_bytes("artifacts/a.bin", b"payloaD")
+    with pytest.raises(StorageCollisionError):
+        storage.write_bytes("artifacts/a.bin", b"longer payload")
+
+
+def test_stale_sidecar_digest_is_recomputed(tmp_path: Path):
+    import os
+
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("artifacts/a.bin", b"payload")
+
+    p = storage.local_path("artifacts/a.bin")
+    p.write_bytes(b"PAYLOAD")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    storage.write_bytes("artifacts/a.bin", b"PAYLOAD")
+    with pytest.raises(StorageCollisionError):
+        storage.write_bytes("artifacts/a.bin", b"payload")
+
+
+def test_list_keys_hides_internal_directories(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("documents/a.pdf", b"1")
+    with storage.open_spool() as spool:
+        spool.write(b"2")
+        spool.commit("documents/b.pdf")
+
+    assert storage.list_keys("") == ["documents/a.pdf", "documents/b.pdf"]
+
+
+def test_sharded_layout_is_transparent(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path, layout="sharded")
+    name = "abcdef0123456789"
+
+    storage.write_bytes(f"documents/{name}", b"doc")
+    storage.write_bytes("documents/x", b"short")
+
+    assert (tmp_path / "documents" / "ab" / "cd" / name).is_file()
+    assert storage.read_bytes(f"documents/{name}") == b"doc"
+    assert storage.exists(f"documents/{name}")
+    assert storage.list_keys("documents") == [f"documents/{name}", "documents/x"]
+    assert LocalFSStorage(tmp_path).layout == "sharded"
+
+    with pytest.raises(ValueError):
+        LocalFSStorage(tmp_path, layout="flat")
+
+
+def test_sharded_layout_refuses_unmigrated_root(tmp_path: Path):
+    LocalFSStorage(tmp_path).write_bytes("documents/abcdef", b"1")
+
+    with pytest.raises(ValueError):
+        LocalFSStorage(tmp_path, layout="sharded")
+
+
+def test_migrate_layout_roundtrip(tmp_path: Path):
+    from storage.migrate_layout import main, migrate_layout
+
+    flat = LocalFSStorage(tmp_path)
+    keys = ["artifacts/0123abcd.bin", "blobs/sha256/ffee0011", "documents/abc"]
+    for i, key in enumerate(keys):
+        flat.write_bytes(key, str(i).encode())
+
+    assert main([str(tmp_path), "--to", "sharded"]) == 0
+    sharded = LocalFSStorage(tmp_path)
+    assert sharded.layout == "sharded"
+    assert sharded.list_keys("") == keys
+    assert (tmp_path / "blobs" / "sha256" / "ff" / "ee" / "ffee0011").is_file()
+    sharded.write_bytes("artifacts/0123abcd.bin", b"0")
+
+    assert migrate_layout(tmp_path, "flat") == 2
+    restored = LocalFSStorage(tmp_path)
+    assert restored.layout == "flat"
+    assert [restored.read_bytes(k) for k in keys] == [b"0", b"1", b"2"]
+    assert not (tmp_path / "blobs" / "sha256" / "ff").exists()
+
+
+def test_sharded_layout_keeps_two_character_names_addressable(tmp_path: Path):
+    from storage.migrate_layout import migrate_layout
+
+    flat = LocalFSStorage(tmp_path)
+    flat.write_bytes("documents/ab", b"short")
+    flat.write_bytes("documents/abcdef", b"long")
+
+    assert migrate_layout(tmp_path, "sharded") == 2
+    sharded = LocalFSStorage(tmp_path)
+    assert (tmp_path / "documents" / "ab~").is_file()
+    assert sharded.read_bytes("documents/ab") == b"short"
+    assert sharded.list_keys("documents") == ["documents/ab", "documents/abcdef"]
+
+    (tmp_path / "documents" / "cd").write_bytes(b"legacy")
+    assert sharded.read_bytes("documents/cd") == b"legacy"
+    sharded.write_bytes("documents/cd", b"updated", overwrite=True)
+    assert (tmp_path / "documents" / "cd").read_bytes() == b"updated"
+    assert not (tmp_path / "documents" / "cd~").exists()
+
+    assert migrate_layout(tmp_path, "flat") == 2
+    assert LocalFSStorage(tmp_path).list_keys("documents") == ["documents/ab", "documents/abcdef", "documents/cd"]
+
+
+@pytest.mark.parametrize("layout", ["flat", "sharded"])
+def test_iter_keys_pages_in_key_order(tmp_path: Path, layout: str):
+    storage = LocalFSStorage(tmp_path, layout=layout)
+    keys = [
+        "artifacts/ab",
+        "artifacts/ab~",
+        "artifacts/abcd.bin",
+        "artifacts/abcd/nested.bin",
+        "artifacts/abcz-",
+        "artifacts/ab_x",
+        "artifacts/abce",
+        "documents/0000",
+        "documents/a.b",
+    ]
+    for key in keys:
+        storage.write_bytes(key, key.encode())
+    expected = sorted(keys)
+
+    it = storage.iter_keys()
+    assert next(it) == expected[0]
+
+    pages = []
+    cursor = None
+    while True:
+        page = list(storage.iter_keys("", start_after=cursor, limit=3))
+        if not page:
+            break
+        pages.append(page)
+        cursor = page[-1]
+
+    assert [k for page in pages for k in page] == expected
+    assert list(storage.iter_keys("artifacts", start_after="artifacts/abcd/")) == [
+        k for k in expected if k.startswith("artifacts/") and k > "artifacts/abcd/"
+    ]
+    assert list(storage.iter_keys("documents/a.b")) == ["documents/a.b"]
+
+
+def test_open_mmap_returns_read_only_view(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path)
+    storage.write_bytes("documents/a.pdf", b"mapped bytes")
+    storage.write_bytes("documents/empty.pdf", b"")
+
+    view = storage.open_mmap("documents/a.pdf")
+
+    assert view.readonly
+    assert bytes(view[7:]) == b"bytes"
+    assert len(storage.open_mmap("documents/empty.pdf")) == 0
+    with pytest.raises(FileNotFoundError):
+        storage.open_mmap("documents/missing.pdf")
+
+
+def test_detached_spool_can_be_adopted_and_committed(tmp_path: Path):
+    storage = LocalFSStorage(tmp_path)
+    spool = storage.open_spool()
+    spool.write(b"hello ")
+    spool.write(b"world")
+    path, sha, size = spool.detach()
+
+    adopted = storage.adopt_spool(path, sha, size)
+    assert adopted.sha256 == sha
+    assert adopted.size == 11
+    with pytest.raises(ValueError):
+        adopted.write(b"more")
+    adopted.commit("greeting.txt")
+
+    assert storage.get_bytes("greeting.txt") == b"hello world"
+    assert not Path(path).exists()
+    with pytest.raises(ValueError):
+        storage.adopt_spool(tmp_path / "greeting.txt", sha, size)
\ No newline at end of file